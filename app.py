@@ -5,8 +5,13 @@ import os
 # Add the pages directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Page imports
-from pages import player_stats, team_analysis, league_standings, match_predictions
+# Pages are imported on first navigation
+from page_registry import page_registry
+
+# Chart and table emissions can be timed as part of each page's render profile
+from instrumentation import PROFILE_EMITS, instrument_streamlit, tracer
+if PROFILE_EMITS:
+    instrument_streamlit()
 
 # Configure page
 st.set_page_config(
@@ -25,13 +30,7 @@ st.sidebar.title("Navigation")
 st.sidebar.markdown("---")
 
 # Page selection
-pages = {
-    "🏠 Home": "home",
-    "👤 Player Statistics": "player_stats",
-    "🏆 Team Analysis": "team_analysis", 
-    "📊 League Standings": "league_standings",
-    "🔮 Match Predictions": "match_predictions"
-}
+pages = {"🏠 Home": "home", **page_registry.labels()}
 
 selected_page = st.sidebar.selectbox("Select a page:", list(pages.keys()))
 
@@ -73,15 +72,39 @@ if pages[selected_page] == "home":
     """)
 
 # Route to appropriate page
-elif pages[selected_page] == "player_stats":
-    player_stats.show()
-elif pages[selected_page] == "team_analysis":
-    team_analysis.show()
-elif pages[selected_page] == "league_standings":
-    league_standings.show()
-elif pages[selected_page] == "match_predictions":
-    match_predictions.show()
+else:
+    page_registry.show(pages[selected_page])
+    
+    # Rerun the page when the background scheduler or the live event feed
+    # has changed data; the check is an in-memory counter, so sessions
+    # never poll upstream
+    from event_ingest import start_live_feed
+    from refresh_scheduler import refresh_scheduler
+    start_live_feed(on_update=refresh_scheduler.notify)
+    
+    @st.fragment(run_every=5)
+    def watch_for_updates():
+        version = refresh_scheduler.version()
+        if st.session_state.setdefault('data_version', version) != version:
+            st.session_state['data_version'] = version
+            st.rerun()
+    
+    watch_for_updates()
 
 # Footer
 st.sidebar.markdown("---")
+import_times = page_registry.import_stats()
+if import_times:
+    with st.sidebar.expander("⏱️ Page load times"):
+        for key, seconds in import_times.items():
+            st.caption(f"{key}: {seconds * 1000:.0f} ms cold import")
+# An expander's body runs even when collapsed, so the profile (and its
+# pandas import) is only built while the toggle is on
+if len(tracer) and st.sidebar.toggle("🔬 Render profile", key='show_render_profile'):
+    st.sidebar.dataframe(
+        tracer.snapshot().drop(columns='Mean_ms').round(1),
+        use_container_width=True, hide_index=True
+    )
+    if tracer.metrics_dir:
+        st.sidebar.caption(f"Exported to {tracer.metrics_dir}/spans.json and spans.prom")
 st.sidebar.markdown("Built with ❤️ using Streamlit")
\ No newline at end of file
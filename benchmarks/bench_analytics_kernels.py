@@ -0,0 +1,78 @@
+"""
+Per-team scalar analytics vs the batch kernels in analytics_kernels.
+
+Reproduces the original Team Analysis helpers (form points from a W/D/L
+list, np.polyfit momentum, PPG season projection), called once per team,
+and compares them with one team_analytics() call over the same teams.
+
+    python benchmarks/bench_analytics_kernels.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics_kernels import team_analytics
+
+LETTERS = {3: 'W', 1: 'D', 0: 'L'}
+
+
+def calculate_form_points(recent_form):
+    return sum([3 if x == 'W' else 1 if x == 'D' else 0 for x in recent_form])
+
+
+def calculate_team_momentum(recent_form):
+    points = [3 if x == 'W' else 1 if x == 'D' else 0 for x in recent_form]
+    trend = np.polyfit(range(len(points)), points, 1)[0]
+    return ("Positive" if trend > 0 else "Negative", abs(trend))
+
+
+def generate_season_projection(current_points, games_left):
+    ppg = current_points / (38 - games_left) if games_left < 38 else 2.0
+    return int(current_points + (ppg * games_left))
+
+
+def build_teams(n, games=10, seed=0):
+    rng = np.random.default_rng(seed)
+    form = rng.choice([0, 1, 3], size=(n, games), p=[0.3, 0.25, 0.45]).astype(float)
+    played = rng.integers(1, 38, size=n)
+    points = (played * rng.uniform(0.5, 2.5, size=n)).astype(int)
+    return form, points, played
+
+
+def scalar(form, points, played):
+    rows = []
+    for team_form, team_points, team_played in zip(form, points, played):
+        letters = [LETTERS[int(p)] for p in team_form]
+        rows.append((calculate_form_points(letters), calculate_team_momentum(letters),
+                     generate_season_projection(int(team_points), 38 - int(team_played))))
+    return rows
+
+
+def measure(fn, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    print(f"{'teams':>6s} {'scalar ms':>10s} {'batch ms':>9s} {'speedup':>8s}")
+    for n in (20, 200, 1000, 5000):
+        form, points, played = build_teams(n)
+        legacy = scalar(form, points, played)
+        batch = team_analytics(form, points, played)
+        assert np.allclose([row[1][1] for row in legacy], batch['Momentum_Strength'])
+        assert [row[2] for row in legacy] == batch['Projected_Points'].tolist()
+        scalar_time = measure(lambda: scalar(form, points, played))
+        batch_time = measure(lambda: team_analytics(form, points, played), repeat=20)
+        print(f"{n:6d} {scalar_time * 1000:10.2f} {batch_time * 1000:9.2f} {scalar_time / batch_time:7.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Live event ingest: throughput, backpressure and event-to-table latency.
+
+Plays the rest of the sample Premier League season as a stream of match
+events (kickoff, goals, cards, full time). A writer thread appends them to
+a JSON-lines file, at a steady rate and then as one unthrottled burst,
+while EventIngest tails the file into the shared data through a small
+bounded queue. The same events are also applied the naive way, rebuilding
+the table and form from every result on each event, for comparison.
+
+    python benchmarks/bench_event_ingest.py
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_fetcher import SampleDataSource, SoccerDataFetcher
+from event_ingest import EventIngest, MatchEvent, tail_file
+from form_store import FormStore
+from standings_engine import StandingsEngine
+
+RATES = [200, None]  # events per second written to the feed; None = unthrottled
+
+
+def season_events(fetcher, seed=0):
+    rng = np.random.default_rng(seed)
+    events = []
+    for week, home, away in fetcher.fetch_fixtures('39')[['Matchweek', 'Home_Team', 'Away_Team']].itertuples(index=False):
+        events.append(MatchEvent('kickoff', '39', home, away, matchweek=int(week)))
+        for minute in np.sort(rng.integers(1, 95, size=rng.poisson(2.7))):
+            events.append(MatchEvent('goal', '39', home, away, team=[home, away][rng.integers(2)], minute=int(minute)))
+        for minute in np.sort(rng.integers(1, 95, size=rng.poisson(3.5))):
+            events.append(MatchEvent('card', '39', home, away, team=[home, away][rng.integers(2)], minute=int(minute)))
+        events.append(MatchEvent('full_time', '39', home, away, minute=90))
+    return events
+
+
+def write_feed(path, events, rate):
+    with open(path, 'a') as f:
+        for event in events:
+            event.emitted_at = time.time()
+            f.write(event.to_json() + '\n')
+            if rate:
+                f.flush()
+                time.sleep(1 / rate)
+
+
+async def ingest_feed(ingest, path, total):
+    task = asyncio.create_task(ingest.run(tail_file(path, poll_interval=0.005)))
+    while ingest.stats()['received'] < total:
+        await asyncio.sleep(0.01)
+    task.cancel()
+
+
+def naive(fetcher, events):
+    """Rebuild table and form from every final result on each event"""
+    results = fetcher.fetch_results('39')
+    rows = list(results[['Home_Team', 'Away_Team', 'Home_Goals', 'Away_Goals', 'Matchweek']].itertuples(index=False))
+    teams = fetcher.fetch_league_standings('39')['Team']
+    scores = {}
+    start = time.perf_counter()
+    for event in events:
+        key = (event.home, event.away)
+        score = scores.setdefault(key, [0, 0])
+        if event.type == 'goal':
+            score[event.team == event.away] += 1
+        elif event.type == 'full_time':
+            rows.append((event.home, event.away, score[0], score[1], event.matchweek or 0))
+        engine = StandingsEngine(teams)
+        form = FormStore(teams)
+        for home, away, home_goals, away_goals, week in rows:
+            engine.apply_result(home, away, home_goals, away_goals, week)
+            form.record(home, away, home_goals, away_goals)
+        engine.table()
+    return (time.perf_counter() - start) / len(events)
+
+
+def run(rate):
+    fetcher = SoccerDataFetcher(SampleDataSource(2026))
+    events = season_events(fetcher)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'events.jsonl')
+        open(path, 'w').close()
+        ingest = EventIngest(fetcher, queue_size=64)
+        ingest.league('39')  # build the live state up front, as a running feed would have
+        writer = threading.Thread(target=write_feed, args=(path, events, rate))
+        start = time.perf_counter()
+        writer.start()
+        asyncio.run(ingest_feed(ingest, path, len(events)))
+        writer.join()
+        elapsed = time.perf_counter() - start
+    assert len(fetcher.fetch_results('39')) == 380 and len(fetcher.fetch_fixtures('39')) == 0
+    return len(events), elapsed, ingest.stats()
+
+
+def main():
+    print(f"{'feed':>8s} {'events':>7s} {'events/s':>9s} {'max depth':>10s} {'stalls':>7s} "
+          f"{'p50 ms':>7s} {'p95 ms':>7s} {'max ms':>7s}")
+    for rate in RATES:
+        count, elapsed, stats = run(rate)
+        print(f"{rate or 'burst':>8} {count:7d} {count / elapsed:9.0f} {stats['max_queue_depth']:10d} "
+              f"{stats['backpressure_stalls']:7d} {stats['latency_ms_p50']:7.2f} "
+              f"{stats['latency_ms_p95']:7.2f} {stats['latency_ms_max']:7.2f}")
+    events = season_events(SoccerDataFetcher(SampleDataSource(2026)))
+    print(f"naive rebuild per event: {naive(SoccerDataFetcher(SampleDataSource(2026)), events[:200]) * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Cold vs memoized figure builds.
+
+Times every SoccerVisualizations builder on a cold cache and again on a warm
+one (the rerun case: same inputs, new figure object), then prints the cache
+counters.
+
+    python benchmarks/bench_figure_cache.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_fetcher import data_fetcher
+from visualizations import SoccerVisualizations
+
+
+def build_inputs():
+    standings = data_fetcher.fetch_league_standings()
+    goals = standings.rename(columns={'Goals_For': 'Goals For', 'Goals_Against': 'Goals Against'})
+    rng = np.random.default_rng(3)
+    players = pd.DataFrame({
+        'Player': [f'Player {i + 1}' for i in range(200)],
+        'Team': rng.choice(standings['Team'], 200),
+        'Goals': rng.poisson(6, 200),
+        'Assists': rng.poisson(4, 200),
+        'Goals per 90': rng.random(200).round(2),
+        'Shots per Game': (rng.random(200) * 4).round(1),
+        'Pass Accuracy %': (70 + rng.random(200) * 25).round(1)
+    })
+    percentiles = players[['Goals', 'Assists', 'Goals per 90', 'Pass Accuracy %']].rank(pct=True) * 100
+    percentiles.insert(0, 'Player', players['Player'])
+    history = data_fetcher.fetch_historical_data('Arsenal')
+    return [
+        ('create_league_table_chart', (standings,)),
+        ('create_goals_comparison', (goals,)),
+        ('create_player_comparison_radar', (percentiles, ['Player 1', 'Player 2', 'Player 3'])),
+        ('create_team_performance_timeline', (history,)),
+        ('create_prediction_probability_chart', ({'Home Win': 48.2, 'Draw': 25.1, 'Away Win': 26.7},)),
+        ('create_top_scorers_chart', (players,)),
+        ('create_form_guide', (['W', 'D', 'W', 'L', 'W'],))
+    ]
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    viz = SoccerVisualizations()
+    inputs = build_inputs()
+    print(f"{'builder':38s} {'cold ms':>9s} {'warm ms':>9s} {'speedup':>8s}")
+    total_cold = total_warm = 0.0
+    for name, args in inputs:
+        builder = getattr(viz, name)
+        cold = timed(lambda: (viz.clear_figure_cache(), builder(*args)), repeat=10)
+        builder(*args)
+        warm = timed(lambda: builder(*args), repeat=50)
+        total_cold += cold
+        total_warm += warm
+        print(f"{name:38s} {cold * 1000:9.2f} {warm * 1000:9.2f} {cold / warm:7.1f}x")
+    print(f"{'all builders':38s} {total_cold * 1000:9.2f} {total_warm * 1000:9.2f} {total_cold / total_warm:7.1f}x")
+    print(viz.figure_cache_stats())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Fixture index vs boolean-mask filtering of the fixture calendar.
+
+Builds calendars of growing size from the synthetic generator and times
+the match predictions page's per-rerun queries both ways:
+- a date range plus five teams
+- a lookup of the selected match
+
+The scan side is what the page used to do: date masks, Home/Away isin, and
+string equality on a concatenated "Home vs Away" column.
+
+    python benchmarks/bench_fixture_index.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixture_index import FixtureIndex
+from synthetic_data import SyntheticLeagueGenerator
+
+TEAMS = [20, 200, 500, 1_000]
+
+
+def best_of(fn, repeat=20):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def scan(fixtures, start, end, teams, match):
+    filtered = fixtures[(fixtures['Date'].dt.date >= start) & (fixtures['Date'].dt.date <= end)]
+    filtered = filtered[filtered['Home_Team'].isin(teams) | filtered['Away_Team'].isin(teams)]
+    labels = filtered['Home_Team'] + ' vs ' + filtered['Away_Team']
+    return filtered, filtered[labels == match].iloc[0]
+
+
+def indexed(index, start, end, teams, fixture_id):
+    return index.rows(index.query(start, end, teams)), index.get(fixture_id)
+
+
+def main():
+    print(f"{'fixtures':>9s} {'build ms':>9s} {'scan ms':>8s} {'index ms':>9s} {'speedup':>8s}")
+    for teams in TEAMS:
+        generator = SyntheticLeagueGenerator(teams=teams, seasons=1, leagues={'39': 'Premier League'}, weeks_played=0)
+        fixtures = pd.concat(generator.iter_fixtures('39', generator.season), ignore_index=True)
+        build, index = best_of(lambda: FixtureIndex(fixtures), repeat=3)
+
+        dates = fixtures['Date'].sort_values()
+        start, end = dates.iloc[len(dates) // 4].date(), dates.iloc[len(dates) // 2].date()
+        selected = list(np.random.default_rng(0).choice(index.teams, 5, replace=False))
+        rows, _ = indexed(index, start, end, selected, index.frame.index[0])
+        fixture_id = rows.index[len(rows) // 2]
+        match = index.label(fixture_id)
+
+        scan_time, (expected, expected_match) = best_of(lambda: scan(fixtures, start, end, selected, match))
+        index_time, (found, found_match) = best_of(lambda: indexed(index, start, end, selected, fixture_id))
+        assert len(found) == len(expected) and found_match['Home_Team'] == expected_match['Home_Team']
+        print(f"{len(fixtures):9d} {build * 1000:9.1f} {scan_time * 1000:8.2f} {index_time * 1000:9.3f} "
+              f"{scan_time / index_time:7.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Cost of an instrumentation span and of exporting the aggregates.
+
+Times an empty block with and without a span around it, a cached fetch
+with and without its fetch span, and the JSON/Prometheus export of a
+tracer holding a realistic number of (page, span) series.
+
+    python benchmarks/bench_instrumentation.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_fetcher import SampleDataSource, SoccerDataFetcher
+from instrumentation import Tracer, tracer
+
+N = 100_000
+
+
+def per_call(fn, n=N):
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n
+
+
+def main():
+    def bare():
+        pass
+
+    def spanned():
+        with tracer.span('bench'):
+            pass
+
+    base, span = per_call(bare), per_call(spanned)
+    print(f"empty block {base * 1e6:.2f} us, with span {span * 1e6:.2f} us "
+          f"(overhead {(span - base) * 1e6:.2f} us)")
+
+    fetcher = SoccerDataFetcher(SampleDataSource(2026))
+    fetcher.fetch_league_standings('39')
+    fetch = per_call(lambda: fetcher.fetch_league_standings('39'), 10_000)
+    print(f"cached fetch_league_standings {fetch * 1e6:.1f} us including its span")
+
+    exporter = Tracer(metrics_dir=None)
+    for page in range(5):
+        for span in range(20):
+            for i in range(2048):
+                exporter.record(f'page{page}', f'span{span}', i * 1e-5)
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        exporter.flush(directory)
+        print(f"export of 100 series x 2048 samples: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+"""
+Headless page benchmarks with a stored baseline.
+
+Renders each dashboard page through Streamlit's AppTest, without a
+browser, over leagues of increasing size. Each (page, scale) run happens in
+a fresh interpreter so caches and peak memory start clean. A run records:
+- the cold render: first load and compute, including the page import
+- the median warm rerun with shared caches hot
+- peak RSS growth during the renders
+- bytes of element protos sent to the browser
+
+Results are compared with benchmarks/bench_pages_baseline.json. The
+script exits non-zero when any metric regresses beyond the threshold,
+exceeds its absolute limit, or when a page raises or times out. A run over
+a limit is never recorded as the baseline.
+
+    python benchmarks/bench_pages.py                      # every scale, compared with the baseline
+    python benchmarks/bench_pages.py --update-baseline    # record a new baseline
+    python benchmarks/bench_pages.py --max-teams 200 --pages league_standings
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_pages_baseline.json')
+
+PAGES = ['player_stats', 'team_analysis', 'league_standings', 'match_predictions']
+
+# (teams in the league, player seasons)
+SCALES = [(20, 100), (200, 1_000), (1_000, 10_000), (5_000, 100_000)]
+DEFAULT_MAX_TEAMS = 5_000
+
+WARM_RUNS = 3
+TIMEOUT = 300
+
+# A metric regresses when it exceeds the baseline by the threshold *and* by
+# this absolute slack, so run-to-run jitter on small pages doesn't fail a run
+SLACK = {'cold_s': 0.5, 'warm_s': 0.1, 'peak_mb': 16, 'payload_kb': 2}
+
+# Ceilings for any page at any scale, so a pathological run fails outright
+# instead of passing against (or becoming) a baseline just as bad
+LIMITS = {'cold_s': 30, 'warm_s': 2, 'peak_mb': 512, 'payload_kb': 6144}
+
+
+def scaled_source(teams, players, season=2026):
+    """Synthetic single-league source with `teams` clubs and `players` player seasons"""
+    from synthetic_data import SyntheticDataSource
+    # A full round robin of thousands of clubs is millions of matches, so
+    # large leagues play the usual 38 matchweeks
+    return SyntheticDataSource(teams=teams, squad=max(1, players // teams), seasons=1,
+                               leagues={'39': 'Premier League'}, matchweeks=38, season=season)
+
+
+def _payload_bytes(node):
+    """Serialized size of every element proto under an AppTest tree node"""
+    proto = getattr(node, 'proto', None)
+    total = proto.ByteSize() if hasattr(proto, 'ByteSize') else 0
+    children = getattr(node, 'children', None)
+    if isinstance(children, dict):
+        total += sum(_payload_bytes(child) for child in children.values())
+    return total
+
+
+def _rss_mb():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _render(root, page):
+    # Runs as the AppTest script, so it can't see this module's globals
+    import sys
+    sys.path.insert(0, root)
+    from page_registry import page_registry
+    page_registry.show(page)
+
+
+def measure(page, teams, players):
+    """Render one page at one scale in this process; called in the worker"""
+    from streamlit.testing.v1 import AppTest
+    import data_fetcher
+
+    source = scaled_source(teams, players)
+    data_fetcher.data_fetcher.source = source
+    data_fetcher.data_fetcher.season = str(source.season)
+
+    app = AppTest.from_function(_render, args=(ROOT, page), default_timeout=TIMEOUT)
+    # Streamlit itself is imported by now, so the RSS baseline covers only page work
+    rss_before = _rss_mb()
+    start = time.perf_counter()
+    app.run()
+    cold = time.perf_counter() - start
+    errors = [str(e.value) for e in app.exception]
+    warm = []
+    for _ in range(WARM_RUNS):
+        start = time.perf_counter()
+        app.run()
+        warm.append(time.perf_counter() - start)
+    errors += [str(e.value) for e in app.exception]
+    return {
+        'cold_s': cold,
+        'warm_s': float(np.median(warm)),
+        'peak_mb': max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 - rss_before, 0),
+        'payload_kb': _payload_bytes(app._tree) / 1024,
+        'errors': errors
+    }
+
+
+def run_isolated(page, teams, players):
+    """Measure in a fresh interpreter, without snapshots and with a throwaway history directory"""
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(os.environ, SOCCER_HISTORY_DIR=directory, SOCCER_METRICS_DIR='')
+        env.pop('SOCCER_SNAPSHOT_DIR', None)
+        env.pop('RAPIDAPI_KEY', None)
+        env.pop('FOOTBALL_DATA_API_KEY', None)
+        try:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--worker', page, str(teams), str(players)],
+                capture_output=True, text=True, env=env, timeout=TIMEOUT * (WARM_RUNS + 1)
+            )
+        except subprocess.TimeoutExpired:
+            return {'errors': ['timed out']}
+    lines = output.stdout.strip().splitlines()
+    if output.returncode or not lines:
+        return {'errors': [output.stderr.strip().splitlines()[-1] if output.stderr.strip() else 'worker failed']}
+    return json.loads(lines[-1])
+
+
+def regressions(result, baseline, threshold):
+    failed = []
+    for metric, slack in SLACK.items():
+        if metric in result and metric in baseline:
+            if result[metric] > baseline[metric] * (1 + threshold) and result[metric] - baseline[metric] > slack:
+                failed.append(f"{metric} {baseline[metric]:.2f} -> {result[metric]:.2f}")
+    return failed
+
+
+def over_limits(result):
+    return [f"{metric} {result[metric]:.2f} > {limit}"
+            for metric, limit in LIMITS.items() if result.get(metric, 0) > limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--pages', nargs='+', default=PAGES, choices=PAGES)
+    parser.add_argument('--max-teams', type=int, default=DEFAULT_MAX_TEAMS)
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed fractional regression over the baseline (default 0.25)')
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--worker', nargs=3, metavar=('PAGE', 'TEAMS', 'PLAYERS'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        page, teams, players = args.worker
+        print(json.dumps(measure(page, int(teams), int(players))))
+        return 0
+
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE) as f:
+            baseline = json.load(f)
+    results = dict(baseline) if args.update_baseline else {}
+    failures = 0
+
+    print(f"{'page':18s} {'teams':>6s} {'players':>8s} {'cold s':>7s} {'warm s':>7s} "
+          f"{'peak MB':>8s} {'payload KB':>11s}  status")
+    for teams, players in [scale for scale in SCALES if scale[0] <= args.max_teams]:
+        for page in args.pages:
+            key = f'{page}/{teams}/{players}'
+            result = run_isolated(page, teams, players)
+            if result['errors']:
+                status = 'ERROR ' + result['errors'][0][:60]
+            elif over_limits(result):
+                status = 'OVER LIMIT ' + '; '.join(over_limits(result))
+            elif args.update_baseline:
+                status = 'recorded'
+            elif key not in baseline:
+                status = 'no baseline'
+            else:
+                failed = regressions(result, baseline[key], args.threshold)
+                status = 'REGRESSED ' + '; '.join(failed) if failed else 'ok'
+            failures += status.startswith(('ERROR', 'REGRESSED', 'OVER LIMIT'))
+            if args.update_baseline and status != 'recorded':
+                # Never leave an old entry standing in for a failed run
+                results.pop(key, None)
+            if 'cold_s' in result:
+                print(f"{page:18s} {teams:6d} {players:8d} {result['cold_s']:7.2f} {result['warm_s']:7.2f} "
+                      f"{result['peak_mb']:8.1f} {result['payload_kb']:11.1f}  {status}")
+                if status == 'recorded':
+                    results[key] = {metric: round(result[metric], 4) for metric in SLACK}
+            else:
+                print(f"{page:18s} {teams:6d} {players:8d} {'':>36s}  {status}")
+
+    if args.update_baseline:
+        with open(BASELINE, 'w') as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+            f.write('\n')
+        print(f"baseline written to {os.path.relpath(BASELINE, ROOT)}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
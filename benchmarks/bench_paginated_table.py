@@ -0,0 +1,89 @@
+"""
+Server-side table pages vs whole-frame tables.
+
+For growing player tables, times what a rerun does to show one table:
+- whole frame: sort the filtered frame, style it row by row, serialize it all
+- paginated: mask a cached sort order and style one page, vectorized
+
+Serialization is Arrow IPC, which is what st.dataframe sends.
+
+    python benchmarks/bench_paginated_table.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from paginated_table import TableView, zone_styles
+from player_engine import PlayerStore
+from synthetic_data import SyntheticDataSource
+
+SIZES = [1_000, 10_000, 100_000]
+ZONES = [(1, 4, 'background-color: #d4edda'), (5, 6, 'background-color: #fff3cd'),
+         (-3, -1, 'background-color: #f8d7da')]
+
+
+def arrow_bytes(df):
+    sink = pa.BufferOutputStream()
+    table = pa.Table.from_pandas(df.reset_index(drop=True))
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().size
+
+
+def best_of(fn, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def whole(frame, rows):
+    shown = frame.take(rows).sort_values('Goals', ascending=False)
+    shown = shown.assign(Position=np.arange(1, len(shown) + 1))
+    relegation = len(shown) - 2
+
+    def style_row(row):
+        if row['Position'] <= 4:
+            return ['background-color: #d4edda'] * len(row)
+        if row['Position'] <= 6:
+            return ['background-color: #fff3cd'] * len(row)
+        if row['Position'] >= relegation:
+            return ['background-color: #f8d7da'] * len(row)
+        return [''] * len(row)
+    shown.style.apply(style_row, axis=1).to_html()
+    return arrow_bytes(shown)
+
+
+def paged(view, rows):
+    positions = view.query(rows, 'Goals', ascending=False)
+    shown = view.page(positions, 1).assign(Position=np.arange(1, min(50, len(positions)) + 1))
+    styles = zone_styles(shown['Position'], ZONES, len(positions))
+    shown.style.apply(lambda part: pd.DataFrame(np.repeat(styles[:, None], part.shape[1], axis=1),
+                                                index=part.index, columns=part.columns), axis=None).to_html()
+    return arrow_bytes(shown)
+
+
+def main():
+    print(f"{'players':>8s} {'whole ms':>9s} {'whole KB':>9s} {'paged ms':>9s} {'paged KB':>9s}")
+    for size in SIZES:
+        store = PlayerStore(SyntheticDataSource(teams=max(20, size // 25), squad=25, seasons=1,
+                                                leagues={'39': 'Premier League'}, matchweeks=38).load_players())
+        rows = store.select(min_minutes=90)
+        view = TableView(store.frame)
+        view.order('Goals', ascending=False)  # sorted once per store load
+        whole_time, whole_bytes = best_of(lambda: whole(store.frame, rows))
+        paged_time, paged_bytes = best_of(lambda: paged(view, rows))
+        print(f"{len(store):8d} {whole_time * 1000:9.1f} {whole_bytes / 1024:9.0f} "
+              f"{paged_time * 1000:9.1f} {paged_bytes / 1024:9.0f}")
+
+
+if __name__ == '__main__':
+    main()
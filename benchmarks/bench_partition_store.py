@@ -0,0 +1,59 @@
+"""
+Resident memory of partitioned (league, season) data under a budget.
+
+Walks five leagues x twenty seasons of sample standings and results
+through two fetchers: one whose budget holds everything, and one with a
+small budget. Prints resident bytes as leagues are added (flat for the
+budgeted fetcher) and the cost of re-reading a hot vs an evicted
+partition.
+
+    python benchmarks/bench_partition_store.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_fetcher import SampleDataSource, SoccerDataFetcher
+
+LEAGUES = ['39', '140', '135', '78', '61']
+SEASONS = [str(2026 - i) for i in range(20)]
+
+
+def load(fetcher, league_id):
+    for season in SEASONS:
+        fetcher.fetch_league_standings(league_id, season)
+        fetcher.fetch_results(league_id, season)
+
+
+def timed(fn, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    unbounded = SoccerDataFetcher(SampleDataSource(2026), partition_budget=2**40)
+    budgeted = SoccerDataFetcher(SampleDataSource(2026), partition_budget=2**20)
+
+    print(f"{'leagues':>8s} {'unbounded KB':>13s} {'1 MB budget KB':>15s} {'resident':>9s} {'evicted':>8s}")
+    for count, league_id in enumerate(LEAGUES, 1):
+        load(unbounded, league_id)
+        load(budgeted, league_id)
+        stats = budgeted.partitions.stats()
+        print(f"{count:8d} {unbounded.partitions.stats()['bytes'] / 1024:13.0f} "
+              f"{stats['bytes'] / 1024:15.0f} {stats['partitions']:9d} {stats['evictions']:8d}")
+
+    hot = LEAGUES[-1], SEASONS[-1]
+    cold = LEAGUES[0], SEASONS[0]
+    hot_time = timed(lambda: budgeted.fetch_results(*hot))
+    cold_time = timed(lambda: (budgeted.partitions.invalidate(cold), budgeted.fetch_results(*cold)))
+    print(f"hot partition read {hot_time * 1000:.2f} ms, evicted partition reload {cold_time * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
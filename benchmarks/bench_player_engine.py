@@ -0,0 +1,94 @@
+"""
+Indexed vs scanning player filters.
+
+Builds 60,000 player seasons (6 leagues x 20 teams x 25 players x 20
+seasons) and times PlayerStore.filter against boolean-mask filtering of the
+same data held as a plain object-dtype frame.
+
+    python benchmarks/bench_player_engine.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from player_engine import PlayerStore
+
+POSITIONS = ['Goalkeeper', 'Defender', 'Midfielder', 'Forward']
+
+
+def build_players(rng, leagues=6, teams=20, squad=25, seasons=20):
+    n = leagues * teams * squad * seasons
+    league = np.repeat(np.arange(leagues), teams * squad * seasons)
+    team = league * teams + np.tile(np.repeat(np.arange(teams), squad * seasons), leagues)
+    matches = rng.integers(0, 39, n)
+    return pd.DataFrame({
+        'Player': [f'Player {i}' for i in range(n)],
+        'League': [f'League {i}' for i in league],
+        'Team': [f'Team {i}' for i in team],
+        'Position': np.array(POSITIONS)[rng.integers(0, 4, n)],
+        'Season': [f'{2004 + i}/{(5 + i) % 100:02d}' for i in rng.integers(0, seasons, n)],
+        'Matches': matches,
+        'Minutes': matches * rng.integers(20, 91, n),
+        'Goals': rng.poisson(3, n),
+        'Assists': rng.poisson(2, n)
+    })
+
+
+def scan(df, league=None, team=None, position=None, min_minutes=0):
+    mask = np.ones(len(df), dtype=bool)
+    if league is not None:
+        mask &= (df['League'] == league).to_numpy()
+    if team is not None:
+        mask &= (df['Team'] == team).to_numpy()
+    if position is not None:
+        mask &= (df['Position'] == position).to_numpy()
+    if min_minutes:
+        mask &= (df['Minutes'] >= min_minutes).to_numpy()
+    filtered = df[mask].copy()
+    filtered['Goals_per_Match'] = filtered['Goals'] / filtered['Matches']
+    filtered['Assists_per_Match'] = filtered['Assists'] / filtered['Matches']
+    filtered['Goal_Involvement'] = filtered['Goals'] + filtered['Assists']
+    return filtered
+
+
+def best_of(fn, repeat=20):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    raw = build_players(np.random.default_rng(11))
+    start = time.perf_counter()
+    store = PlayerStore(raw)
+    build = time.perf_counter() - start
+
+    print(f"players:       {len(store)}")
+    print(f"store build:   {build * 1000:8.1f} ms (once per load)")
+    print(f"memory:        {raw.memory_usage(deep=True).sum() / 1e6:8.1f} MB raw -> "
+          f"{store.memory_usage() / 1e6:.1f} MB typed (with derived columns)")
+    cases = [
+        ('league', dict(league='League 2')),
+        ('team', dict(team='Team 41')),
+        ('league+position', dict(league='League 2', position='Forward')),
+        ('team+min minutes', dict(team='Team 41', min_minutes=900)),
+        ('min minutes', dict(min_minutes=2500))
+    ]
+    print(f"{'filter':20s} {'rows':>7s} {'scan ms':>9s} {'index ms':>9s} {'speedup':>8s}")
+    for name, filters in cases:
+        rows = len(store.filter(**filters))
+        scanned = best_of(lambda: scan(raw, **filters))
+        indexed = best_of(lambda: store.filter(**filters))
+        print(f"{name:20s} {rows:7d} {scanned * 1000:9.2f} {indexed * 1000:9.2f} {scanned / indexed:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Batched vs per-fixture match prediction.
+
+Builds a full double round-robin for five 20-team leagues (1,900 fixtures)
+and times PoissonMatchModel.predict on the whole batch against a Python loop
+over predict_match.
+
+    python benchmarks/bench_prediction_engine.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prediction_engine import PoissonMatchModel
+
+
+def build_league(name, n_teams, rng):
+    teams = [f'{name} Team {i + 1}' for i in range(n_teams)]
+    played = np.full(n_teams, 2 * (n_teams - 1))
+    standings = pd.DataFrame({
+        'Team': teams,
+        'Played': played,
+        'Goals_For': rng.poisson(1.4 * played),
+        'Goals_Against': rng.poisson(1.4 * played)
+    })
+    home, away = np.meshgrid(np.arange(n_teams), np.arange(n_teams), indexing='ij')
+    pairs = home != away
+    fixtures = pd.DataFrame({
+        'Home_Team': np.array(teams)[home[pairs]],
+        'Away_Team': np.array(teams)[away[pairs]]
+    })
+    return standings, fixtures
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    rng = np.random.default_rng(7)
+    leagues = [build_league(name, 20, rng) for name in ['EPL', 'LaLiga', 'SerieA', 'Bundesliga', 'Ligue1']]
+    standings = pd.concat([league[0] for league in leagues], ignore_index=True)
+    fixtures = pd.concat([league[1] for league in leagues], ignore_index=True)
+    model = PoissonMatchModel().fit(standings)
+
+    batched = best_of(lambda: model.predict(fixtures), repeat=5)
+    loop = best_of(lambda: [model.predict_match(h, a) for h, a in
+                            zip(fixtures['Home_Team'], fixtures['Away_Team'])], repeat=1)
+
+    print(f"fixtures:     {len(fixtures)}")
+    print(f"batched:      {batched * 1000:8.2f} ms")
+    print(f"per-fixture:  {loop * 1000:8.2f} ms")
+    print(f"speedup:      {loop / batched:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Monte Carlo season simulator throughput.
+
+Simulates the second half of a 20-team season (190 remaining fixtures)
+with one worker and with a process pool, reporting simulated seasons/sec.
+
+    python benchmarks/bench_season_simulator.py [n_sims] [workers]
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from season_simulator import SeasonSimulator
+
+
+def half_season(n_teams, rng):
+    teams = [f'Team {i + 1}' for i in range(n_teams)]
+    played = np.full(n_teams, n_teams - 1)
+    won = rng.integers(2, 14, n_teams)
+    drawn = rng.integers(0, played - won + 1)
+    standings = pd.DataFrame({
+        'Team': teams,
+        'Played': played,
+        'Points': 3 * won + drawn,
+        'Goals_For': rng.poisson(1.4 * played),
+        'Goals_Against': rng.poisson(1.4 * played)
+    })
+    home, away = np.triu_indices(n_teams, k=1)
+    fixtures = pd.DataFrame({'Home_Team': np.array(teams)[away], 'Away_Team': np.array(teams)[home]})
+    return standings, fixtures
+
+
+def main():
+    n_sims = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    standings, fixtures = half_season(20, np.random.default_rng(3))
+    simulator = SeasonSimulator(standings, fixtures)
+
+    for n_workers in sorted({1, workers}):
+        result = simulator.simulate(n_sims, seed=1, workers=n_workers)
+        print(f"workers={n_workers:<3} {n_sims:,} seasons in {result.elapsed:6.2f}s "
+              f"-> {result.throughput:,.0f} seasons/sec")
+    print(result.table.head(5).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
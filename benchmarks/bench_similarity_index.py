@@ -0,0 +1,88 @@
+"""
+Exact vs partitioned (IVF) player similarity search.
+
+Builds player seasons with correlated style features, then times top-10
+queries on both SimilarityIndex backends, unfiltered and with a
+league + position filter, and reports the IVF backend's recall@10 against
+the exact results.
+
+    python benchmarks/bench_similarity_index.py [players]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from player_engine import PlayerStore
+from similarity_index import SimilarityIndex
+
+POSITIONS = ['Goalkeeper', 'Defender', 'Midfielder', 'Forward']
+
+
+def build_players(n, rng):
+    position = rng.integers(0, 4, n)
+    # Attacking output rises with position; passing and defending follow role
+    attack = np.array([0.05, 0.6, 1.5, 3.0])[position] * rng.lognormal(0, 0.5, n)
+    matches = rng.integers(5, 39, n)
+    minutes = matches * rng.integers(45, 91, n)
+    return pd.DataFrame({
+        'Player': [f'Player {i}' for i in range(n)],
+        'League': [f'League {i}' for i in rng.integers(0, 12, n)],
+        'Team': [f'Team {i}' for i in rng.integers(0, 240, n)],
+        'Position': np.array(POSITIONS)[position],
+        'Season': '2023/24',
+        'Age': rng.integers(17, 38, n),
+        'Matches': matches,
+        'Minutes': minutes,
+        'Goals': rng.poisson(attack * matches / 10),
+        'Assists': rng.poisson(attack * matches / 15),
+        'Pass Accuracy %': np.clip(rng.normal(np.array([65, 84, 86, 76])[position], 5), 40, 97),
+        'Tackles_per_90': np.clip(rng.normal(np.array([0.1, 2.2, 2.0, 0.7])[position], 0.5), 0, None),
+        'Key_Passes_per_90': np.clip(rng.normal(np.array([0.1, 0.6, 1.6, 1.2])[position], 0.4), 0, None)
+    })
+
+
+def timed(fn, rows):
+    start = time.perf_counter()
+    results = [fn(row) for row in rows]
+    return (time.perf_counter() - start) / len(rows), results
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = np.random.default_rng(5)
+    store = PlayerStore(build_players(n, rng))
+    queries = rng.choice(n, size=200, replace=False)
+
+    start = time.perf_counter()
+    exact = SimilarityIndex(store)
+    exact_build = time.perf_counter() - start
+    start = time.perf_counter()
+    ivf = SimilarityIndex(store, backend='ivf')
+    ivf_build = time.perf_counter() - start
+
+    print(f"players: {n}  features: {len(exact.features)}  ivf lists: {len(ivf.centroids)}, probe {ivf.n_probe}")
+    print(f"build:   exact {exact_build * 1000:.0f} ms, ivf {ivf_build * 1000:.0f} ms")
+    print(f"{'query':28s} {'exact ms':>9s} {'ivf ms':>9s} {'speedup':>8s} {'recall@10':>10s}")
+    cases = [
+        ('top-10', {}),
+        ('top-10 league+position', {'league': 'League 3', 'position': 'Midfielder'}),
+        ('top-10 age 18-23', {'min_age': 18, 'max_age': 23})
+    ]
+    for name, filters in cases:
+        exact_time, exact_hits = timed(lambda row: exact.search(int(row), 10, **filters), queries)
+        ivf_time, ivf_hits = timed(lambda row: ivf.search(int(row), 10, **filters), queries)
+        recall = np.mean([
+            len(set(a['Player']) & set(b['Player'])) / max(len(a), 1)
+            for a, b in zip(exact_hits, ivf_hits)
+        ])
+        print(f"{name:28s} {exact_time * 1000:9.2f} {ivf_time * 1000:9.2f} "
+              f"{exact_time / ivf_time:7.1f}x {recall:10.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+Synthetic league generation: throughput and memory at scale.
+
+Streams every match and player season of one league to Arrow files for
+growing league sizes. Peak memory stays close to one chunk whatever the
+row count.
+
+    python benchmarks/bench_synthetic_data.py
+"""
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic_data import SyntheticLeagueGenerator
+
+TEAMS = [20, 200, 1_000, 2_000]
+
+
+def main():
+    print(f"{'teams':>6s} {'matches':>10s} {'players':>8s} {'seconds':>8s} {'rows/s':>10s} {'peak RSS MB':>12s}")
+    for teams in TEAMS:
+        generator = SyntheticLeagueGenerator(teams=teams, squad=25, seasons=2, leagues={'39': 'Premier League'})
+        with tempfile.TemporaryDirectory() as directory:
+            start = time.perf_counter()
+            rows = generator.write(directory)
+            elapsed = time.perf_counter() - start
+        total = sum(rows.values())
+        print(f"{teams:6d} {rows['matches']:10d} {rows['players']:8d} {elapsed:8.2f} {total / elapsed:10.0f} "
+              f"{resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:12.0f}")
+
+
+if __name__ == '__main__':
+    main()
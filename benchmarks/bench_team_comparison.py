@@ -0,0 +1,72 @@
+"""
+Per-metric comparison charts vs one faceted comparison figure.
+
+Reproduces the Team Analysis comparison both ways for four teams and four
+metrics: the old path (one px.bar per metric, each serialized and shipped
+separately) and SoccerVisualizations.create_team_comparison (one subplot
+figure), cold and memoized. Reports build + serialization time and the
+JSON payload that would go over the websocket.
+
+    python benchmarks/bench_team_comparison.py
+"""
+import os
+import sys
+import time
+
+import plotly.express as px
+import plotly.io as pio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_fetcher import data_fetcher
+from visualizations import SoccerVisualizations
+
+METRICS = ['Points', 'Goals Scored', 'Goals Conceded', 'Clean Sheets']
+
+
+def per_metric_charts(team_df, teams):
+    comparison_df = team_df[team_df['Team'].isin(teams)]
+    payloads = []
+    for metric in METRICS:
+        fig = px.bar(comparison_df, x='Team', y=metric, title=f'{metric} Comparison',
+                     color='Team', color_discrete_sequence=px.colors.qualitative.Set3)
+        fig.update_layout(height=400, showlegend=False)
+        payloads.append(pio.to_json(fig, validate=False))
+    return payloads
+
+
+def faceted_chart(viz, team_df, teams):
+    return [pio.to_json(viz.create_team_comparison(team_df, teams, METRICS), validate=False)]
+
+
+def measure(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        payloads = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), payloads
+
+
+def main():
+    team_df = data_fetcher.fetch_team_stats()
+    teams = team_df['Team'].head(4).tolist()
+    viz = SoccerVisualizations()
+
+    def cold():
+        viz.clear_figure_cache()
+        return faceted_chart(viz, team_df, teams)
+
+    rows = [
+        ('per-metric px.bar x4', measure(lambda: per_metric_charts(team_df, teams), repeat=10)),
+        ('faceted, cold', measure(cold, repeat=10)),
+        ('faceted, memoized', measure(lambda: faceted_chart(viz, team_df, teams), repeat=50))
+    ]
+    print(f"{'path':22s} {'figures':>8s} {'ms':>8s} {'payload KB':>11s}")
+    for name, (elapsed, payloads) in rows:
+        size = sum(len(payload.encode()) for payload in payloads) / 1024
+        print(f"{name:22s} {len(payloads):8d} {elapsed * 1000:8.2f} {size:11.1f}")
+
+
+if __name__ == '__main__':
+    main()
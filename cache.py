@@ -0,0 +1,143 @@
+import hashlib
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import pandas as pd
+
+# With copy-on-write (always on from pandas 3) a shallow copy is an
+# independent frame that shares data until either side writes
+_COPY_ON_WRITE = int(pd.__version__.split('.')[0]) >= 3
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries also expire after ``ttl`` seconds
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = 300.0,
+                 timer: Callable[[], float] = time.monotonic):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default on a miss"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > self._timer():
+                    self._data.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._data[key]
+                self._expirations += 1
+            self._misses += 1
+            return default
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Like get, but without touching LRU order or the hit/miss counters"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and (entry[1] is None or entry[1] > self._timer()):
+                return entry[0]
+            return default
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store value under key, evicting the least recently used entry if full"""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self._timer() + ttl if ttl is not None else None
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            self._data[key] = (value, expires_at)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop a single entry, returning whether it was present"""
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and (entry[1] is None or entry[1] > self._timer())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for monitoring"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'hit_rate': self._hits / lookups if lookups else 0.0
+            }
+
+
+# Frames made by shared_view(), by id: (weakref, fingerprint, shape and columns)
+_shared: Dict[int, tuple] = {}
+_shared_lock = threading.Lock()
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """Cheap content hash of a DataFrame (values, index and column names)"""
+    shared = _shared.get(id(df))
+    if shared is not None and shared[0]() is df and shared[2] == (df.shape, tuple(df.columns)):
+        return shared[1]
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def shared_view(df: pd.DataFrame, fingerprint: Optional[str] = None) -> pd.DataFrame:
+    """
+    A read-only view of df that remembers its fingerprint.
+
+    The view shares df's data, and a write to either copies first, so a
+    cached frame can be handed out without copying it. Fingerprinting the
+    view is then a lookup instead of a hash of every row. The fingerprint
+    is trusted while the view keeps its shape and columns; values written
+    into it in place aren't noticed, so views are for reading. Before
+    pandas 3 the view is a full copy.
+    """
+    fingerprint = fingerprint or frame_fingerprint(df)
+    view = df.copy(deep=not _COPY_ON_WRITE)
+    key = id(view)
+
+    def forget(ref):
+        with _shared_lock:
+            # The id may already belong to a newer view
+            if _shared.get(key, (None,))[0] is ref:
+                del _shared[key]
+
+    with _shared_lock:
+        _shared[key] = (weakref.ref(view, forget), fingerprint, (view.shape, tuple(view.columns)))
+    return view
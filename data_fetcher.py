@@ -1,30 +1,684 @@
+import asyncio
+import copy
+import logging
+import os
+import threading
+import numpy as np
 import pandas as pd
 import streamlit as st
-from typing import Optional, Dict
+from datetime import date
+from typing import Any, Callable, List, Optional, Dict
+
+from cache import TTLCache, frame_fingerprint, shared_view
+from http_transport import AsyncTransport, TransportError
+from instrumentation import tracer
+from partition_store import PartitionStore
+from prediction_engine import PoissonMatchModel
+from schedule import double_round_robin
+from singleflight import SingleFlight
+from snapshot_store import SnapshotStore
+from standings_engine import StandingsEngine
+
+logger = logging.getLogger(__name__)
+
+# API-Football league ids for the supported competitions
+SUPPORTED_LEAGUES = {
+    '39': 'Premier League',
+    '140': 'La Liga',
+    '135': 'Serie A',
+    '78': 'Bundesliga',
+    '61': 'Ligue 1',
+    '2': 'Champions League'
+}
+
+# Football-Data.org competition codes for the same leagues
+FOOTBALL_DATA_CODES = {'39': 'PL', '140': 'PD', '135': 'SA', '78': 'BL1', '61': 'FL1', '2': 'CL'}
+
+# Per-endpoint cache policy: (max entries, TTL in seconds)
+CACHE_POLICY = {
+    'fetch_league_standings': (32, 300),
+    'fetch_team_stats': (64, 300),
+    'fetch_fixtures': (32, 300),
+    'fetch_results': (32, 300),
+    'fetch_historical_data': (256, 3600),
+    'fetch_players': (8, 3600)
+}
+
+# Snapshot policy per endpoint: (snapshot kind, max age in seconds before a
+# background refresh is triggered)
+SNAPSHOT_POLICY = {
+    'fetch_league_standings': ('standings', 300),
+    'fetch_team_stats': ('team_stats', 300),
+    'fetch_fixtures': ('fixtures', 300),
+    'fetch_results': ('results', 300),
+    'fetch_historical_data': ('historical', 86400),
+    'fetch_players': ('players', 3600)
+}
+
+# Endpoints whose data belongs to one (league, season) partition; their
+# caches share one resident set, evicted whole partitions at a time
+PARTITIONED_ENDPOINTS = ('fetch_league_standings', 'fetch_fixtures', 'fetch_results')
+
+# Resident-set budget for partitioned data
+PARTITION_BUDGET_BYTES = int(float(os.environ.get('SOCCER_PARTITION_BUDGET_MB', 32)) * 2**20)
+
+# Arguments each endpoint's cache is keyed by, with the fetch methods'
+# defaults (a season of None is the fetcher's current season)
+ENDPOINT_PARAMS = {
+    'fetch_league_standings': {'league_id': '39', 'season': None},
+    'fetch_team_stats': {'team_name': None},
+    'fetch_fixtures': {'league_id': '39', 'season': None},
+    'fetch_results': {'league_id': '39', 'season': None},
+    'fetch_historical_data': {'team': None, 'seasons': 5},
+    'fetch_players': {}
+}
+
+DEFAULT_SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.snapshots')
+
+_MISSING = object()
+
+# Argument normalizers so equivalent calls share a cache key
+_KEY_NORMALIZERS = {
+    'league_id': str,
+    'team_name': lambda name: name.strip().casefold() if name else None,
+    'seasons': int,
+    'season': str
+}
+
+def _cache_key(params: Dict[str, Any]) -> tuple:
+    """Build a hashable cache key from endpoint arguments"""
+    return tuple(
+        (name, _KEY_NORMALIZERS.get(name, lambda v: v)(value))
+        for name, value in sorted(params.items())
+    )
+
+def current_season() -> int:
+    """Start year of the season in progress (seasons start in July)"""
+    today = date.today()
+    return today.year if today.month >= 7 else today.year - 1
+
+def _entry(value: Any) -> Any:
+    """
+    What the cache keeps for a loaded value: frames become views of their
+    own, fingerprinted once here rather than by every reader on every rerun
+    """
+    if isinstance(value, pd.DataFrame):
+        return shared_view(value)
+    return value
+
+def _detach(value: Any) -> Any:
+    """Hand out a cached value: frames as read-only views, anything else as a copy"""
+    if isinstance(value, pd.DataFrame):
+        return shared_view(value, frame_fingerprint(value))
+    return copy.deepcopy(value)
 
 class SoccerDataFetcher:
-    def __init__(self):
-        pass
-    
-    def fetch_league_standings(self, league_id: str = "39") -> pd.DataFrame:
-        """Fetch current league standings"""
-        sample_data = {
-            'Position': range(1, 21),
-            'Team': [
-                'Manchester City', 'Arsenal', 'Manchester United', 'Newcastle',
-                'Liverpool', 'Brighton', 'Aston Villa', 'Tottenham',
-                'Brentford', 'Fulham', 'Crystal Palace', 'Chelsea',
-                'Wolves', 'West Ham', 'Leeds United', 'Everton',
-                'Nottingham Forest', 'Leicester City', 'Bournemouth', 'Southampton'
-            ],
-            'Played': [38] * 20,
-            'Won': [28, 26, 23, 19, 19, 18, 18, 17, 15, 15, 11, 12, 13, 14, 11, 13, 9, 9, 11, 12],
-            'Points': [89, 84, 75, 74, 67, 62, 61, 59, 59, 52, 45, 45, 45, 49, 42, 45, 38, 34, 42, 42]
+    def __init__(self, source: Optional[Any] = None, cache_policy: Optional[Dict[str, tuple]] = None,
+                 snapshots: Optional[SnapshotStore] = None, partition_budget: Optional[int] = None):
+        self.source = source if source is not None else default_source()
+        self.season = str(getattr(self.source, 'season', 'current'))
+        # Persist upstream data so a restart doesn't have to refetch it
+        if snapshots is None and (os.environ.get('SOCCER_SNAPSHOT_DIR')
+                                  or isinstance(self.source, UpstreamDataSource)):
+            snapshots = SnapshotStore(os.environ.get('SOCCER_SNAPSHOT_DIR', DEFAULT_SNAPSHOT_DIR))
+        self.snapshots = snapshots
+        policy = dict(CACHE_POLICY)
+        policy.update(cache_policy or {})
+        self.partitions = PartitionStore(partition_budget or PARTITION_BUDGET_BYTES)
+        self._caches = {
+            endpoint: self.partitions.endpoint(endpoint, ttl) if endpoint in PARTITIONED_ENDPOINTS
+            else TTLCache(maxsize=maxsize, ttl=ttl)
+            for endpoint, (maxsize, ttl) in policy.items()
         }
-        return pd.DataFrame(sample_data)
+        # Concurrent misses for the same key share one upstream load
+        self._flight = SingleFlight()
+        # (league, season) partitions whose data is being published live,
+        # each with the check (if any) that releases it once the source has
+        # caught up
+        self._held: Dict[tuple, Optional[Callable[[str, pd.DataFrame], bool]]] = {}
+        self._held_lock = threading.Lock()
+    
+    def _load_once(self, endpoint: str, key: tuple, loader: Callable[[], Any]) -> Any:
+        cache = self._caches[endpoint]
+        # Another caller may have filled the cache between our miss and the claim
+        value = cache.peek(key, _MISSING)
+        if value is _MISSING:
+            value = _entry(loader())
+            cache.put(key, value)
+        return value
+    
+    def _cached(self, endpoint: str, params: Dict[str, Any], loader: Callable[[], Any]) -> Any:
+        """Serve an endpoint call from its cache, running loader on a miss"""
+        with tracer.span(f'fetch.{endpoint}'):
+            key = _cache_key(params)
+            value = self._caches[endpoint].get(key, _MISSING)
+            if value is _MISSING:
+                value = self._flight.do((endpoint, key), lambda: self._load_once(endpoint, key, loader))
+            return _detach(value)
+    
+    def _through_snapshots(self, endpoint: str, league_id: str,
+                           loader: Callable[[], tuple], name: Optional[str] = None,
+                           season: Optional[str] = None) -> tuple:
+        """Run a (frame, metadata) loader via the snapshot store when one is configured"""
+        if self.snapshots is None:
+            return loader()
+        kind, max_age = SNAPSHOT_POLICY[endpoint]
+        return self.snapshots.get(kind, league_id, season or self.season, loader,
+                                  max_age=max_age, name=name)
+    
+    def _season(self, season: Optional[Any]) -> str:
+        return str(season) if season is not None else self.season
+    
+    def _load_standings(self, league_id: str, season: str) -> pd.DataFrame:
+        df, _ = self._through_snapshots(
+            'fetch_league_standings', league_id,
+            lambda: (self.source.load_league_standings(league_id, season), {}), season=season
+        )
+        return df
+    
+    def _load_fixtures(self, league_id: str, season: str) -> pd.DataFrame:
+        df, _ = self._through_snapshots(
+            'fetch_fixtures', league_id,
+            lambda: (self.source.load_fixtures(league_id, season), {}), season=season
+        )
+        return df
+    
+    def _load_results(self, league_id: str, season: str) -> pd.DataFrame:
+        df, _ = self._through_snapshots(
+            'fetch_results', league_id,
+            lambda: (self.source.load_results(league_id, season), {}), season=season
+        )
+        return df
+    
+    def _load_team_stats(self, team_name: Optional[str]) -> pd.DataFrame:
+        df, _ = self._through_snapshots(
+            'fetch_team_stats', '39',
+            lambda: (self.source.load_team_stats(None), {})
+        )
+        if team_name:
+            df = df[df['Team'].str.contains(team_name, case=False, na=False)]
+        return df
+    
+    def _load_players(self) -> pd.DataFrame:
+        df, _ = self._through_snapshots(
+            'fetch_players', 'all',
+            lambda: (self.source.load_players(), {})
+        )
+        return df
+    
+    def _load_historical(self, team: str, seasons: int) -> Dict:
+        def load():
+            payload = self.source.load_historical_data(team, seasons)
+            return pd.DataFrame(payload['seasons']), {'team': payload['team'], 'trend': payload['trend']}
+        df, metadata = self._through_snapshots(
+            'fetch_historical_data', '39', load, name=f'{team}-{seasons}'
+        )
+        return {'team': metadata['team'], 'seasons': df.to_dict('records'), 'trend': metadata['trend']}
+    
+    async def _acached(self, endpoint: str, params: Dict[str, Any], loader: Callable[[], Any]) -> Any:
+        """Async variant of _cached; the blocking loader runs in a worker thread"""
+        with tracer.span(f'fetch.{endpoint}'):
+            key = _cache_key(params)
+            value = self._caches[endpoint].get(key, _MISSING)
+            if value is _MISSING:
+                value = await self._flight.do_async(
+                    (endpoint, key),
+                    lambda: asyncio.to_thread(self._load_once, endpoint, key, loader)
+                )
+            return _detach(value)
+    
+    def invalidate(self, endpoint: Optional[str] = None, **params) -> None:
+        """Drop cached results for one call, one endpoint, or everything"""
+        endpoints = [endpoint] if endpoint else list(self._caches)
+        for name in endpoints:
+            if not params:
+                self._caches[name].clear()
+                continue
+            fields = ENDPOINT_PARAMS.get(name, {})
+            # Only endpoints keyed by every given argument hold that call
+            if not set(params) <= set(fields):
+                continue
+            call = {**fields, **params}
+            if 'season' in call:
+                call['season'] = self._season(call['season'])
+            self._caches[name].invalidate(_cache_key(call))
+    
+    def publish(self, endpoint: str, value: pd.DataFrame, league_id: str = "39",
+                season: Optional[str] = None):
+        """Replace the cached value of a partitioned endpoint with newer data"""
+        if endpoint not in PARTITIONED_ENDPOINTS:
+            raise ValueError(f"{endpoint} is not a partitioned endpoint")
+        key = _cache_key({'league_id': str(league_id), 'season': self._season(season)})
+        self._caches[endpoint].put(key, _entry(value))
+    
+    def hold(self, league_id: str = "39", season: Optional[str] = None,
+             until: Optional[Callable[[str, pd.DataFrame], bool]] = None):
+        """
+        Keep a partition's published data in place: it neither expires nor
+        is evicted, and refresh() doesn't overwrite it. With ``until``, each
+        refresh still loads the source and hands it ``(endpoint, value)``;
+        the partition is released once it returns True.
+        """
+        partition = (str(league_id), self._season(season))
+        with self._held_lock:
+            self._held[partition] = until
+            self.partitions.pin(partition)
+    
+    def release(self, league_id: str = "39", season: Optional[str] = None):
+        """Let the partition expire and refresh() reload it again"""
+        partition = (str(league_id), self._season(season))
+        with self._held_lock:
+            self._held.pop(partition, None)
+            self.partitions.unpin(partition)
+    
+    def is_held(self, league_id: str = "39", season: Optional[str] = None) -> bool:
+        with self._held_lock:
+            return (str(league_id), self._season(season)) in self._held
+    
+    def _caught_up(self, endpoint: str, league_id: str, season: str, value: pd.DataFrame) -> bool:
+        """Whether a fresh source value lets a held partition go; releases it if so"""
+        with self._held_lock:
+            if (league_id, season) not in self._held:
+                return True
+            until = self._held[(league_id, season)]
+        if until is None or not until(endpoint, value):
+            return False
+        with self._held_lock:
+            # Unless a new kickoff has replaced the hold meanwhile
+            if self._held.get((league_id, season), _MISSING) != until:
+                return False
+            del self._held[(league_id, season)]
+            self.partitions.unpin((league_id, season))
+        return True
+    
+    def refresh(self, endpoint: str, league_id: str = "39", season: Optional[str] = None) -> bool:
+        """
+        Reload one partitioned endpoint straight from the source.
+
+        The fresh value replaces the cached one (and is snapshotted when a
+        snapshot store is configured). Returns whether the data changed.
+        A held partition is left alone, since the source lags the live
+        data published into it, until its release check passes.
+        """
+        if endpoint not in PARTITIONED_ENDPOINTS:
+            raise ValueError(f"{endpoint} is not a partitioned endpoint")
+        league_id, season = str(league_id), self._season(season)
+        with self._held_lock:
+            if self._held.get((league_id, season), _MISSING) is None:
+                return False
+        loader = {
+            'fetch_league_standings': self.source.load_league_standings,
+            'fetch_fixtures': self.source.load_fixtures,
+            'fetch_results': self.source.load_results
+        }[endpoint]
+        key = _cache_key({'league_id': league_id, 'season': season})
+        cache = self._caches[endpoint]
+        previous = cache.peek(key, _MISSING)
+
+        def load():
+            value = loader(league_id, season)
+            # A match may have kicked off while the source was loading
+            if not self._caught_up(endpoint, league_id, season, value):
+                return None
+            if self.snapshots is not None:
+                self.snapshots.write(SNAPSHOT_POLICY[endpoint][0], value, league_id, season)
+            value = _entry(value)
+            cache.put(key, value)
+            return value
+        # Refreshes coalesce among themselves; fetches waiting on a miss never
+        # see a refresh that was skipped
+        value = self._flight.do(('refresh', endpoint, key), load)
+        if value is None:
+            return False
+        return previous is _MISSING or not previous.equals(value)
+    
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss counters per endpoint"""
+        return {endpoint: cache.stats() for endpoint, cache in self._caches.items()}
+    
+    def coalescing_stats(self) -> Dict[str, int]:
+        """How many upstream loads ran vs. were deduplicated"""
+        return self._flight.stats()
+    
+    def available_seasons(self, league_id: str = "39") -> List[str]:
+        """Seasons the source can serve for a league, newest first"""
+        return [str(season) for season in self.source.available_seasons(str(league_id))]
+    
+    def fetch_league_standings(self, league_id: str = "39", season: Optional[str] = None) -> pd.DataFrame:
+        """Fetch league standings (the current season unless one is given)"""
+        season = self._season(season)
+        return self._cached(
+            'fetch_league_standings',
+            {'league_id': league_id, 'season': season},
+            lambda: self._load_standings(str(league_id), season)
+        )
+    
+    async def afetch_league_standings(self, league_id: str = "39", season: Optional[str] = None) -> pd.DataFrame:
+        """Fetch league standings from asyncio code"""
+        season = self._season(season)
+        return await self._acached(
+            'fetch_league_standings',
+            {'league_id': league_id, 'season': season},
+            lambda: self._load_standings(str(league_id), season)
+        )
+    
+    def fetch_fixtures(self, league_id: str = "39", season: Optional[str] = None) -> pd.DataFrame:
+        """Fetch upcoming fixtures"""
+        season = self._season(season)
+        return self._cached(
+            'fetch_fixtures',
+            {'league_id': league_id, 'season': season},
+            lambda: self._load_fixtures(str(league_id), season)
+        )
+    
+    def fetch_results(self, league_id: str = "39", season: Optional[str] = None) -> pd.DataFrame:
+        """Fetch completed match results (the current season unless one is given)"""
+        season = self._season(season)
+        return self._cached(
+            'fetch_results',
+            {'league_id': league_id, 'season': season},
+            lambda: self._load_results(str(league_id), season)
+        )
     
     def fetch_team_stats(self, team_name: Optional[str] = None) -> pd.DataFrame:
         """Fetch team statistics"""
+        return self._cached(
+            'fetch_team_stats',
+            {'team_name': team_name},
+            lambda: self._load_team_stats(team_name)
+        )
+    
+    def fetch_historical_data(self, team: str, seasons: int = 5) -> Dict:
+        """Fetch historical performance data"""
+        return self._cached(
+            'fetch_historical_data',
+            {'team': team, 'seasons': seasons},
+            lambda: self._load_historical(team, int(seasons))
+        )
+    
+    def fetch_players(self) -> pd.DataFrame:
+        """Fetch player season statistics across leagues"""
+        return self._cached('fetch_players', {}, self._load_players)
+    
+    def _load_leading_standings(self, leading: Dict[str, tuple], season: str):
+        """Load the leagues this caller claimed and resolve their futures"""
+        cache = self._caches['fetch_league_standings']
+        # Leagues with a usable snapshot are served from disk; the rest fan out upstream
+        from_disk = [] if self.snapshots is None else [
+            league_id for league_id in leading
+            if self.snapshots.latest('standings', league_id, season) is not None
+        ]
+        upstream = [league_id for league_id in leading if league_id not in from_disk]
+        loaded = {}
+        if upstream:
+            try:
+                loaded = dict(self.source.load_many_league_standings(upstream, season))
+            except BaseException as exc:
+                loaded = {league_id: exc for league_id in upstream}
+            for league_id, value in loaded.items():
+                if self.snapshots is not None and not isinstance(value, BaseException):
+                    try:
+                        self.snapshots.write('standings', value, league_id, season)
+                    except BaseException as exc:
+                        loaded[league_id] = exc
+        for league_id in from_disk:
+            try:
+                loaded[league_id] = self._load_standings(league_id, season)
+            except BaseException as exc:
+                loaded[league_id] = exc
+        for league_id, (key, future) in leading.items():
+            value = loaded.get(league_id, _MISSING)
+            if value is _MISSING:
+                value = KeyError(f"The source returned no standings for league {league_id}")
+            if isinstance(value, BaseException):
+                self._flight.resolve(('fetch_league_standings', key), future, error=value)
+            else:
+                value = _entry(value)
+                cache.put(key, value)
+                self._flight.resolve(('fetch_league_standings', key), future, value)
+    
+    def fetch_all_league_standings(self, league_ids: Optional[List[str]] = None,
+                                   season: Optional[str] = None,
+                                   errors: Optional[Dict[str, BaseException]] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch standings for several leagues, loading cache misses concurrently.
+        A league that fails is left out (and its error put in ``errors``, if
+        given) so one bad league never costs the others
+        """
+        league_ids = [str(league_id) for league_id in (league_ids or SUPPORTED_LEAGUES)]
+        season = self._season(season)
+        cache = self._caches['fetch_league_standings']
+        results = {}
+        waiting = {}
+        leading = {}
+        for league_id in league_ids:
+            key = _cache_key({'league_id': league_id, 'season': season})
+            value = cache.get(key, _MISSING)
+            if value is not _MISSING:
+                results[league_id] = value
+                continue
+            future, leader = self._flight.claim(('fetch_league_standings', key))
+            (leading if leader else waiting)[league_id] = (key, future)
+        if leading:
+            try:
+                self._load_leading_standings(leading, season)
+            except BaseException as exc:
+                # A key left in flight would block every later caller forever
+                for key, future in leading.values():
+                    if not future.done():
+                        self._flight.resolve(('fetch_league_standings', key), future, error=exc)
+                if not isinstance(exc, Exception):
+                    raise
+        for league_id, (_, future) in {**leading, **waiting}.items():
+            try:
+                results[league_id] = future.result()
+            except Exception as exc:
+                logger.warning("Could not load standings for league %s: %s", league_id, exc)
+                if errors is not None:
+                    errors[league_id] = exc
+        return {league_id: _detach(results[league_id]) for league_id in league_ids if league_id in results}
+
+
+def parse_standings(provider: str, payload: Dict) -> pd.DataFrame:
+    """Normalize a provider standings payload to the dashboard's columns"""
+    if provider == 'rapidapi':
+        rows = [{
+            'Position': entry['rank'],
+            'Team': entry['team']['name'],
+            'Played': entry['all']['played'],
+            'Won': entry['all']['win'],
+            'Drawn': entry['all']['draw'],
+            'Lost': entry['all']['lose'],
+            'Goals_For': entry['all']['goals']['for'],
+            'Goals_Against': entry['all']['goals']['against'],
+            'Goal_Difference': entry['goalsDiff'],
+            'Points': entry['points']
+        } for entry in payload['response'][0]['league']['standings'][0]]
+    else:
+        table = next(s for s in payload['standings'] if s['type'] == 'TOTAL')['table']
+        rows = [{
+            'Position': entry['position'],
+            'Team': entry['team']['name'],
+            'Played': entry['playedGames'],
+            'Won': entry['won'],
+            'Drawn': entry['draw'],
+            'Lost': entry['lost'],
+            'Goals_For': entry['goalsFor'],
+            'Goals_Against': entry['goalsAgainst'],
+            'Goal_Difference': entry['goalDifference'],
+            'Points': entry['points']
+        } for entry in table]
+    return pd.DataFrame(rows)
+
+def _round_number(name: str) -> int:
+    """Matchweek from an API-Football round name such as 'Regular Season - 12'"""
+    return int(name.rsplit('-', 1)[-1].strip() or 0)
+
+def parse_fixtures(provider: str, payload: Dict) -> pd.DataFrame:
+    """Normalize a provider fixtures payload to Date/Home_Team/Away_Team/Matchweek"""
+    if provider == 'rapidapi':
+        rows = [{
+            'Date': entry['fixture']['date'],
+            'Home_Team': entry['teams']['home']['name'],
+            'Away_Team': entry['teams']['away']['name'],
+            'Matchweek': _round_number(entry['league']['round'])
+        } for entry in payload['response']]
+    else:
+        rows = [{
+            'Date': entry['utcDate'],
+            'Home_Team': entry['homeTeam']['name'],
+            'Away_Team': entry['awayTeam']['name'],
+            'Matchweek': entry['matchday']
+        } for entry in payload['matches']]
+    df = pd.DataFrame(rows, columns=['Date', 'Home_Team', 'Away_Team', 'Matchweek'])
+    df['Date'] = pd.to_datetime(df['Date'], utc=True).dt.tz_localize(None)
+    return df.sort_values(['Date', 'Matchweek'], ignore_index=True)
+
+def parse_results(provider: str, payload: Dict) -> pd.DataFrame:
+    """Normalize a provider finished-matches payload to the results columns"""
+    if provider == 'rapidapi':
+        rows = [{
+            'Date': entry['fixture']['date'],
+            'Matchweek': _round_number(entry['league']['round']),
+            'Home_Team': entry['teams']['home']['name'],
+            'Away_Team': entry['teams']['away']['name'],
+            'Home_Goals': entry['goals']['home'],
+            'Away_Goals': entry['goals']['away']
+        } for entry in payload['response']]
+    else:
+        rows = [{
+            'Date': entry['utcDate'],
+            'Matchweek': entry['matchday'],
+            'Home_Team': entry['homeTeam']['name'],
+            'Away_Team': entry['awayTeam']['name'],
+            'Home_Goals': entry['score']['fullTime']['home'],
+            'Away_Goals': entry['score']['fullTime']['away']
+        } for entry in payload['matches']]
+    df = pd.DataFrame(rows, columns=['Date', 'Matchweek', 'Home_Team', 'Away_Team', 'Home_Goals', 'Away_Goals'])
+    df['Date'] = pd.to_datetime(df['Date'], utc=True).dt.tz_localize(None)
+    return df.sort_values(['Matchweek', 'Date'], ignore_index=True)
+
+class SampleDataSource:
+    """Bundled sample data used when no upstream API is configured"""
+
+    # Scoring and conceding over a 38-game season; these drive the seeded
+    # sample results, and the table itself is derived from those results
+    SAMPLE_STRENGTHS = {
+        'Team': [
+            'Manchester City', 'Arsenal', 'Manchester United', 'Newcastle',
+            'Liverpool', 'Brighton', 'Aston Villa', 'Tottenham',
+            'Brentford', 'Fulham', 'Crystal Palace', 'Chelsea',
+            'Wolves', 'West Ham', 'Leeds United', 'Everton',
+            'Nottingham Forest', 'Leicester City', 'Bournemouth', 'Southampton'
+        ],
+        'Played': [38] * 20,
+        'Goals_For': [89, 88, 58, 68, 75, 72, 61, 66, 58, 55, 40, 38, 31, 42, 48, 34, 38, 51, 37, 36],
+        'Goals_Against': [31, 43, 43, 33, 28, 53, 61, 40, 46, 53, 49, 47, 58, 58, 78, 57, 68, 68, 71, 73]
+    }
+    # Clubs for the other leagues, strongest first; their scoring and
+    # conceding rates are spread evenly from the top of the table down
+    SAMPLE_TEAMS = {
+        '140': ['Real Madrid', 'Barcelona', 'Atletico Madrid', 'Real Sociedad', 'Villarreal',
+                'Real Betis', 'Osasuna', 'Athletic Club', 'Mallorca', 'Girona',
+                'Rayo Vallecano', 'Sevilla', 'Celta Vigo', 'Cadiz', 'Getafe',
+                'Valencia', 'Almeria', 'Real Valladolid', 'Espanyol', 'Elche'],
+        '135': ['Napoli', 'Lazio', 'Inter', 'AC Milan', 'Atalanta',
+                'Roma', 'Juventus', 'Fiorentina', 'Bologna', 'Torino',
+                'Monza', 'Udinese', 'Sassuolo', 'Empoli', 'Salernitana',
+                'Lecce', 'Spezia', 'Verona', 'Cremonese', 'Sampdoria'],
+        '78': ['Bayern Munich', 'Borussia Dortmund', 'RB Leipzig', 'Union Berlin', 'SC Freiburg',
+               'Bayer Leverkusen', 'Eintracht Frankfurt', 'Wolfsburg', 'Mainz', 'Borussia Monchengladbach',
+               'FC Koln', 'Hoffenheim', 'Werder Bremen', 'VfL Bochum', 'Augsburg',
+               'VfB Stuttgart', 'Schalke', 'Hertha Berlin'],
+        '61': ['Paris Saint-Germain', 'Lens', 'Marseille', 'Rennes', 'Lille',
+               'Monaco', 'Lyon', 'Clermont', 'Nice', 'Lorient',
+               'Reims', 'Montpellier', 'Toulouse', 'Brest', 'Strasbourg',
+               'Nantes', 'Auxerre', 'Ajaccio'],
+        '2': ['Manchester City', 'Real Madrid', 'Bayern Munich', 'Inter', 'Barcelona',
+              'Paris Saint-Germain', 'Arsenal', 'Napoli', 'Borussia Dortmund', 'Atletico Madrid',
+              'AC Milan', 'Benfica', 'Porto', 'RB Leipzig', 'Liverpool',
+              'Juventus', 'PSV', 'Feyenoord', 'Celtic', 'Shakhtar Donetsk']
+    }
+    MATCHWEEKS_PLAYED = 28
+    HISTORY_SEASONS = 5
+    SEED = 110
+
+    def __init__(self, season: Optional[int] = None):
+        self.season = season or current_season()
+
+    def available_seasons(self, league_id: str) -> List[int]:
+        return list(range(self.season, self.season - self.HISTORY_SEASONS, -1))
+
+    def _season_year(self, season: Optional[Any]) -> int:
+        return int(season) if season is not None else self.season
+
+    def _strengths(self, league_id: str, season: int) -> pd.DataFrame:
+        if league_id == '39':
+            strengths = pd.DataFrame(self.SAMPLE_STRENGTHS)
+        elif league_id in self.SAMPLE_TEAMS:
+            teams = self.SAMPLE_TEAMS[league_id]
+            games = 2 * (len(teams) - 1)
+            rank = np.linspace(0, 1, len(teams))
+            strengths = pd.DataFrame({
+                'Team': teams,
+                'Played': games,
+                'Goals_For': np.round(games * (2.3 - 1.3 * rank)),
+                'Goals_Against': np.round(games * (0.8 + 1.0 * rank))
+            })
+        else:
+            raise KeyError(f"No sample data for league {league_id}")
+        # Earlier seasons drift from the current strengths, so each has its own table
+        if season != self.season:
+            rng = np.random.default_rng([self.SEED, int(league_id), season])
+            drift = rng.lognormal(0, 0.15, size=(len(strengths), 2))
+            strengths['Goals_For'] = strengths['Goals_For'] * drift[:, 0]
+            strengths['Goals_Against'] = strengths['Goals_Against'] * drift[:, 1]
+        return strengths
+
+    def _weeks_played(self, season: int, rounds: int) -> int:
+        return min(self.MATCHWEEKS_PLAYED, rounds) if season == self.season else rounds
+
+    def _rounds(self, league_id: str, season: int, teams: pd.Series) -> List[List[tuple]]:
+        return double_round_robin(teams)
+
+    def _season(self, league_id: str, season: int) -> pd.DataFrame:
+        """Full double round-robin with seeded scores for every match"""
+        strengths = self._strengths(league_id, season)
+        rounds = self._rounds(league_id, season, strengths['Team'])
+        matches = pd.DataFrame(
+            [(week, home, away) for week, pairs in enumerate(rounds, 1) for home, away in pairs],
+            columns=['Matchweek', 'Home_Team', 'Away_Team']
+        )
+        # Anchor the calendar so the first unplayed matchweek of the current
+        # season is tomorrow; earlier seasons sit whole years before it
+        first_open = pd.Timestamp.now().normalize() + pd.Timedelta(days=1) - pd.Timedelta(weeks=52 * (self.season - season))
+        matches.insert(0, 'Date', first_open + pd.to_timedelta((matches['Matchweek'] - self.MATCHWEEKS_PLAYED - 1) * 7, unit='D'))
+        home_xg, away_xg = PoissonMatchModel().fit(strengths).expected_goals(matches['Home_Team'], matches['Away_Team'])
+        rng = np.random.default_rng([self.SEED, int(league_id), season])
+        matches['Home_Goals'] = rng.poisson(home_xg)
+        matches['Away_Goals'] = rng.poisson(away_xg)
+        matches.attrs['weeks_played'] = self._weeks_played(season, len(rounds))
+        return matches
+
+    def load_results(self, league_id: str, season: Optional[Any] = None) -> pd.DataFrame:
+        matches = self._season(league_id, self._season_year(season))
+        return matches[matches['Matchweek'] <= matches.attrs['weeks_played']].reset_index(drop=True)
+
+    def load_league_standings(self, league_id: str, season: Optional[Any] = None) -> pd.DataFrame:
+        season = self._season_year(season)
+        engine = StandingsEngine(self._strengths(league_id, season)['Team'], league_id)
+        engine.apply_results(self.load_results(league_id, season))
+        return engine.table()
+
+    def load_many_league_standings(self, league_ids: List[str], season: Optional[Any] = None) -> Dict[str, Any]:
+        return {league_id: self.load_league_standings(league_id, season) for league_id in league_ids}
+
+    def load_fixtures(self, league_id: str, season: Optional[Any] = None) -> pd.DataFrame:
+        matches = self._season(league_id, self._season_year(season))
+        upcoming = matches[matches['Matchweek'] > matches.attrs['weeks_played']]
+        return upcoming[['Date', 'Home_Team', 'Away_Team', 'Matchweek']].reset_index(drop=True)
+
+    def load_team_stats(self, team_name: Optional[str]) -> pd.DataFrame:
         sample_teams = {
             'Team': ['Manchester City', 'Arsenal', 'Manchester United', 'Newcastle',
                     'Liverpool', 'Brighton', 'Aston Villa', 'Tottenham'],
@@ -34,15 +688,31 @@ class SoccerDataFetcher:
             'Goals Conceded': [31, 43, 43, 33, 28, 53, 51, 40],
             'Clean Sheets': [17, 14, 13, 19, 21, 8, 9, 12],
             'Possession %': [67.2, 59.8, 56.4, 52.1, 61.7, 58.9, 54.2, 55.8],
-            'Pass Accuracy %': [90.1, 86.7, 83.2, 81.9, 87.4, 84.6, 82.1, 83.7]
+            'Pass Accuracy %': [90.1, 86.7, 83.2, 81.9, 87.4, 84.6, 82.1, 83.7],
+            'Shots per Game': [18.6, 16.9, 14.2, 15.1, 17.8, 15.6, 12.9, 14.4],
+            'Tackles per Game': [13.2, 15.1, 16.4, 17.3, 14.8, 16.2, 17.9, 15.5]
         }
         df = pd.DataFrame(sample_teams)
         if team_name:
             df = df[df['Team'].str.contains(team_name, case=False, na=False)]
         return df
-    
-    def fetch_historical_data(self, team: str, seasons: int = 5) -> Dict:
-        """Fetch historical performance data"""
+
+    def load_players(self) -> pd.DataFrame:
+        sample_players = {
+            'Player': ['Lionel Messi', 'Cristiano Ronaldo', 'Kylian Mbappé', 'Erling Haaland', 'Neymar Jr'],
+            'Team': ['PSG', 'Al Nassr', 'PSG', 'Man City', 'Al Hilal'],
+            'League': ['Ligue 1', 'Saudi Pro League', 'Ligue 1', 'Premier League', 'Saudi Pro League'],
+            'Position': ['Forward'] * 5,
+            'Season': ['2023/24'] * 5,
+            'Age': [36, 38, 24, 23, 31],
+            'Matches': [35, 32, 38, 40, 30],
+            'Minutes': [2890, 2710, 3240, 3315, 2380],
+            'Goals': [30, 28, 35, 42, 25],
+            'Assists': [15, 8, 12, 10, 18]
+        }
+        return pd.DataFrame(sample_players)
+
+    def load_historical_data(self, team: str, seasons: int) -> Dict:
         seasons_data = []
         for i in range(seasons):
             season = f"202{3-i}/2{4-i}"
@@ -61,4 +731,83 @@ class SoccerDataFetcher:
             'trend': 'improving' if seasons_data[0]['Points'] > seasons_data[-1]['Points'] else 'declining'
         }
 
+class UpstreamDataSource(SampleDataSource):
+    """
+    Live standings from API-Football (via RapidAPI) or Football-Data.org.
+    Endpoints without an upstream mapping fall back to the sample data.
+    """
+
+    HISTORY_SEASONS = 10
+
+    def __init__(self, transport: Optional[AsyncTransport] = None, season: Optional[int] = None):
+        super().__init__(season)
+        self.transport = transport or AsyncTransport()
+
+    def _standings_call(self, league_id: str, season: int) -> tuple:
+        if 'rapidapi' in self.transport.providers:
+            return ('rapidapi', 'standings', {'league': league_id, 'season': season})
+        if 'football-data' in self.transport.providers:
+            code = FOOTBALL_DATA_CODES[league_id]
+            return ('football-data', f'competitions/{code}/standings', {'season': season})
+        raise TransportError('upstream', 'no standings provider configured')
+
+    def load_fixtures(self, league_id: str, season: Optional[Any] = None) -> pd.DataFrame:
+        season = self._season_year(season)
+        if 'rapidapi' in self.transport.providers:
+            call = ('rapidapi', 'fixtures', {'league': league_id, 'season': season, 'next': 50})
+        elif 'football-data' in self.transport.providers:
+            code = FOOTBALL_DATA_CODES[league_id]
+            call = ('football-data', f'competitions/{code}/matches', {'status': 'SCHEDULED', 'season': season})
+        else:
+            raise TransportError('upstream', 'no fixtures provider configured')
+        payload = self.transport.get_many([call])[0]
+        if isinstance(payload, Exception):
+            raise payload
+        return parse_fixtures(call[0], payload)
+
+    def load_results(self, league_id: str, season: Optional[Any] = None) -> pd.DataFrame:
+        season = self._season_year(season)
+        if 'rapidapi' in self.transport.providers:
+            call = ('rapidapi', 'fixtures', {'league': league_id, 'season': season, 'status': 'FT'})
+        elif 'football-data' in self.transport.providers:
+            code = FOOTBALL_DATA_CODES[league_id]
+            call = ('football-data', f'competitions/{code}/matches', {'status': 'FINISHED', 'season': season})
+        else:
+            raise TransportError('upstream', 'no results provider configured')
+        payload = self.transport.get_many([call])[0]
+        if isinstance(payload, Exception):
+            raise payload
+        return parse_results(call[0], payload)
+
+    def load_league_standings(self, league_id: str, season: Optional[Any] = None) -> pd.DataFrame:
+        result = self.load_many_league_standings([league_id], season)[league_id]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def load_many_league_standings(self, league_ids: List[str], season: Optional[Any] = None) -> Dict[str, Any]:
+        """Fetch several leagues concurrently; failures are returned as exceptions"""
+        season = self._season_year(season)
+        calls = [self._standings_call(league_id, season) for league_id in league_ids]
+        payloads = self.transport.get_many(calls)
+        results = {}
+        for league_id, (provider, _, _), payload in zip(league_ids, calls, payloads):
+            if isinstance(payload, Exception):
+                results[league_id] = payload
+            else:
+                results[league_id] = parse_standings(provider, payload)
+        return results
+
+def default_source():
+    """Use live APIs when a key is configured, synthetic leagues when asked for, otherwise the sample data"""
+    if os.environ.get('RAPIDAPI_KEY') or os.environ.get('FOOTBALL_DATA_API_KEY'):
+        return UpstreamDataSource()
+    if os.environ.get('SOCCER_SYNTHETIC_TEAMS'):
+        from synthetic_data import SyntheticDataSource
+        return SyntheticDataSource(teams=int(os.environ['SOCCER_SYNTHETIC_TEAMS']),
+                                   seed=int(os.environ.get('SOCCER_SYNTHETIC_SEED', 0)))
+    return SampleDataSource()
+
+# Module-level instance: Streamlit reruns the app script but keeps imported
+# modules, so this fetcher (and its caches) is shared by every session.
 data_fetcher = SoccerDataFetcher()
\ No newline at end of file
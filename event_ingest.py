@@ -0,0 +1,423 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from data_fetcher import SoccerDataFetcher, data_fetcher
+from form_store import get_form_store
+from standings_engine import StandingsEngine
+
+EVENT_TYPES = ('kickoff', 'goal', 'card', 'full_time')
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class MatchEvent:
+    """One live match event, carried on the wire as a JSON line"""
+
+    FIELDS = ('type', 'league_id', 'home', 'away', 'team', 'minute', 'card',
+              'home_goals', 'away_goals', 'matchweek', 'emitted_at')
+
+    def __init__(self, type: str, league_id: str, home: str, away: str,
+                 team: Optional[str] = None, minute: Optional[int] = None,
+                 card: Optional[str] = None, home_goals: Optional[int] = None,
+                 away_goals: Optional[int] = None, matchweek: Optional[int] = None,
+                 emitted_at: Optional[float] = None):
+        if type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {type}")
+        self.type = type
+        self.league_id = str(league_id)
+        self.home = home
+        self.away = away
+        self.team = team
+        self.minute = minute
+        self.card = card
+        self.home_goals = home_goals
+        self.away_goals = away_goals
+        self.matchweek = matchweek
+        self.emitted_at = emitted_at
+
+    @classmethod
+    def from_json(cls, line: str) -> 'MatchEvent':
+        """Parse one JSON line; raises ValueError if it isn't a valid event"""
+        try:
+            payload = json.loads(line)
+            return cls(**{field: payload[field] for field in cls.FIELDS if field in payload})
+        except (TypeError, KeyError, json.JSONDecodeError) as exc:
+            raise ValueError(f"Invalid match event: {line!r}") from exc
+
+    def to_json(self) -> str:
+        return json.dumps({field: getattr(self, field) for field in self.FIELDS
+                           if getattr(self, field) is not None})
+
+
+async def tail_file(path: str, poll_interval: float = 0.1, from_start: bool = True) -> AsyncIterator[str]:
+    """Follow a JSON-lines file as it grows, like ``tail -f``"""
+    with open(path) as f:
+        if not from_start:
+            f.seek(0, os.SEEK_END)
+        partial = ''
+        while True:
+            chunk = f.readline()
+            if not chunk:
+                await asyncio.sleep(poll_interval)
+                continue
+            partial += chunk
+            # A line without its newline is still being written
+            if partial.endswith('\n'):
+                line, partial = partial.strip(), ''
+                if line:
+                    yield line
+
+
+async def read_socket(host: str, port: int) -> AsyncIterator[str]:
+    """JSON lines from a TCP feed; TCP flow control carries the backpressure"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            if line.strip():
+                yield line.decode().strip()
+    finally:
+        writer.close()
+
+
+async def replay(events: Iterable[Union[str, MatchEvent]]) -> AsyncIterator[Union[str, MatchEvent]]:
+    """Events from memory, e.g. a recorded match day"""
+    for event in events:
+        yield event
+        await asyncio.sleep(0)
+
+
+class LiveLeague:
+    """
+    Live state of one league season, updated one event at a time.
+
+    Built from the fetched results, standings and fixtures. A match in
+    play is held in the StandingsEngine as a provisional result. A goal
+    swaps the old score for the new one, which touches only the two teams'
+    rows. The full-time whistle makes the result final. Finished matches
+    are appended to the results, dropped from the fixtures and pushed onto
+    both teams' form in one go when the league is next published.
+
+    The league's partition is held from the first kickoff: background
+    refreshes don't overwrite it, and it doesn't expire. Once no match is
+    in play it stays held until a refresh finds every finished result in
+    the source. Outside a hold the state is rebuilt from the shared cache
+    before the next event, so refreshed data is never overwritten by a
+    stale table.
+    """
+
+    def __init__(self, fetcher: SoccerDataFetcher, league_id: str, season: Optional[str] = None):
+        self.fetcher = fetcher
+        self.league_id = str(league_id)
+        self.season = str(season) if season is not None else fetcher.season
+        # (home, away) -> score, cards, minute and matchweek of matches in play
+        self.live: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        # Results finished since the last publish
+        self._finished: List[Dict[str, Any]] = []
+        # Finished matches the source hasn't reported yet
+        self._unconfirmed: set = set()
+        self.sync()
+
+    def sync(self):
+        """Rebuild the league from the fetcher's current results, fixtures and standings"""
+        self.results = self.fetcher.fetch_results(self.league_id, self.season)
+        self.fixtures = self.fetcher.fetch_fixtures(self.league_id, self.season)
+        standings = self.fetcher.fetch_league_standings(self.league_id, self.season)
+        self.engine = StandingsEngine(standings['Team'], self.league_id)
+        self.engine.apply_results(self.results)
+        self.form = get_form_store(self.league_id, self.results, season=self.season)
+        self._scheduled = dict(zip(zip(self.fixtures['Home_Team'], self.fixtures['Away_Team']),
+                                   self.fixtures['Matchweek'])) if 'Matchweek' in self.fixtures else {}
+        self._unconfirmed = set()
+
+    def _confirmed(self, endpoint: str, value: pd.DataFrame) -> bool:
+        """Release check for the hold: the source's results include every finished match"""
+        if endpoint != 'fetch_results':
+            return False
+        reported = set(zip(value['Home_Team'], value['Away_Team']))
+        return self._unconfirmed <= reported
+
+    def _matchweek(self, event: MatchEvent) -> int:
+        if event.matchweek is not None:
+            return int(event.matchweek)
+        scheduled = self._scheduled.get((event.home, event.away))
+        return int(scheduled) if scheduled is not None else self.engine.matchweeks + 1
+
+    def _kickoff(self, event: MatchEvent) -> Dict[str, Any]:
+        match = {'home_goals': 0, 'away_goals': 0, 'minute': 0, 'matchweek': self._matchweek(event),
+                 'cards': {event.home: 0, event.away: 0}}
+        self.engine.apply_result(event.home, event.away, 0, 0, match['matchweek'])
+        # A background refresh would replace the live table with the source's
+        self.fetcher.hold(self.league_id, self.season)
+        self.live[(event.home, event.away)] = match
+        return match
+
+    def _rescore(self, event: MatchEvent, match: Dict[str, Any], home_goals: int, away_goals: int):
+        self.engine.remove_result(event.home, event.away, match['home_goals'], match['away_goals'],
+                                  match['matchweek'])
+        match['home_goals'], match['away_goals'] = home_goals, away_goals
+        self.engine.apply_result(event.home, event.away, home_goals, away_goals, match['matchweek'])
+
+    def apply(self, event: MatchEvent) -> List[str]:
+        """Fold one event into the live state; returns the endpoints it changed"""
+        if not self.live and not self.fetcher.is_held(self.league_id, self.season):
+            # Nothing of ours is published, so refreshes may have moved on
+            self.sync()
+        for team in (event.home, event.away):
+            if team not in self.engine.teams:
+                raise KeyError(f"{team} is not in this league")
+        if event.type == 'goal' and event.team not in (event.home, event.away):
+            raise KeyError(f"{event.team} is not playing in {event.home} vs {event.away}")
+        match = self.live.get((event.home, event.away))
+        changed = []
+        if match is None:
+            match = self._kickoff(event)
+            changed.append('fetch_league_standings')
+        if event.minute is not None:
+            match['minute'] = max(match['minute'], int(event.minute))
+
+        if event.type == 'goal':
+            home_goals = match['home_goals'] + (event.team == event.home)
+            away_goals = match['away_goals'] + (event.team == event.away)
+            self._rescore(event, match, home_goals, away_goals)
+            changed.append('fetch_league_standings')
+        elif event.type == 'card':
+            match['cards'][event.team] = match['cards'].get(event.team, 0) + 1
+        elif event.type == 'full_time':
+            # The final score on the whistle is authoritative
+            if event.home_goals is not None and event.away_goals is not None:
+                self._rescore(event, match, int(event.home_goals), int(event.away_goals))
+            del self.live[(event.home, event.away)]
+            self._finished.append({
+                'Date': pd.Timestamp.now().normalize(),
+                'Matchweek': match['matchweek'],
+                'Home_Team': event.home,
+                'Away_Team': event.away,
+                'Home_Goals': match['home_goals'],
+                'Away_Goals': match['away_goals']
+            })
+            changed += ['fetch_league_standings', 'fetch_results', 'fetch_fixtures']
+        return list(dict.fromkeys(changed))
+
+    def _flush_finished(self):
+        if not self._finished:
+            return
+        finished = pd.DataFrame(self._finished)
+        self.results = pd.concat([self.results, finished], ignore_index=True)
+        self._unconfirmed = self._unconfirmed | set(zip(finished['Home_Team'], finished['Away_Team']))
+        played = pd.MultiIndex.from_frame(finished[['Home_Team', 'Away_Team']])
+        fixtures = pd.MultiIndex.from_frame(self.fixtures[['Home_Team', 'Away_Team']])
+        self.fixtures = self.fixtures[~fixtures.isin(played)]
+        self._finished = []
+
+    def publish(self, endpoints: Iterable[str]):
+        """Write the changed endpoints into the fetcher's shared cache"""
+        self._flush_finished()
+        values = {
+            'fetch_league_standings': lambda: self.engine.table(),
+            'fetch_results': lambda: self.results,
+            'fetch_fixtures': lambda: self.fixtures.reset_index(drop=True)
+        }
+        for endpoint in endpoints:
+            self.fetcher.publish(endpoint, values[endpoint](), self.league_id, self.season)
+            if endpoint == 'fetch_results':
+                # Appending to the results only pushes the new ones onto the form
+                self.form = get_form_store(self.league_id, self.results, season=self.season)
+        if not self.live:
+            # Keep the finished results until the source has them too
+            self.fetcher.hold(self.league_id, self.season, until=self._confirmed)
+
+    def live_matches(self) -> pd.DataFrame:
+        """Score, minute and cards of every match in play"""
+        return pd.DataFrame([{
+            'Home_Team': home, 'Away_Team': away,
+            'Home_Goals': match['home_goals'], 'Away_Goals': match['away_goals'],
+            'Minute': match['minute'], 'Cards': sum(match['cards'].values())
+        } for (home, away), match in self.live.items()],
+            columns=['Home_Team', 'Away_Team', 'Home_Goals', 'Away_Goals', 'Minute', 'Cards'])
+
+
+class EventIngest:
+    """
+    Consumes a stream of match events into the shared dashboard data.
+
+    A source is any async iterator of JSON lines (or MatchEvents). A
+    producer task moves them into a bounded queue, so a source that outruns
+    the consumer is paused on ``put`` rather than buffered without limit.
+    The consumer applies each event to its league's LiveLeague, then
+    publishes only the endpoints that changed and reports them through
+    ``on_update``. Events already queued are applied as one batch with one
+    publish, so a burst costs one table rebuild rather than one per event.
+    Latency is measured from the event's ``emitted_at`` (or its arrival) to
+    the moment the dashboard data reflects it.
+    """
+
+    def __init__(self, fetcher: SoccerDataFetcher, queue_size: int = 256,
+                 on_update: Optional[Callable[[str, str], None]] = None,
+                 season: Optional[str] = None, max_batch: int = 64,
+                 latency_window: int = 10_000):
+        self.fetcher = fetcher
+        self.queue_size = queue_size
+        self.max_batch = max_batch
+        self.on_update = on_update
+        self.season = season
+        self.leagues: Dict[str, LiveLeague] = {}
+        self._latencies = deque(maxlen=latency_window)
+        self._lock = threading.Lock()
+        self._received = 0
+        self._applied = 0
+        self._rejected = 0
+        self._failed = 0
+        self._stalls = 0
+        self._max_depth = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def league(self, league_id: str) -> LiveLeague:
+        """Live state for a league, built on its first event"""
+        league = self.leagues.get(league_id)
+        if league is None:
+            league = self.leagues[league_id] = LiveLeague(self.fetcher, league_id, self.season)
+        return league
+
+    async def _produce(self, source: AsyncIterator, queue: asyncio.Queue):
+        async for item in source:
+            if queue.full():
+                with self._lock:
+                    self._stalls += 1
+            await queue.put((item, time.time()))
+            with self._lock:
+                self._max_depth = max(self._max_depth, queue.qsize())
+        await queue.put(_DONE)
+
+    def _apply(self, item: Union[str, MatchEvent], received_at: float,
+               dirty: Dict[str, List[str]]) -> Optional[float]:
+        """Apply one event, noting what changed; returns its emit time if applied"""
+        with self._lock:
+            self._received += 1
+        try:
+            event = item if isinstance(item, MatchEvent) else MatchEvent.from_json(item)
+            endpoints = self.league(event.league_id).apply(event)
+        except (ValueError, KeyError):
+            with self._lock:
+                self._rejected += 1
+            return None
+        dirty.setdefault(event.league_id, []).extend(endpoints)
+        return event.emitted_at or received_at
+
+    def _publish(self, dirty: Dict[str, List[str]], emitted: List[float]):
+        for league_id, endpoints in dirty.items():
+            endpoints = list(dict.fromkeys(endpoints))
+            try:
+                self.leagues[league_id].publish(endpoints)
+                if self.on_update is not None:
+                    for endpoint in endpoints:
+                        self.on_update(league_id, endpoint)
+            except Exception:
+                # Other leagues, and later batches, still go out
+                logger.exception("Failed to publish live updates for league %s", league_id)
+                with self._lock:
+                    self._failed += 1
+        now = time.time()
+        with self._lock:
+            self._applied += len(emitted)
+            self._latencies.extend(now - emitted_at for emitted_at in emitted)
+
+    async def run(self, source: AsyncIterator):
+        """Ingest until the source is exhausted"""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        producer = asyncio.create_task(self._produce(source, queue))
+        try:
+            done = False
+            while not done:
+                batch = [await queue.get()]
+                while len(batch) < self.max_batch and not queue.empty():
+                    batch.append(queue.get_nowait())
+                dirty: Dict[str, List[str]] = {}
+                emitted = []
+                for item in batch:
+                    if item is _DONE:
+                        done = True
+                        break
+                    try:
+                        emitted_at = self._apply(*item, dirty)
+                    except Exception:
+                        # One bad event (or a failing source load) mustn't stop the feed
+                        logger.exception("Failed to apply match event %r", item[0])
+                        with self._lock:
+                            self._failed += 1
+                        continue
+                    if emitted_at is not None:
+                        emitted.append(emitted_at)
+                self._publish(dirty, emitted)
+        finally:
+            producer.cancel()
+
+    def start(self, source_factory: Callable[[], AsyncIterator]) -> threading.Thread:
+        """Run the pipeline on its own event loop in a daemon thread"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=lambda: asyncio.run(self.run(source_factory())),
+                name='event-ingest', daemon=True
+            )
+            self._thread.start()
+        return self._thread
+
+    def stats(self) -> Dict[str, Any]:
+        """Throughput, backpressure and latency counters"""
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000
+            counters = {
+                'received': self._received,
+                'applied': self._applied,
+                'rejected': self._rejected,
+                'failed': self._failed,
+                'backpressure_stalls': self._stalls,
+                'max_queue_depth': self._max_depth
+            }
+        return {
+            **counters,
+            'latency_ms_p50': float(np.percentile(latencies, 50)) if len(latencies) else None,
+            'latency_ms_p95': float(np.percentile(latencies, 95)) if len(latencies) else None,
+            'latency_ms_max': float(latencies.max()) if len(latencies) else None
+        }
+
+
+def source_from_spec(spec: str) -> Callable[[], AsyncIterator]:
+    """``file:<path>`` or ``tcp:<host>:<port>`` to a source factory"""
+    kind, _, target = spec.partition(':')
+    if kind == 'file':
+        return lambda: tail_file(target, from_start=False)
+    if kind == 'tcp':
+        host, _, port = target.rpartition(':')
+        return lambda: read_socket(host, int(port))
+    raise ValueError(f"Unknown event feed: {spec}")
+
+
+live_ingest: Optional[EventIngest] = None
+_live_lock = threading.Lock()
+
+def start_live_feed(spec: Optional[str] = None,
+                    on_update: Optional[Callable[[str, str], None]] = None) -> Optional[EventIngest]:
+    """Start the process-wide ingest from SOCCER_EVENT_FEED (once); None if no feed is set"""
+    global live_ingest
+    spec = spec or os.environ.get('SOCCER_EVENT_FEED')
+    if not spec:
+        return None
+    with _live_lock:
+        if live_ingest is None:
+            live_ingest = EventIngest(data_fetcher, on_update=on_update)
+            live_ingest.start(source_from_spec(spec))
+        return live_ingest
@@ -0,0 +1,123 @@
+import threading
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from cache import TTLCache, frame_fingerprint
+
+_ID_MASK = (1 << 62) - 1
+
+
+def fixture_ids(fixtures: pd.DataFrame) -> np.ndarray:
+    """
+    Stable integer id per fixture from its teams and matchweek (and league,
+    when given).
+
+    Ids don't depend on row order, kickoff times or which other fixtures
+    are present, so a selection survives refreshes that drop started
+    matches or reschedule others. Without a Matchweek column the kickoff
+    day stands in. Only a pair meeting twice under the same key is told
+    apart by kickoff order.
+    """
+    keys = fixtures[[column for column in ('League_Id', 'Home_Team', 'Away_Team') if column in fixtures]]
+    if 'Matchweek' in fixtures:
+        keys = keys.assign(Matchweek=fixtures['Matchweek'].astype(np.int64))
+    else:
+        keys = keys.assign(Day=pd.to_datetime(fixtures['Date']).dt.normalize())
+    keys = keys.assign(Meeting=keys.groupby(list(keys.columns), sort=False).cumcount())
+    hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    return (hashes & np.uint64(_ID_MASK)).astype(np.int64)
+
+
+class FixtureIndex:
+    """
+    Fixtures sorted by kickoff, with a posting list per team and an id lookup.
+
+    Kickoffs are one sorted int64 array, so a date range is two binary
+    searches. Each team's posting list holds its row positions in kickoff
+    order, so a team filter within a date range is a binary search per
+    team plus a merge of their (short) postings. Neither scans the
+    calendar.
+    """
+
+    def __init__(self, fixtures: pd.DataFrame):
+        frame = fixtures.sort_values('Date', kind='stable').reset_index(drop=True)
+        frame.insert(0, 'Fixture_Id', fixture_ids(frame))
+        self.frame = frame.set_index('Fixture_Id', drop=False)
+        self._dates = frame['Date'].to_numpy(dtype='datetime64[ns]').astype(np.int64)
+        self._positions = pd.Index(frame['Fixture_Id'])
+
+        home = frame['Home_Team'].to_numpy()
+        away = frame['Away_Team'].to_numpy()
+        codes, teams = pd.factorize(np.concatenate([home, away]), sort=True)
+        rows = np.concatenate([np.arange(len(frame))] * 2)
+        order = np.lexsort((rows, codes))
+        starts = np.searchsorted(codes[order], np.arange(1, len(teams)))
+        self.teams: List[str] = list(teams)
+        self._postings: Dict[str, np.ndarray] = dict(zip(self.teams, np.split(rows[order], starts)))
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @property
+    def first_date(self) -> Optional[pd.Timestamp]:
+        return pd.Timestamp(self._dates[0]) if len(self) else None
+
+    @property
+    def last_date(self) -> Optional[pd.Timestamp]:
+        return pd.Timestamp(self._dates[-1]) if len(self) else None
+
+    def _bounds(self, start: Optional[pd.Timestamp], end: Optional[pd.Timestamp]) -> tuple:
+        lo = 0 if start is None else int(np.searchsorted(self._dates, pd.Timestamp(start).value, 'left'))
+        # The end date is inclusive: everything before the following midnight
+        hi = len(self) if end is None else int(np.searchsorted(
+            self._dates, (pd.Timestamp(end).normalize() + pd.Timedelta(days=1)).value, 'left'))
+        return lo, max(lo, hi)
+
+    def query(self, start: Optional[pd.Timestamp] = None, end: Optional[pd.Timestamp] = None,
+              teams: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Row positions, in kickoff order, of fixtures in [start, end] involving any of teams"""
+        lo, hi = self._bounds(start, end)
+        if not teams:
+            return np.arange(lo, hi)
+        parts = []
+        for team in teams:
+            posting = self._postings.get(team)
+            if posting is not None:
+                parts.append(posting[np.searchsorted(posting, lo):np.searchsorted(posting, hi)])
+        # A match between two selected teams is in both postings
+        return np.unique(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64)
+
+    def rows(self, positions: np.ndarray) -> pd.DataFrame:
+        """Fixtures at the given positions, indexed by fixture id"""
+        return self.frame.iloc[positions]
+
+    def get(self, fixture_id: int) -> pd.Series:
+        """One fixture by id"""
+        return self.frame.iloc[self._positions.get_loc(fixture_id)]
+
+    def __contains__(self, fixture_id: int) -> bool:
+        return fixture_id in self._positions
+
+    def label(self, fixture_id: int) -> str:
+        """'Home vs Away' for a fixture id"""
+        fixture = self.get(fixture_id)
+        return f"{fixture['Home_Team']} vs {fixture['Away_Team']}"
+
+
+# Fixtures change only when refreshed or when matches kick off, so indexes
+# are keyed by content and shared by every session
+_indexes = TTLCache(maxsize=16, ttl=600)
+_indexes_lock = threading.Lock()
+
+def get_fixture_index(fixtures: pd.DataFrame, league_id: str = '39',
+                      season: Optional[str] = None) -> FixtureIndex:
+    """Process-wide fixture index for a league's current fixtures"""
+    key = (str(league_id), season, frame_fingerprint(fixtures))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = FixtureIndex(fixtures)
+            _indexes.put(key, index)
+        return index
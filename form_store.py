@@ -0,0 +1,135 @@
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from analytics_kernels import calculate_form_points, calculate_team_momentum
+from cache import frame_fingerprint
+
+RESULT_LETTERS = {3: 'W', 1: 'D', 0: 'L'}
+
+
+class FormStore:
+    """
+    Rolling last-N results for every team.
+
+    Each team owns one row of a (teams, window) ring buffer of points
+    (3/1/0), so recording a result is two O(1) writes and form or momentum
+    for all teams is a single vectorized pass over the buffer.
+    """
+
+    def __init__(self, teams: Sequence[str] = (), window: int = 10):
+        self.window = window
+        self.teams: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._points = np.zeros((0, window), dtype=np.int8)
+        self._goals = np.zeros((0, window, 2), dtype=np.int16)
+        self._head = np.zeros(0, dtype=np.int64)  # next write slot per team
+        self._count = np.zeros(0, dtype=np.int64)
+        self._lock = threading.RLock()
+        for team in teams:
+            self._row(team)
+
+    def _row(self, team: str) -> int:
+        row = self._index.get(team)
+        if row is not None:
+            return row
+        row = self._index[team] = len(self.teams)
+        self.teams.append(team)
+        if row >= len(self._points):
+            capacity = max(2 * len(self._points), 8)
+            self._points = np.resize(self._points, (capacity, self.window))
+            self._goals = np.resize(self._goals, (capacity, self.window, 2))
+            self._head = np.resize(self._head, capacity)
+            self._count = np.resize(self._count, capacity)
+        self._head[row] = self._count[row] = 0
+        return row
+
+    def _push(self, team: str, points: int, scored: int, conceded: int):
+        row = self._row(team)
+        slot = self._head[row]
+        self._points[row, slot] = points
+        self._goals[row, slot] = (scored, conceded)
+        self._head[row] = (slot + 1) % self.window
+        self._count[row] = min(self._count[row] + 1, self.window)
+
+    def record(self, home: str, away: str, home_goals: int, away_goals: int):
+        """Push one final result onto both teams' buffers"""
+        home_points = 3 if home_goals > away_goals else 1 if home_goals == away_goals else 0
+        away_points = 3 if away_goals > home_goals else 1 if home_goals == away_goals else 0
+        with self._lock:
+            self._push(home, home_points, home_goals, away_goals)
+            self._push(away, away_points, away_goals, home_goals)
+
+    def record_results(self, results: pd.DataFrame):
+        """Push a batch of results, oldest first"""
+        with self._lock:
+            for home, away, home_goals, away_goals in zip(
+                    results['Home_Team'], results['Away_Team'],
+                    results['Home_Goals'], results['Away_Goals']):
+                self.record(home, away, int(home_goals), int(away_goals))
+
+    def points_matrix(self, n: Optional[int] = None) -> np.ndarray:
+        """(teams, n) points, oldest to newest, NaN where a team has fewer games"""
+        n = min(n or self.window, self.window)
+        with self._lock:
+            rows = len(self.teams)
+            slots = (self._head[:rows, None] - n + np.arange(n)) % self.window
+            points = self._points[np.arange(rows)[:, None], slots].astype(float)
+            # Games older than the team's count are empty slots
+            points[np.arange(n) < (n - self._count[:rows, None])] = np.nan
+            return points
+
+    def recent(self, team: str, n: int = 5) -> List[str]:
+        """Last n results for a team as W/D/L, oldest first"""
+        if team not in self._index:
+            return []
+        row = self.points_matrix(n)[self._index[team]]
+        return [RESULT_LETTERS[int(points)] for points in row if not np.isnan(points)]
+
+    def table(self, n: int = 5, momentum_games: Optional[int] = None) -> pd.DataFrame:
+        """Form string, form points and momentum for every team"""
+        recent = self.points_matrix(n)
+        slope = calculate_team_momentum(self.points_matrix(momentum_games or self.window))
+        letters = np.where(recent == 3, 'W', np.where(recent == 1, 'D', np.where(recent == 0, 'L', '')))
+        return pd.DataFrame({
+            'Team': self.teams,
+            'Form': [''.join(row) for row in letters],
+            'Form_Points': calculate_form_points(recent).astype(int),
+            'Momentum': np.where(slope > 0, 'Positive', 'Negative'),
+            'Momentum_Strength': np.abs(slope).round(2)
+        })
+
+    def team(self, team: str, n: int = 5) -> dict:
+        """Form row for one team"""
+        table = self.table(n)
+        return table[table['Team'] == team].iloc[0].to_dict()
+
+
+_stores: Dict[Tuple[str, str], Tuple[FormStore, str, int]] = {}
+_stores_lock = threading.Lock()
+
+def get_form_store(league_id: str, results: pd.DataFrame, window: int = 10,
+                   season: Optional[str] = None) -> FormStore:
+    """
+    Process-wide form store for a league season, kept in step with its results.
+
+    Results are expected in playing order; rows past the ones already
+    recorded are pushed incrementally, anything else triggers a rebuild.
+    """
+    key = (str(league_id), str(season))
+    if 'Matchweek' in results:
+        results = results.sort_values('Matchweek', kind='stable')
+    with _stores_lock:
+        store, fingerprint, seen = _stores.get(key, (None, None, 0))
+        appended = store is not None and frame_fingerprint(results.iloc[:seen]) == fingerprint
+        if appended and len(results) == seen:
+            return store
+        if appended:
+            store.record_results(results.iloc[seen:])
+        else:
+            store = FormStore(window=window)
+            store.record_results(results)
+        _stores[key] = (store, frame_fingerprint(results), len(results))
+        return store
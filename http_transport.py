@@ -0,0 +1,203 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Responses worth another attempt: rate limited or a transient server error
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Longest wait honoured from a Retry-After header, in seconds
+MAX_RETRY_AFTER = 30.0
+
+
+class TransportError(Exception):
+    """Raised when an upstream provider call fails"""
+
+    def __init__(self, provider: str, message: str, status: Optional[int] = None):
+        super().__init__(f"{provider}: {message}")
+        self.provider = provider
+        self.status = status
+
+
+class ProviderConfig:
+    """
+    Connection settings for one upstream data provider
+    """
+
+    def __init__(self, base_url: str, headers: Optional[Dict[str, str]] = None,
+                 rate_per_sec: float = 1.0, burst: int = 5, pool_size: int = 4,
+                 retries: int = 2):
+        self.base_url = base_url.rstrip('/')
+        self.headers = headers or {}
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self.pool_size = pool_size
+        self.retries = retries
+
+
+def default_providers() -> Dict[str, ProviderConfig]:
+    """Provider configs for every API whose key is set in the environment"""
+    providers = {}
+    rapidapi_key = os.environ.get('RAPIDAPI_KEY')
+    if rapidapi_key:
+        providers['rapidapi'] = ProviderConfig(
+            'https://api-football-v1.p.rapidapi.com/v3',
+            headers={
+                'X-RapidAPI-Key': rapidapi_key,
+                'X-RapidAPI-Host': 'api-football-v1.p.rapidapi.com'
+            },
+            rate_per_sec=5.0, burst=10
+        )
+    football_data_key = os.environ.get('FOOTBALL_DATA_API_KEY')
+    if football_data_key:
+        # Free tier allows 10 calls per minute
+        providers['football-data'] = ProviderConfig(
+            'https://api.football-data.org/v4',
+            headers={'X-Auth-Token': football_data_key},
+            rate_per_sec=10 / 60, burst=10
+        )
+    return providers
+
+
+class TokenBucket:
+    """
+    Async token bucket used to keep each provider under its rate limit
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: int):
+        self.rate = rate_per_sec
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AsyncTransport:
+    """
+    Asyncio HTTP transport with one keep-alive connection pool per provider.
+
+    Requests are issued through pooled ``requests`` sessions on a worker
+    pool, while an event loop on a background thread handles fan-out,
+    bounded concurrency and per-provider token buckets. Rate-limited (429)
+    and 5xx responses and connection errors are retried with exponential
+    backoff, honouring Retry-After; every attempt takes a token. Sync callers use
+    ``run``/``get_many``; async callers can await ``get_json`` directly
+    from inside ``run``.
+    """
+
+    def __init__(self, providers: Optional[Dict[str, ProviderConfig]] = None,
+                 max_concurrency: int = 8, timeout: float = 10.0, backoff: float = 0.5):
+        self.providers = providers if providers is not None else default_providers()
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.backoff = backoff
+        self._sessions: Dict[str, requests.Session] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                            thread_name_prefix='soccer-http')
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever,
+                                        name='soccer-http-loop', daemon=True)
+        self._thread.start()
+        self._semaphore = None
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _session(self, provider: str) -> requests.Session:
+        session = self._sessions.get(provider)
+        if session is None:
+            config = self.providers[provider]
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config.pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update(config.headers)
+            self._sessions[provider] = session
+        return session
+
+    async def get_json(self, provider: str, path: str,
+                       params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET a JSON document from a provider (must run on the transport loop)"""
+        if provider not in self.providers:
+            raise TransportError(provider, "provider not configured")
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        config = self.providers[provider]
+        bucket = self._buckets.get(provider)
+        if bucket is None:
+            bucket = self._buckets[provider] = TokenBucket(config.rate_per_sec, config.burst)
+
+        url = f"{config.base_url}/{path.lstrip('/')}"
+        session = self._session(provider)
+        loop = asyncio.get_running_loop()
+        for attempt in range(config.retries + 1):
+            last = attempt == config.retries
+            await bucket.acquire()
+            async with self._semaphore:
+                try:
+                    response = await loop.run_in_executor(
+                        self._executor,
+                        lambda: session.get(url, params=params, timeout=self.timeout)
+                    )
+                except requests.RequestException as exc:
+                    if last:
+                        raise TransportError(provider, str(exc)) from exc
+                    response = None
+            if last or (response is not None and response.status_code not in RETRY_STATUSES):
+                break
+            # Wait outside the semaphore so other calls keep the pool busy
+            await asyncio.sleep(self._retry_delay(response, attempt))
+        if response.status_code != 200:
+            raise TransportError(provider, f"HTTP {response.status_code} for {path}",
+                                 status=response.status_code)
+        try:
+            return response.json()
+        except ValueError as exc:
+            raise TransportError(provider, f"invalid JSON from {path}") from exc
+
+    def _retry_delay(self, response: Optional[requests.Response], attempt: int) -> float:
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        try:
+            return min(float(retry_after), MAX_RETRY_AFTER)
+        except (TypeError, ValueError):
+            return self.backoff * 2 ** attempt
+
+    async def gather(self, calls: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]],
+                     return_exceptions: bool = True) -> List[Any]:
+        """Run many (provider, path, params) GETs concurrently"""
+        return await asyncio.gather(
+            *(self.get_json(provider, path, params) for provider, path, params in calls),
+            return_exceptions=return_exceptions
+        )
+
+    def run(self, coro: Awaitable) -> Any:
+        """Run a coroutine on the transport loop and block for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def get_many(self, calls: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]]) -> List[Any]:
+        """Blocking fan-out; failed calls come back as TransportError instances"""
+        return self.run(self.gather(list(calls)))
+
+    def close(self):
+        """Stop the event loop and release pooled connections"""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=self.timeout)
+        self._executor.shutdown(wait=False)
+        for session in self._sessions.values():
+            session.close()
+        self._sessions.clear()
@@ -0,0 +1,246 @@
+import contextlib
+import contextvars
+import functools
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# numpy and pandas are imported where they're used: every page module imports
+# the tracer, and recording spans shouldn't pull them in
+
+logger = logging.getLogger(__name__)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Spans recorded outside any page render (background refreshes, live ingest)
+BACKGROUND = 'background'
+
+# Streamlit calls timed as emission spans
+EMITTERS = ('plotly_chart', 'dataframe')
+
+# Where metrics files are written, and at most how often
+METRICS_DIR = os.environ.get('SOCCER_METRICS_DIR')
+FLUSH_INTERVAL = 10.0
+
+# Timing Streamlit emissions patches Streamlit for the whole process, so it's opt-in
+PROFILE_EMITS = bool(os.environ.get('SOCCER_PROFILE_EMITS'))
+
+_page: contextvars.ContextVar = contextvars.ContextVar('page', default=BACKGROUND)
+
+
+class SpanStats:
+    """Count, total and a reservoir of recent durations for one (page, span)"""
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.total = 0.0
+        self.recent = deque(maxlen=window)
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.recent.append(seconds)
+
+    def quantiles(self) -> Dict[float, float]:
+        import numpy as np
+        values = np.percentile(np.fromiter(self.recent, dtype=float), [q * 100 for q in QUANTILES])
+        return dict(zip(QUANTILES, values))
+
+
+class Tracer:
+    """
+    Timing spans grouped by page.
+
+    ``page()`` marks a page render; every ``span()`` opened while it runs,
+    in any module, is recorded under that page. Spans are named
+    ``<kind>.<name>`` (fetch, transform, figure, emit), and each
+    (page, span) keeps a running count and total plus a window of recent
+    durations for p50/p95/p99. Recording a span is one clock read and a
+    deque append, so spans can stay on in production.
+    """
+
+    def __init__(self, window: int = 2048, metrics_dir: Optional[str] = METRICS_DIR,
+                 flush_interval: float = FLUSH_INTERVAL):
+        self.window = window
+        self.metrics_dir = metrics_dir
+        self.flush_interval = flush_interval
+        self._stats: Dict[Tuple[str, str], SpanStats] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._last_flush = 0.0
+
+    def record(self, page: str, span: str, seconds: float):
+        with self._lock:
+            stats = self._stats.get((page, span))
+            if stats is None:
+                stats = self._stats[(page, span)] = SpanStats(self.window)
+            stats.add(seconds)
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time a block under the current page"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(_page.get(), name, time.perf_counter() - start)
+
+    def traced(self, name: str) -> Callable:
+        """Decorator form of span()"""
+        def decorate(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    @contextlib.contextmanager
+    def page(self, name: str) -> Iterator[None]:
+        """Attribute spans in this block to a page; the whole block is its render span"""
+        token = _page.set(name)
+        try:
+            with self.span('render'):
+                yield
+        finally:
+            _page.reset(token)
+            self.maybe_flush()
+
+    def __len__(self) -> int:
+        """Number of (page, span) series recorded"""
+        with self._lock:
+            return len(self._stats)
+
+    def snapshot(self) -> "pd.DataFrame":
+        """One row per (page, span): count, mean and p50/p95/p99 in milliseconds"""
+        import pandas as pd
+        with self._lock:
+            rows = [{
+                'Page': page,
+                'Span': span,
+                'Count': stats.count,
+                'Mean_ms': stats.total / stats.count * 1000,
+                **{f'p{int(q * 100)}_ms': value * 1000 for q, value in stats.quantiles().items()}
+            } for (page, span), stats in self._stats.items()]
+        columns = ['Page', 'Span', 'Count', 'Mean_ms'] + [f'p{int(q * 100)}_ms' for q in QUANTILES]
+        return pd.DataFrame(rows, columns=columns).sort_values(['Page', 'Span'], ignore_index=True)
+
+    def to_json(self) -> str:
+        return json.dumps({'generated_at': time.time(),
+                           'spans': self.snapshot().round(3).to_dict('records')}, indent=1)
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition: one summary per (page, span)"""
+        lines = ['# HELP soccer_dashboard_span_seconds Time spent in instrumented spans',
+                 '# TYPE soccer_dashboard_span_seconds summary']
+        with self._lock:
+            items = [(page, span, stats.count, stats.total, stats.quantiles())
+                     for (page, span), stats in sorted(self._stats.items())]
+        for page, span, count, total, quantiles in items:
+            labels = f'page="{page}",span="{span}"'
+            for q, value in quantiles.items():
+                lines.append(f'soccer_dashboard_span_seconds{{{labels},quantile="{q}"}} {value:.6f}')
+            lines.append(f'soccer_dashboard_span_seconds_sum{{{labels}}} {total:.6f}')
+            lines.append(f'soccer_dashboard_span_seconds_count{{{labels}}} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def flush(self, directory: Optional[str] = None) -> List[str]:
+        """Write spans.json and spans.prom (atomically) and return their paths"""
+        directory = directory or self.metrics_dir
+        with self._flush_lock:
+            return self._write(directory)
+
+    def _write(self, directory: str) -> List[str]:
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for name, content in (('spans.json', self.to_json()), ('spans.prom', self.to_prometheus())):
+            path = os.path.join(directory, name)
+            # A temp file of our own, so concurrent writers (other threads or
+            # processes sharing the directory) never replace each other's halves
+            with tempfile.NamedTemporaryFile('w', dir=directory, prefix=name + '.', suffix='.tmp',
+                                             delete=False) as f:
+                try:
+                    f.write(content)
+                except BaseException:
+                    f.close()
+                    os.unlink(f.name)
+                    raise
+            os.replace(f.name, path)
+            paths.append(path)
+        self._last_flush = time.monotonic()
+        return paths
+
+    def maybe_flush(self):
+        """
+        Flush to the metrics directory if one is set and the last flush is old
+        enough. Runs at the end of every page render, so it never raises
+        """
+        if not self.metrics_dir:
+            return
+        with self._flush_lock:
+            if time.monotonic() - self._last_flush < self.flush_interval:
+                return
+            try:
+                self._write(self.metrics_dir)
+            except Exception:
+                # Back off for an interval rather than retrying on every render
+                self._last_flush = time.monotonic()
+                logger.warning("Could not export spans to %s", self.metrics_dir, exc_info=True)
+
+    def reset(self):
+        """Drop every recorded span"""
+        with self._lock:
+            self._stats.clear()
+
+
+tracer = Tracer()
+
+
+# (owner, name) -> the Streamlit attribute instrument_streamlit replaced
+_originals: Dict[Tuple[object, str], Callable] = {}
+_patch_lock = threading.Lock()
+
+
+def _timed_emitter(name: str, emit: Callable) -> Callable:
+    @functools.wraps(emit)
+    def wrapper(*args, **kwargs):
+        # App chrome outside a page (the sidebar footer) isn't profiled
+        if _page.get() == BACKGROUND:
+            return emit(*args, **kwargs)
+        with tracer.span(f'emit.{name}'):
+            return emit(*args, **kwargs)
+    return wrapper
+
+
+def instrument_streamlit():
+    """
+    Time Streamlit chart/table emissions, which include Plotly serialization
+    and Styler rendering, wherever a page calls them (``st.x`` or a column's
+    ``.x``). This patches Streamlit process-wide, so the app only calls it
+    when ``SOCCER_PROFILE_EMITS`` is set. Idempotent; undo it with
+    uninstrument_streamlit()
+    """
+    import streamlit as st
+    from streamlit.delta_generator import DeltaGenerator
+    with _patch_lock:
+        for owner in (DeltaGenerator, st):
+            for name in EMITTERS:
+                if (owner, name) not in _originals:
+                    emit = _originals[(owner, name)] = getattr(owner, name)
+                    setattr(owner, name, _timed_emitter(name, emit))
+
+
+def uninstrument_streamlit():
+    """Restore the Streamlit functions instrument_streamlit replaced"""
+    with _patch_lock:
+        for (owner, name), emit in _originals.items():
+            setattr(owner, name, emit)
+        _originals.clear()
@@ -0,0 +1,122 @@
+import math
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from cache import TTLCache, frame_fingerprint
+
+# Metrics where a lower value is the better one
+LOWER_IS_BETTER = {'League Position', 'Position', 'Goals Conceded', 'Goals_Against', 'Lost'}
+
+# Metrics folded into each 0-100 team rating (whichever the data provides)
+RATING_COMPONENTS = {
+    'Attack': ['Goals Scored', 'Goals_For', 'Shots per Game'],
+    'Defense': ['Goals Conceded', 'Goals_Against', 'Clean Sheets'],
+    'Midfield': ['Possession %', 'Pass Accuracy %'],
+    'Overall': ['Points', 'Points_Per_Game']
+}
+
+# Strength / weakness wording per metric
+STRENGTH_LABELS = {
+    'Goals Scored': ("Strong attacking play", "Lacks attacking threat"),
+    'Goals Conceded': ("Solid defensive structure", "Defensive vulnerabilities"),
+    'Possession %': ("Excellent ball control", "Struggles to keep possession"),
+    'Pass Accuracy %': ("Precise passing", "Loose in possession"),
+    'Clean Sheets': ("Keeps clean sheets regularly", "Rarely keeps a clean sheet"),
+    'Shots per Game': ("Creates plenty of shots", "Few shots created"),
+    'Tackles per Game': ("Aggressive out of possession", "Passive without the ball")
+}
+
+# How many standard deviations from the league mean counts as notable
+NOTABLE_Z = 0.75
+
+QUANTILES = [0.1, 0.25, 0.5, 0.75, 0.9]
+
+_normal_cdf = np.vectorize(lambda z: 0.5 * (1 + math.erf(z / math.sqrt(2))))
+
+
+class LeagueAggregates:
+    """
+    League-wide summary of every numeric team metric for one league/season.
+
+    Means, standard deviations, quantiles, z-scores, percentiles, ratings
+    and strengths/weaknesses are all computed once, up front; the per-team
+    accessors are dictionary lookups.
+    """
+
+    def __init__(self, team_df: pd.DataFrame, league_id: str = '39', season: str = 'current'):
+        self.league_id = str(league_id)
+        self.season = str(season)
+        frame = team_df.set_index('Team')
+        self.metrics: List[str] = [
+            column for column in frame.columns if pd.api.types.is_numeric_dtype(frame[column])
+        ]
+        values = frame[self.metrics].astype(float)
+        self.mean = values.mean()
+        self.std = values.std(ddof=0)
+        self.quantiles = values.quantile(QUANTILES).T
+        self.zscores = (values - self.mean) / self.std.replace(0, np.nan)
+        self.zscores = self.zscores.fillna(0.0)
+        # Oriented so that positive always means better than the league
+        direction = pd.Series([-1.0 if m in LOWER_IS_BETTER else 1.0 for m in self.metrics], index=self.metrics)
+        self.advantage = self.zscores * direction
+        self.percentiles = (self.advantage.rank(pct=True) * 100).round(1)
+
+        ratings = {}
+        for rating, components in RATING_COMPONENTS.items():
+            present = [metric for metric in components if metric in self.metrics]
+            if present:
+                ratings[rating] = (100 * _normal_cdf(self.advantage[present].mean(axis=1).to_numpy())).round(1)
+        self.ratings = pd.DataFrame(ratings, index=values.index)
+
+        self._teams = {team: row for team, row in values.iterrows()}
+        self._strengths: Dict[str, List[str]] = {}
+        self._weaknesses: Dict[str, List[str]] = {}
+        labelled = [metric for metric in STRENGTH_LABELS if metric in self.metrics]
+        for team, row in self.advantage[labelled].iterrows():
+            self._strengths[team] = [STRENGTH_LABELS[m][0] for m in labelled if row[m] >= NOTABLE_Z]
+            self._weaknesses[team] = [STRENGTH_LABELS[m][1] for m in labelled if row[m] <= -NOTABLE_Z]
+        self._ratings = self.ratings.to_dict('index')
+        self._zscores = self.zscores.to_dict('index')
+        self._percentiles = self.percentiles.to_dict('index')
+
+    def team(self, team: str) -> pd.Series:
+        """Raw metric values for a team"""
+        return self._teams[team]
+
+    def rating(self, team: str) -> Dict[str, float]:
+        """0-100 Attack/Defense/Midfield/Overall ratings vs the league"""
+        return self._ratings[team]
+
+    def zscore(self, team: str) -> Dict[str, float]:
+        """Standard deviations from the league mean, per metric"""
+        return self._zscores[team]
+
+    def percentile(self, team: str, metrics: Optional[Sequence[str]] = None) -> Dict[str, float]:
+        """League percentile (0-100, higher is better) per metric"""
+        row = self._percentiles[team]
+        return row if metrics is None else {metric: row[metric] for metric in metrics}
+
+    def strengths(self, team: str) -> List[str]:
+        """Metrics where the team is notably better than the league"""
+        return self._strengths.get(team, [])
+
+    def weaknesses(self, team: str) -> List[str]:
+        """Metrics where the team is notably worse than the league"""
+        return self._weaknesses.get(team, [])
+
+
+# Aggregates are keyed by the content of their input, so a data refresh
+# produces a new entry and every page reading the same data shares one
+_aggregates = TTLCache(maxsize=32, ttl=3600)
+
+def get_league_aggregates(team_df: pd.DataFrame, league_id: str = '39',
+                          season: str = 'current') -> LeagueAggregates:
+    """Cached aggregates for a league/season's team stats"""
+    key = (str(league_id), str(season), frame_fingerprint(team_df))
+    aggregates = _aggregates.get(key)
+    if aggregates is None:
+        aggregates = LeagueAggregates(team_df, league_id, season)
+        _aggregates.put(key, aggregates)
+    return aggregates
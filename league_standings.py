@@ -2,58 +2,64 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import numpy as np
+import event_ingest
+from analytics_kernels import team_analytics
+from data_fetcher import SUPPORTED_LEAGUES, data_fetcher
+from form_store import get_form_store
+from instrumentation import tracer
+from paginated_table import paginated_table, zone_styles
+from position_history import get_position_history
+from refresh_scheduler import refresh_scheduler
 
 def show():
     """Display the League Standings page"""
     st.title("📊 League Standings")
     st.markdown("### Real-time League Tables and Rankings")
     
-    # Sample league data
-    sample_standings = {
-        'Position': list(range(1, 21)),
-        'Team': [
-            'Manchester City', 'Arsenal', 'Manchester United', 'Newcastle United', 
-            'Liverpool', 'Brighton', 'Aston Villa', 'Tottenham', 'Brentford', 
-            'Fulham', 'Crystal Palace', 'Chelsea', 'Wolves', 'West Ham',
-            'Leeds United', 'Everton', 'Nottingham Forest', 'Leicester City',
-            'Bournemouth', 'Southampton'
-        ],
-        'Played': [38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38],
-        'Won': [28, 26, 23, 19, 19, 18, 18, 18, 15, 16, 11, 12, 13, 14, 11, 13, 9, 11, 11, 12],
-        'Drawn': [5, 6, 6, 14, 10, 8, 7, 6, 14, 7, 12, 11, 6, 7, 10, 6, 11, 7, 9, 6],
-        'Lost': [5, 6, 9, 5, 9, 12, 13, 14, 9, 15, 15, 15, 19, 17, 17, 19, 18, 20, 18, 20],
-        'Goals_For': [89, 88, 58, 68, 75, 72, 61, 66, 58, 55, 40, 38, 31, 42, 48, 34, 38, 51, 37, 36],
-        'Goals_Against': [31, 43, 43, 33, 28, 53, 61, 40, 46, 53, 49, 47, 58, 58, 78, 57, 68, 68, 71, 73],
-        'Goal_Difference': [58, 45, 15, 35, 47, 19, 0, 26, 12, 2, -9, -9, -27, -16, -30, -23, -30, -17, -34, -37],
-        'Points': [89, 84, 75, 71, 67, 62, 61, 60, 59, 55, 45, 44, 45, 49, 43, 45, 38, 40, 42, 42]
-    }
-    
-    df_standings = pd.DataFrame(sample_standings)
-    
-    # League selection
-    leagues = ["Premier League", "La Liga", "Serie A", "Bundesliga", "Ligue 1"]
-    selected_league = st.selectbox("Select League", leagues)
+    # League and season selection; only the chosen partition is loaded
+    leagues = {name: league_id for league_id, name in SUPPORTED_LEAGUES.items() if league_id != '2'}
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        selected_league = st.selectbox("Select League", list(leagues))
+    league_id = leagues[selected_league]
+    with col2:
+        season = st.selectbox(
+            "Season", data_fetcher.available_seasons(league_id),
+            format_func=lambda s: f"{s}/{(int(s) + 1) % 100:02d}"
+        )
+    
+    # Only the current season changes, so only it is refreshed in the background
+    if season == data_fetcher.season:
+        refresh_scheduler.watch(league_id)
+    
+    # Table is derived from match results, so every column is consistent
+    df_standings = data_fetcher.fetch_league_standings(league_id, season)
+    results = data_fetcher.fetch_results(league_id, season)
     
     st.subheader(f"🏆 {selected_league} Table")
     
-    # Create a styled dataframe
-    def style_table(row):
-        if row['Position'] <= 4:  # Champions League
-            return ['background-color: #d4edda'] * len(row)
-        elif row['Position'] <= 6:  # Europa League
-            return ['background-color: #fff3cd'] * len(row)
-        elif row['Position'] >= 18:  # Relegation
-            return ['background-color: #f8d7da'] * len(row)
-        else:
-            return [''] * len(row)
-    
-    # Display table with colors
-    st.dataframe(
-        df_standings.style.apply(style_table, axis=1),
-        use_container_width=True,
-        hide_index=True
+    # Champions League, Europa League and relegation zones, styled for the shown page only
+    zones = [(1, 4, 'background-color: #d4edda'),
+             (5, 6, 'background-color: #fff3cd'),
+             (-3, -1, 'background-color: #f8d7da')]
+    paginated_table(
+        df_standings, key=f'standings_{league_id}_{season}', search_column='Team',
+        row_styles=lambda page: zone_styles(page['Position'], zones, len(df_standings))
     )
     
+    # Matches in play, when a live event feed is running for this league
+    live = event_ingest.live_ingest
+    if live is not None and league_id in live.leagues and season == data_fetcher.season:
+        live_matches = live.leagues[league_id].live_matches()
+        if len(live_matches):
+            st.markdown("#### 🔴 Live")
+            st.dataframe(live_matches, use_container_width=True, hide_index=True)
+        feed = live.stats()
+        if feed['latency_ms_p95'] is not None:
+            st.caption(f"Live feed: {feed['applied']} events, "
+                       f"p95 event-to-table latency {feed['latency_ms_p95']:.0f} ms")
+    
     # Legend
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -107,41 +113,60 @@ def show():
     # Form table
     st.subheader("📊 Detailed Statistics")
     
-    # Calculate additional metrics
-    df_standings['Win_Rate'] = (df_standings['Won'] / df_standings['Played'] * 100).round(1)
-    df_standings['Points_Per_Game'] = (df_standings['Points'] / df_standings['Played']).round(2)
-    
-    # Advanced stats table
-    advanced_stats = df_standings[['Position', 'Team', 'Points', 'Win_Rate', 'Points_Per_Game', 'Goal_Difference']].head(10)
+    # Advanced stats table; form, momentum and pace for every team in one batch
+    with tracer.span('transform.team_analytics'):
+        form = get_form_store(league_id, results, season=season)
+        form_points = form.points_matrix(5)
+        # Teams without results map to an all-NaN row
+        rows = pd.Index(form.teams).get_indexer(df_standings['Team'])
+        form_points = np.vstack([form_points, np.full((1, form_points.shape[1]), np.nan)])[rows]
+        analytics = team_analytics(
+            form_points, df_standings['Points'].to_numpy(), df_standings['Played'].to_numpy(),
+            games_total=2 * (len(df_standings) - 1), teams=df_standings['Team']
+        )
+    advanced_stats = df_standings[['Position', 'Team', 'Points', 'Win_Rate', 'Points_Per_Game', 'Goal_Difference']].join(
+        analytics[['Form_Points', 'Momentum', 'Projected_Points']], on='Team'
+    ).head(10)
     st.dataframe(advanced_stats, use_container_width=True, hide_index=True)
     
     # Position changes simulation
     st.subheader("📈 Position Trends")
-    st.info("This would show position changes over the season in a real implementation")
     
-    # Create a sample trend chart
-    import numpy as np
+    # Positions per matchweek, kept up to date from the season's results
+    with tracer.span('transform.position_history'):
+        history = get_position_history(league_id, season, results)
+    weeks_played = history.recorded_weeks.get(str(season), 0)
+    
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        trend_teams = st.multiselect(
+            "Teams",
+            df_standings['Team'].tolist(),
+            default=df_standings.head(6)['Team'].tolist()
+        )
+    with col2:
+        first_week, last_week = st.slider(
+            "Matchweeks", 1, max(weeks_played, 2), (1, max(weeks_played, 2))
+        )
     
-    weeks = list(range(1, 39))
-    top_teams = df_standings.head(6)['Team'].tolist()
+    df_trend = history.trend(trend_teams, season, first_week, last_week)
     
     fig_trends = go.Figure()
     
-    for i, team in enumerate(top_teams):
-        # Simulate position changes (in real app, this would be historical data)
-        positions = np.random.randint(1, 10, size=38)
-        positions = np.sort(positions)[::-1] if i < 3 else np.sort(positions)
-        
+    for team in trend_teams:
+        team_trend = df_trend[df_trend['Team'] == team]
         fig_trends.add_trace(go.Scatter(
-            x=weeks,
-            y=positions,
+            x=team_trend['Matchweek'],
+            y=team_trend['Position'],
             mode='lines+markers',
             name=team,
-            line=dict(width=2)
+            line=dict(width=2),
+            customdata=team_trend['Points'],
+            hovertemplate="Week %{x}: %{y} (%{customdata} pts)"
         ))
     
     fig_trends.update_layout(
-        title="League Position Over Season (Simulated)",
+        title="League Position Over Season",
         xaxis_title="Week",
         yaxis_title="Position",
         yaxis=dict(autorange="reversed", dtick=1),
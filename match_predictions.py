@@ -2,44 +2,36 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-import numpy as np
-from datetime import datetime, timedelta
+from data_fetcher import data_fetcher
+from fixture_index import get_fixture_index
+from form_store import get_form_store
+from instrumentation import tracer
+from paginated_table import paginated_table
+from prediction_engine import PoissonMatchModel
+from refresh_scheduler import refresh_scheduler
 
 def show():
     """Display the Match Predictions page"""
     st.title("🔮 Match Predictions")
     st.markdown("### AI-powered Match Outcome Predictions")
     
-    # Sample upcoming matches
-    today = datetime.now()
-    sample_matches = {
-        'Date': [today + timedelta(days=i) for i in range(1, 11)],
-        'Home_Team': [
-            'Manchester City', 'Arsenal', 'Liverpool', 'Chelsea', 'Manchester United',
-            'Tottenham', 'Newcastle', 'Brighton', 'Aston Villa', 'West Ham'
-        ],
-        'Away_Team': [
-            'Liverpool', 'Chelsea', 'Manchester United', 'Tottenham', 'Newcastle',
-            'Brighton', 'Aston Villa', 'West Ham', 'Crystal Palace', 'Fulham'
-        ],
-        'Home_Win_Prob': [65, 58, 72, 45, 55, 62, 48, 60, 52, 46],
-        'Draw_Prob': [20, 25, 18, 30, 25, 22, 28, 22, 26, 29],
-        'Away_Win_Prob': [15, 17, 10, 25, 20, 16, 24, 18, 22, 25],
-        'Predicted_Score_Home': [2, 1, 3, 1, 2, 2, 1, 2, 1, 1],
-        'Predicted_Score_Away': [1, 1, 0, 1, 1, 1, 1, 0, 1, 1]
-    }
-    
-    df_matches = pd.DataFrame(sample_matches)
-    df_matches['Date_Str'] = df_matches['Date'].dt.strftime('%Y-%m-%d')
-    df_matches['Match'] = df_matches['Home_Team'] + ' vs ' + df_matches['Away_Team']
-    df_matches['Predicted_Score'] = df_matches['Predicted_Score_Home'].astype(str) + '-' + df_matches['Predicted_Score_Away'].astype(str)
+    # Upcoming fixtures with model predictions, refreshed in the background
+    refresh_scheduler.watch('39')
+    standings = data_fetcher.fetch_league_standings()
+    fixtures = data_fetcher.fetch_fixtures()
+    if fixtures.empty:
+        st.info("No upcoming fixtures")
+        return
+    # Kickoff-sorted fixtures with per-team postings and stable ids, shared by every session
+    with tracer.span('transform.fixture_index'):
+        index = get_fixture_index(fixtures, '39', data_fetcher.season)
     
     # Filters
     st.sidebar.header("Prediction Filters")
     
     # Date range filter
-    min_date = df_matches['Date'].min().date()
-    max_date = df_matches['Date'].max().date()
+    min_date = index.first_date.date()
+    max_date = index.last_date.date()
     date_range = st.sidebar.date_input(
         "Select Date Range",
         value=(min_date, max_date),
@@ -48,24 +40,20 @@ def show():
     )
     
     # Team filter
-    all_teams = list(set(df_matches['Home_Team'].tolist() + df_matches['Away_Team'].tolist()))
-    selected_teams = st.sidebar.multiselect("Select Teams", all_teams, default=all_teams[:5])
-    
-    # Filter data
-    if date_range and len(date_range) == 2:
-        start_date, end_date = date_range
-        filtered_matches = df_matches[
-            (df_matches['Date'].dt.date >= start_date) & 
-            (df_matches['Date'].dt.date <= end_date)
-        ]
-    else:
-        filtered_matches = df_matches
+    selected_teams = st.sidebar.multiselect("Select Teams", index.teams, default=index.teams[:5])
     
-    if selected_teams:
-        filtered_matches = filtered_matches[
-            filtered_matches['Home_Team'].isin(selected_teams) | 
-            filtered_matches['Away_Team'].isin(selected_teams)
-        ]
+    # Date range by binary search, teams by their posting lists
+    start_date, end_date = date_range if date_range and len(date_range) == 2 else (None, None)
+    with tracer.span('transform.fixture_query'):
+        filtered_matches = index.rows(index.query(start_date, end_date, selected_teams))
+    
+    # Predictions only for the fixtures shown
+    with tracer.span('transform.predictions'):
+        model = PoissonMatchModel().fit(standings)
+        filtered_matches = filtered_matches.join(model.predict(filtered_matches))
+    filtered_matches['Date_Str'] = filtered_matches['Date'].dt.strftime('%Y-%m-%d')
+    filtered_matches['Predicted_Score'] = (filtered_matches['Predicted_Score_Home'].astype(str) + '-'
+                                           + filtered_matches['Predicted_Score_Away'].astype(str))
     
     # Overview metrics
     st.subheader("📊 Prediction Overview")
@@ -94,17 +82,20 @@ def show():
     
     display_df.columns = ['Date', 'Home', 'Away', 'Predicted Score', 'Home Win %', 'Draw %', 'Away Win %']
     
-    st.dataframe(display_df, use_container_width=True, hide_index=True)
+    paginated_table(display_df, key='upcoming_matches', search_column='Home')
     
     # Match selector for detailed analysis
     st.subheader("🔍 Detailed Match Analysis")
+    # Options are fixture ids, so the selection holds across reruns and refreshes
     selected_match = st.selectbox(
         "Select a match for detailed analysis:",
-        filtered_matches['Match'].tolist()
+        filtered_matches.index.tolist(),
+        format_func=index.label,
+        key='prediction_match'
     )
     
-    if selected_match:
-        match_data = filtered_matches[filtered_matches['Match'] == selected_match].iloc[0]
+    if selected_match is not None:
+        match_data = filtered_matches.loc[selected_match]
         
         col1, col2 = st.columns(2)
         
@@ -112,6 +103,7 @@ def show():
             st.markdown(f"### {match_data['Home_Team']} vs {match_data['Away_Team']}")
             st.markdown(f"**Date:** {match_data['Date_Str']}")
             st.markdown(f"**Predicted Score:** {match_data['Predicted_Score']}")
+            st.markdown(f"**Expected Goals:** {match_data['Home_xG']:.2f} - {match_data['Away_xG']:.2f}")
             
             # Probability chart
             probs = [match_data['Home_Win_Prob'], match_data['Draw_Prob'], match_data['Away_Win_Prob']]
@@ -127,21 +119,35 @@ def show():
             st.plotly_chart(fig_prob, use_container_width=True)
         
         with col2:
-            # Team form simulation (in real app, this would be actual data)
+            # Last five results from the rolling form store
             st.markdown("#### Recent Form")
+            form = get_form_store('39', data_fetcher.fetch_results(), season=data_fetcher.season)
+            home_form = form.recent(match_data['Home_Team'])
+            away_form = form.recent(match_data['Away_Team'])
             
-            home_form = np.random.choice(['W', 'D', 'L'], size=5, p=[0.6, 0.25, 0.15])
-            away_form = np.random.choice(['W', 'D', 'L'], size=5, p=[0.4, 0.3, 0.3])
-            
-            st.markdown(f"**{match_data['Home_Team']}:** {' '.join(home_form)}")
-            st.markdown(f"**{match_data['Away_Team']}:** {' '.join(away_form)}")
+            st.markdown(f"**{match_data['Home_Team']}:** {' '.join(home_form) or 'No results yet'}")
+            st.markdown(f"**{match_data['Away_Team']}:** {' '.join(away_form) or 'No results yet'}")
             
             # Key stats comparison
             st.markdown("#### Key Statistics")
+            team_rows = standings.set_index('Team')
+            
+            def key_stats(team, recent_form):
+                if team not in team_rows.index:
+                    return [None, None, None, None]
+                row = team_rows.loc[team]
+                played = max(row['Played'], 1)
+                return [
+                    round(row['Goals_For'] / played, 2),
+                    round(row['Goals_Against'] / played, 2),
+                    row['Win_Rate'],
+                    sum({'W': 3, 'D': 1}.get(result, 0) for result in recent_form)
+                ]
+            
             stats_data = {
                 'Metric': ['Goals/Game', 'Goals Conceded/Game', 'Win Rate %', 'Form Points'],
-                match_data['Home_Team']: [2.1, 0.8, 65, 13],
-                match_data['Away_Team']: [1.7, 1.2, 45, 7]
+                match_data['Home_Team']: key_stats(match_data['Home_Team'], home_form),
+                match_data['Away_Team']: key_stats(match_data['Away_Team'], away_form)
             }
             
             stats_df = pd.DataFrame(stats_data)
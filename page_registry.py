@@ -0,0 +1,64 @@
+import importlib
+import threading
+import time
+from typing import Dict, List, Optional
+
+from instrumentation import tracer
+
+
+class PageRegistry:
+    """
+    Dashboard pages by key, imported on first navigation.
+
+    A page is any module with a ``show()`` function. Registering a page only
+    records its module path, so a session that never opens a page never pays
+    for its imports (plotly, numpy, the data layer). The first import of each
+    page is timed.
+    """
+
+    def __init__(self):
+        self._pages: Dict[str, dict] = {}
+        self._modules = {}
+        self._import_times: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def register(self, key: str, label: str, module: Optional[str] = None):
+        """Add a page; module defaults to the key"""
+        self._pages[key] = {'label': label, 'module': module or key}
+
+    def labels(self) -> Dict[str, str]:
+        """Sidebar label -> page key, in registration order"""
+        return {page['label']: key for key, page in self._pages.items()}
+
+    def keys(self) -> List[str]:
+        """Registered page keys"""
+        return list(self._pages)
+
+    def load(self, key: str):
+        """Import a page module (once per process) and return it"""
+        module = self._modules.get(key)
+        if module is not None:
+            return module
+        with self._lock:
+            if key not in self._modules:
+                start = time.perf_counter()
+                self._modules[key] = importlib.import_module(self._pages[key]['module'])
+                self._import_times[key] = time.perf_counter() - start
+            return self._modules[key]
+
+    def show(self, key: str):
+        """Render a page, attributing every span inside it to the page"""
+        with tracer.page(key):
+            self.load(key).show()
+
+    def import_stats(self) -> Dict[str, float]:
+        """Cold-start import time in seconds of every page loaded so far"""
+        return dict(self._import_times)
+
+
+# Create global instance
+page_registry = PageRegistry()
+page_registry.register('player_stats', "👤 Player Statistics")
+page_registry.register('team_analysis', "🏆 Team Analysis")
+page_registry.register('league_standings', "📊 League Standings")
+page_registry.register('match_predictions', "🔮 Match Predictions")
@@ -0,0 +1,160 @@
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from cache import frame_fingerprint
+
+PAGE_SIZE = 50
+
+# (first position, last position, CSS) per table zone; negative positions
+# count from the bottom, so -3 is the third-from-last place
+Zone = Tuple[int, int, str]
+
+
+def zone_styles(positions: Sequence[int], zones: Sequence[Zone], table_size: int) -> np.ndarray:
+    """CSS for each row from its league position, one vectorized pass for all rows"""
+    positions = np.asarray(positions)
+    bounds = [(first if first > 0 else table_size + 1 + first, last if last > 0 else table_size + 1 + last, css)
+              for first, last, css in zones]
+    return np.select([(positions >= first) & (positions <= last) for first, last, _ in bounds],
+                     [css for _, _, css in bounds], default='')
+
+
+class TableView:
+    """
+    Sorted orders over one frame, for server-side sorting and paging.
+
+    Each (column, direction) is sorted once, lazily, and kept. A query
+    walks that order keeping only the selected rows, so re-sorting or
+    paging a filtered subset is a vectorized mask rather than a new sort.
+    Only the rows of the requested page are ever materialized.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        self._orders: Dict[Tuple[str, bool], np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def order(self, column: str, ascending: bool = True) -> np.ndarray:
+        """Row positions sorted by a column (stable; missing values last)"""
+        key = (column, ascending)
+        with self._lock:
+            order = self._orders.get(key)
+            if order is None:
+                values = self.frame[column].reset_index(drop=True)
+                order = self._orders[key] = values.sort_values(
+                    ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+            return order
+
+    def _search(self, rows: np.ndarray, column: str, text: str) -> np.ndarray:
+        values = self.frame[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Match the (few) categories, then compare integer codes
+            hits = values.cat.categories.str.contains(text, case=False, regex=False)
+            return rows[np.isin(values.cat.codes.to_numpy()[rows], np.flatnonzero(hits))]
+        matched = values.iloc[rows].astype(str).str.contains(text, case=False, regex=False).to_numpy()
+        return rows[matched]
+
+    def query(self, rows: Optional[Sequence[int]] = None, sort_by: Optional[str] = None,
+              ascending: bool = True, search: Optional[str] = None,
+              search_column: Optional[str] = None) -> np.ndarray:
+        """Positions of the selected rows, searched and sorted"""
+        rows = np.arange(len(self.frame)) if rows is None else np.asarray(rows, dtype=np.int64)
+        if search and search_column:
+            rows = self._search(rows, search_column, search)
+        if sort_by is None:
+            return rows
+        selected = np.zeros(len(self.frame), dtype=bool)
+        selected[rows] = True
+        order = self.order(sort_by, ascending)
+        return order[selected[order]]
+
+    def page(self, positions: np.ndarray, page: int, page_size: int = PAGE_SIZE,
+             columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """One page of rows, in query order"""
+        start = (page - 1) * page_size
+        frame = self.frame.iloc[positions[start:start + page_size]]
+        if columns is not None:
+            frame = frame[columns]
+        # A categorical column would otherwise ship every category with the page
+        categorical = [column for column, dtype in frame.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)]
+        if categorical:
+            frame = frame.assign(**{column: frame[column].cat.remove_unused_categories() for column in categorical})
+        return frame
+
+
+_views: Dict[str, tuple] = {}
+_views_lock = threading.Lock()
+
+def get_table_view(key: str, frame: pd.DataFrame) -> TableView:
+    """Table view for a frame, reused while the same content is shown under key"""
+    with _views_lock:
+        view, source, fingerprint = _views.get(key, (None, None, None))
+        # Fetched frames are new objects on every rerun, so fall back to content
+        if source is not frame:
+            current = frame_fingerprint(frame)
+            if current != fingerprint:
+                view = TableView(frame)
+            _views[key] = (view, frame, current)
+        return view
+
+
+def paginated_table(frame: pd.DataFrame, key: str, rows: Optional[Sequence[int]] = None,
+                    columns: Optional[List[str]] = None, page_size: int = PAGE_SIZE,
+                    search_column: Optional[str] = None,
+                    row_styles: Optional[Callable[[pd.DataFrame], np.ndarray]] = None,
+                    decimals: Optional[int] = None):
+    """
+    Show a frame one page at a time, sorted and searched on the server.
+
+    ``rows`` selects row positions of ``frame`` (e.g. from an index
+    lookup), so a shared frame can back many filtered tables.
+    ``row_styles`` maps the rows of the page to one CSS string each. Tables
+    that fit on one page are sent whole, and the browser sorts them.
+    """
+    view = get_table_view(key, frame)
+    columns = list(columns if columns is not None else frame.columns)
+    total = len(view) if rows is None else len(rows)
+    sort_by, ascending, search = None, True, None
+
+    if total > page_size:
+        sort_col, order_col, search_col, page_col = st.columns([2, 1, 2, 1])
+        with sort_col:
+            sort_by = st.selectbox("Sort by", ['—'] + columns, key=f'{key}_sort')
+            sort_by = None if sort_by == '—' else sort_by
+        with order_col:
+            ascending = st.radio("Order", ['Asc', 'Desc'], horizontal=True, key=f'{key}_order') == 'Asc'
+        if search_column:
+            with search_col:
+                search = st.text_input(f"Search {search_column}", key=f'{key}_search').strip()
+
+    positions = view.query(rows, sort_by, ascending, search, search_column)
+    pages = max(1, -(-len(positions) // page_size))
+    page = 1
+    if total > page_size:
+        if st.session_state.get(f'{key}_page', 1) > pages:
+            st.session_state[f'{key}_page'] = 1
+        with page_col:
+            page = st.number_input(f"Page (of {pages})", 1, pages, key=f'{key}_page')
+
+    shown = view.page(positions, page, page_size, columns)
+    if decimals is not None:
+        shown = shown.round(decimals)
+    data = shown
+    if row_styles is not None:
+        styles = row_styles(shown)
+        data = shown.style.apply(
+            lambda part: pd.DataFrame(np.repeat(styles[:, None], part.shape[1], axis=1),
+                                      index=part.index, columns=part.columns),
+            axis=None
+        )
+    st.dataframe(data, use_container_width=True, hide_index=True)
+    if pages > 1:
+        first = (page - 1) * page_size + 1
+        st.caption(f"Rows {first:,}–{min(first + page_size - 1, len(positions)):,} of {len(positions):,}")
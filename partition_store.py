@@ -0,0 +1,236 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import pandas as pd
+
+Partition = Tuple[str, str]  # (league_id, season)
+
+_MISSING = object()
+
+
+def _nbytes(value: Any) -> int:
+    """Resident size of a cached value"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    return sys.getsizeof(value)
+
+
+class PartitionStore:
+    """
+    Resident set of (league, season) partitions under a memory budget.
+
+    A partition holds the data of every partitioned endpoint for one league
+    and season. Each endpoint's value is loaded on first use and expires
+    after that endpoint's TTL. Partitions are kept in LRU order, and once
+    the resident bytes exceed ``budget_bytes`` the coldest partitions are
+    evicted whole. The partition touched last is never evicted, so a single
+    oversized partition still works. Pinned partitions (e.g. ones holding
+    live data) neither expire nor get evicted until unpinned.
+    """
+
+    def __init__(self, budget_bytes: int = 32 * 2**20,
+                 timer: Callable[[], float] = time.monotonic):
+        if budget_bytes < 1:
+            raise ValueError("budget_bytes must be at least 1")
+        self.budget_bytes = budget_bytes
+        self._timer = timer
+        # partition -> {endpoint: (value, expires_at, nbytes)}
+        self._partitions: "OrderedDict[Partition, Dict[str, tuple]]" = OrderedDict()
+        self._nbytes = 0
+        self._pinned = set()
+        self._lock = threading.RLock()
+        self._loads = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _entry(self, partition: Partition, endpoint: str) -> Optional[tuple]:
+        entries = self._partitions.get(partition)
+        entry = entries.get(endpoint) if entries else None
+        if (entry is not None and entry[1] is not None and entry[1] <= self._timer()
+                and partition not in self._pinned):
+            self._drop(partition, endpoint)
+            self._expirations += 1
+            return None
+        return entry
+
+    def _drop(self, partition: Partition, endpoint: str):
+        entries = self._partitions[partition]
+        self._nbytes -= entries.pop(endpoint)[2]
+        if not entries:
+            del self._partitions[partition]
+
+    def get(self, partition: Partition, endpoint: str, default: Any = None) -> Any:
+        """Return an endpoint's value for a partition, marking the partition hot"""
+        with self._lock:
+            entry = self._entry(partition, endpoint)
+            if entry is None:
+                return default
+            self._partitions.move_to_end(partition)
+            return entry[0]
+
+    def peek(self, partition: Partition, endpoint: str, default: Any = None) -> Any:
+        """Like get, but without touching LRU order"""
+        with self._lock:
+            entry = self._entry(partition, endpoint)
+            return default if entry is None else entry[0]
+
+    def put(self, partition: Partition, endpoint: str, value: Any, ttl: Optional[float] = None):
+        """Store an endpoint's value in a partition, then evict down to the budget"""
+        expires_at = self._timer() + ttl if ttl is not None else None
+        nbytes = _nbytes(value)
+        with self._lock:
+            if endpoint in self._partitions.get(partition, {}):
+                self._drop(partition, endpoint)
+            self._partitions.setdefault(partition, {})[endpoint] = (value, expires_at, nbytes)
+            self._partitions.move_to_end(partition)
+            self._nbytes += nbytes
+            self._loads += 1
+            if self._nbytes > self.budget_bytes:
+                self._evict()
+
+    def _evict(self):
+        # Coldest first, skipping pinned partitions and the one just touched
+        for cold in list(self._partitions)[:-1]:
+            if self._nbytes <= self.budget_bytes:
+                break
+            if cold in self._pinned:
+                continue
+            entries = self._partitions.pop(cold)
+            self._nbytes -= sum(entry[2] for entry in entries.values())
+            self._evictions += 1
+
+    def pin(self, partition: Partition):
+        """Keep a partition's entries from expiring or being evicted"""
+        with self._lock:
+            self._pinned.add(partition)
+
+    def unpin(self, partition: Partition):
+        with self._lock:
+            self._pinned.discard(partition)
+
+    def is_pinned(self, partition: Partition) -> bool:
+        with self._lock:
+            return partition in self._pinned
+
+    def invalidate(self, partition: Partition, endpoint: Optional[str] = None) -> bool:
+        """Drop one endpoint of a partition, or the whole partition"""
+        with self._lock:
+            entries = self._partitions.get(partition)
+            if not entries or (endpoint is not None and endpoint not in entries):
+                return False
+            for name in [endpoint] if endpoint is not None else list(entries):
+                self._drop(partition, name)
+            return True
+
+    def clear(self, endpoint: Optional[str] = None):
+        """Drop one endpoint from every partition, or everything"""
+        with self._lock:
+            for partition in list(self._partitions):
+                self.invalidate(partition, endpoint)
+
+    def resident(self) -> List[Dict[str, Any]]:
+        """Loaded partitions, coldest first"""
+        with self._lock:
+            return [{
+                'league_id': league_id,
+                'season': season,
+                'endpoints': sorted(entries),
+                'bytes': sum(entry[2] for entry in entries.values())
+            } for (league_id, season), entries in self._partitions.items()]
+
+    def stats(self) -> Dict[str, Any]:
+        """Residency and eviction counters for monitoring"""
+        with self._lock:
+            return {
+                'partitions': len(self._partitions),
+                'bytes': self._nbytes,
+                'budget_bytes': self.budget_bytes,
+                'loads': self._loads,
+                'evictions': self._evictions,
+                'expirations': self._expirations
+            }
+
+    def endpoint(self, name: str, ttl: Optional[float] = None) -> 'PartitionCache':
+        """A TTLCache-compatible view of one endpoint across all partitions"""
+        return PartitionCache(self, name, ttl)
+
+
+class PartitionCache:
+    """
+    One endpoint's slice of a PartitionStore, behind the TTLCache interface.
+
+    Keys are the fetcher's cache keys, i.e. sorted (name, value) pairs that
+    include ``league_id`` and ``season``; they map to the partition.
+    """
+
+    def __init__(self, store: PartitionStore, endpoint: str, ttl: Optional[float] = None):
+        self.store = store
+        self.endpoint = endpoint
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _partition(key: Hashable) -> Optional[Partition]:
+        """The key's (league, season), or None if it doesn't name one"""
+        params = dict(key)
+        if 'league_id' not in params or 'season' not in params:
+            return None
+        return str(params['league_id']), str(params['season'])
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default on a miss"""
+        partition = self._partition(key)
+        value = default if partition is None else self.store.get(partition, self.endpoint, default)
+        with self._lock:
+            if value is default:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Like get, but without touching LRU order or the hit/miss counters"""
+        partition = self._partition(key)
+        return default if partition is None else self.store.peek(partition, self.endpoint, default)
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store value in its partition"""
+        partition = self._partition(key)
+        if partition is None:
+            raise ValueError(f"{self.endpoint} keys need a league_id and season: {key!r}")
+        self.store.put(partition, self.endpoint, value, self.ttl if ttl is None else ttl)
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop this endpoint's entry for one partition"""
+        partition = self._partition(key)
+        return partition is not None and self.store.invalidate(partition, self.endpoint)
+
+    def clear(self):
+        """Drop this endpoint from every partition"""
+        self.store.clear(self.endpoint)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.peek(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return sum(self.endpoint in row['endpoints'] for row in self.store.resident())
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters plus the shared store's residency"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            hits, misses = self._hits, self._misses
+        return {
+            'size': len(self),
+            'ttl': self.ttl,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'store': self.store.stats()
+        }
+
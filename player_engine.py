@@ -0,0 +1,243 @@
+import threading
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from cache import TTLCache
+from data_fetcher import CACHE_POLICY, SoccerDataFetcher, data_fetcher
+
+# Columns stored as categoricals and indexed for equality filters
+INDEXED_COLUMNS = ['League', 'Team', 'Position', 'Season']
+
+# Raw counting stats, stored in the smallest integer type that fits
+COUNT_COLUMNS = ['Matches', 'Minutes', 'Goals', 'Assists']
+
+# Metrics shown on player radars, ranked within a peer group
+RADAR_METRICS = ['Goals', 'Assists', 'Matches', 'Goals_per_Match', 'Assists_per_Match',
+                 'Goals_per_90', 'Assists_per_90']
+
+# Players are ranked against others in the same league, position and season
+PEER_COLUMNS = ('League', 'Position', 'Season')
+
+FilterValue = Union[None, str, Sequence[str]]
+
+
+def _compact_ints(values: pd.Series) -> pd.Series:
+    return pd.to_numeric(values.fillna(0), downcast='integer')
+
+
+class PlayerStore:
+    """
+    Typed, columnar store of player season stats.
+
+    Team/League/Position/Season are categoricals, counting stats are compact
+    ints, and per-match and per-90 rates are computed once at load time. Each
+    categorical column gets an inverted index (category -> sorted row
+    positions) and minutes a sorted index, so a filter is a few index
+    lookups and intersections rather than a scan of every row.
+    """
+
+    def __init__(self, players: pd.DataFrame):
+        frame = players.reset_index(drop=True).copy()
+        for column in INDEXED_COLUMNS:
+            if column not in frame:
+                frame[column] = 'Unknown'
+            frame[column] = frame[column].astype('category')
+        if 'Minutes' not in frame:
+            frame['Minutes'] = frame['Matches'] * 90
+        for column in COUNT_COLUMNS:
+            frame[column] = _compact_ints(frame[column])
+
+        matches = frame['Matches'].to_numpy(dtype=np.float32)
+        nineties = frame['Minutes'].to_numpy(dtype=np.float32) / 90
+        goals = frame['Goals'].to_numpy(dtype=np.float32)
+        assists = frame['Assists'].to_numpy(dtype=np.float32)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            frame['Goal_Involvement'] = _compact_ints(frame['Goals'].astype(np.int32) + frame['Assists'])
+            frame['Goals_per_Match'] = np.where(matches > 0, goals / matches, 0).astype(np.float32)
+            frame['Assists_per_Match'] = np.where(matches > 0, assists / matches, 0).astype(np.float32)
+            frame['Goals_per_90'] = np.where(nineties > 0, goals / nineties, 0).astype(np.float32)
+            frame['Assists_per_90'] = np.where(nineties > 0, assists / nineties, 0).astype(np.float32)
+        self.frame = frame
+
+        self._indexes: Dict[str, Dict[str, np.ndarray]] = {
+            column: self._build_index(frame[column]) for column in INDEXED_COLUMNS
+        }
+        self._minutes = frame['Minutes'].to_numpy()
+        self._minutes_order = np.argsort(self._minutes, kind='stable')
+        self._minutes_sorted = self._minutes[self._minutes_order]
+
+    @staticmethod
+    def _build_index(column: pd.Series) -> Dict[str, np.ndarray]:
+        codes = column.cat.codes.to_numpy()
+        order = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[order], np.arange(len(column.cat.categories) + 1))
+        return {
+            category: order[bounds[i]:bounds[i + 1]]
+            for i, category in enumerate(column.cat.categories)
+        }
+
+    @property
+    def max_minutes(self) -> int:
+        """Most minutes played by any player"""
+        return int(self._minutes_sorted[-1]) if len(self._minutes_sorted) else 0
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def _rows_for(self, column: str, value: FilterValue) -> np.ndarray:
+        values = [value] if isinstance(value, str) else list(value)
+        index = self._indexes[column]
+        parts = [index[v] for v in values if v in index]
+        if not parts:
+            return np.empty(0, dtype=np.intp)
+        return parts[0] if len(parts) == 1 else np.sort(np.concatenate(parts))
+
+    def select(self, league: FilterValue = None, team: FilterValue = None,
+               position: FilterValue = None, season: FilterValue = None,
+               min_minutes: int = 0) -> np.ndarray:
+        """Sorted row positions matching every given filter"""
+        candidates: List[np.ndarray] = []
+        for column, value in (('League', league), ('Team', team),
+                              ('Position', position), ('Season', season)):
+            if value is not None:
+                candidates.append(self._rows_for(column, value))
+        if not candidates:
+            if min_minutes <= 0:
+                return np.arange(len(self.frame))
+            start = np.searchsorted(self._minutes_sorted, min_minutes, side='left')
+            return np.sort(self._minutes_order[start:])
+        # Intersect smallest first so the work shrinks as fast as possible
+        candidates.sort(key=len)
+        rows = candidates[0]
+        for other in candidates[1:]:
+            rows = np.intersect1d(rows, other, assume_unique=True)
+        if min_minutes > 0:
+            rows = rows[self._minutes[rows] >= min_minutes]
+        return rows
+
+    def filter(self, league: FilterValue = None, team: FilterValue = None,
+               position: FilterValue = None, season: FilterValue = None,
+               min_minutes: int = 0) -> pd.DataFrame:
+        """Players matching every given filter, as an independent frame"""
+        rows = self.select(league, team, position, season, min_minutes)
+        return self.frame.take(rows)
+
+    def options(self, column: str, **filters) -> List[str]:
+        """Values of an indexed column present among players matching filters"""
+        if not filters:
+            return [value for value, rows in self._indexes[column].items() if len(rows)]
+        rows = self.select(**filters)
+        codes = np.unique(self.frame[column].cat.codes.to_numpy()[rows])
+        return list(self.frame[column].cat.categories[codes[codes >= 0]])
+
+    def memory_usage(self) -> int:
+        """Bytes held by the columnar frame"""
+        return int(self.frame.memory_usage(deep=True).sum())
+
+
+class PercentileTable:
+    """
+    Percentile rank (0-100) of every player on every radar metric within
+    their peer group.
+
+    All groups are ranked in one grouped pass. On refresh, each group's
+    contents are hashed, and only groups whose players or values changed
+    are re-ranked; the ranks of the others are carried over.
+    """
+
+    def __init__(self, metrics: Sequence[str] = RADAR_METRICS,
+                 peers: Sequence[str] = PEER_COLUMNS):
+        self.metrics = list(metrics)
+        self.peers = list(peers)
+        self.ranks = pd.DataFrame(columns=self.metrics, dtype=np.float32)
+        self.last_refresh = {'groups': 0, 'recomputed': 0}
+        # Peer group -> (content hash, ranks of its rows in row-hash order)
+        self._groups: Dict[tuple, tuple] = {}
+
+    def refresh(self, frame: pd.DataFrame) -> 'PercentileTable':
+        """Bring the table up to date with frame, re-ranking changed groups only"""
+        n = len(frame)
+        if n == 0:
+            self.ranks = pd.DataFrame(columns=self.metrics, index=frame.index, dtype=np.float32)
+            self._groups = {}
+            return self
+        keys = frame[self.peers]
+        # Players missing a peer key (e.g. no listed position) form their own group
+        group_ids = keys.groupby(self.peers, observed=True, sort=False, dropna=False).ngroup().to_numpy()
+        n_groups = int(group_ids.max()) + 1
+        # A row's rank depends only on its values and its group's values, so
+        # hashing the metric values alone is enough to detect changes
+        row_hash = pd.util.hash_pandas_object(frame[self.metrics], index=False).to_numpy()
+        # Order-independent group hash: wrapping sum of row hashes plus size
+        group_hash = np.zeros(n_groups, dtype=np.uint64)
+        np.add.at(group_hash, group_ids, row_hash)
+        group_size = np.bincount(group_ids, minlength=n_groups)
+        _, first_rows = np.unique(group_ids, return_index=True)
+        # NaN never equals itself, so it would never match the previous refresh's label
+        labels = [tuple(None if pd.isna(value) else value for value in label)
+                  for label in keys.iloc[first_rows].itertuples(index=False, name=None)]
+
+        order = np.lexsort((row_hash, group_ids))
+        bounds = np.searchsorted(group_ids[order], np.arange(n_groups + 1))
+        ranks = np.empty((n, len(self.metrics)), dtype=np.float32)
+        signatures = [(int(group_hash[g]), int(group_size[g])) for g in range(n_groups)]
+        stale = np.array([self._groups.get(labels[g], (None,))[0] != signatures[g]
+                          for g in range(n_groups)])
+
+        stale_rows = stale[group_ids]
+        if stale_rows.any():
+            subset = frame.loc[stale_rows, self.peers + self.metrics]
+            ranked = subset.groupby(self.peers, observed=True, dropna=False)[self.metrics].rank(pct=True) * 100
+            ranks[stale_rows] = ranked.to_numpy(dtype=np.float32)
+
+        groups = {}
+        for g, label in enumerate(labels):
+            rows = order[bounds[g]:bounds[g + 1]]
+            if stale[g]:
+                groups[label] = (signatures[g], ranks[rows])
+            else:
+                groups[label] = self._groups[label]
+                ranks[rows] = groups[label][1]
+        self._groups = groups
+        self.ranks = pd.DataFrame(ranks.round(1), columns=self.metrics, index=frame.index)
+        self.last_refresh = {'groups': n_groups, 'recomputed': int(stale.sum())}
+        return self
+
+    def lookup(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Percentiles for the players (rows) of a filtered store frame"""
+        ranks = self.ranks.loc[frame.index]
+        ranks.insert(0, 'Player', frame['Player'].to_numpy())
+        return ranks.reset_index(drop=True)
+
+
+# Stores are rebuilt when the cached player data would have expired anyway
+_stores = TTLCache(maxsize=4, ttl=CACHE_POLICY['fetch_players'][1])
+
+def get_player_store(fetcher: Optional[SoccerDataFetcher] = None) -> PlayerStore:
+    """Process-wide player store for the fetcher's current season"""
+    fetcher = fetcher or data_fetcher
+    key = (id(fetcher), fetcher.season)
+    store = _stores.get(key)
+    if store is None:
+        store = PlayerStore(fetcher.fetch_players())
+        _stores.put(key, store)
+    return store
+
+
+# Percentile tables outlive the stores, so a reload only re-ranks what changed
+_percentiles: Dict[tuple, tuple] = {}
+_percentiles_lock = threading.Lock()
+
+def get_percentile_table(store: PlayerStore, peers: Sequence[str] = PEER_COLUMNS) -> PercentileTable:
+    """Percentile table for a store, refreshed if the store was reloaded"""
+    key = tuple(peers)
+    with _percentiles_lock:
+        table, source = _percentiles.get(key, (None, None))
+        if table is None:
+            table = PercentileTable(peers=peers)
+        if source is not store:
+            table.refresh(store.frame)
+            _percentiles[key] = (table, store)
+        return table
@@ -1,33 +1,51 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
+from player_engine import PEER_COLUMNS, get_percentile_table, get_player_store
+from instrumentation import tracer
+from paginated_table import paginated_table
+from similarity_index import get_similarity_index
+from visualizations import viz
+
+# Players drawn on the overview charts; the tables below page through the rest
+CHART_PLAYERS = 50
+TOP_SCORERS = 20
 
 def show():
     """Display the Player Statistics page"""
     st.title("👤 Player Statistics")
     st.markdown("### Comprehensive Player Performance Analytics")
     
-    # Sample data for demonstration
-    sample_players = {
-        'Player': ['Lionel Messi', 'Cristiano Ronaldo', 'Kylian Mbappé', 'Erling Haaland', 'Neymar Jr'],
-        'Goals': [30, 28, 35, 42, 25],
-        'Assists': [15, 8, 12, 10, 18],
-        'Matches': [35, 32, 38, 40, 30],
-        'Team': ['PSG', 'Al Nassr', 'PSG', 'Man City', 'Al Hilal']
-    }
-    
-    df_players = pd.DataFrame(sample_players)
+    # Typed, indexed player store shared by every session
+    store = get_player_store()
     
     # Sidebar filters
     st.sidebar.header("Player Filters")
-    selected_team = st.sidebar.selectbox("Select Team", ["All"] + list(df_players['Team'].unique()))
+    # One season by default: the store holds every season, and a player's
+    # seasons would otherwise be summed and charted side by side
+    seasons = sorted(store.options('Season'), reverse=True)
+    selected_season = st.sidebar.selectbox("Select Season", seasons + ["All"])
+    season = None if selected_season == "All" else selected_season
+    selected_league = st.sidebar.selectbox("Select League", ["All"] + store.options('League'))
+    league = None if selected_league == "All" else selected_league
+    team_options = store.options('Team', league=league) if league else store.options('Team')
+    selected_team = st.sidebar.selectbox("Select Team", ["All"] + team_options)
+    selected_position = st.sidebar.selectbox("Select Position", ["All"] + store.options('Position'))
+    min_minutes = st.sidebar.slider("Minimum Minutes", 0, store.max_minutes, 0, step=90)
     
-    # Filter data based on selection
-    if selected_team != "All":
-        filtered_df = df_players[df_players['Team'] == selected_team]
-    else:
-        filtered_df = df_players
+    # Filter through the store's indexes
+    with tracer.span('transform.filter'):
+        filtered_df = store.filter(
+            league=league,
+            season=season,
+            team=None if selected_team == "All" else selected_team,
+            position=None if selected_position == "All" else selected_position,
+            min_minutes=min_minutes
+        )
+    
+    if filtered_df.empty:
+        st.warning("No players match the selected filters")
+        return
     
     # Display metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -43,32 +61,41 @@ def show():
     
     # Player statistics table
     st.subheader("📊 Player Performance Table")
-    st.dataframe(filtered_df, use_container_width=True)
+    # Pages of the store's own frame; filtered_df's index holds the store row positions
+    paginated_table(
+        store.frame, key='players', rows=filtered_df.index, search_column='Player',
+        columns=['Player', 'Team', 'League', 'Position', 'Matches', 'Minutes', 'Goals', 'Assists']
+    )
     
     # Visualizations
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("⚽ Goals vs Assists")
+        # Plotly draws one trace per colour, so colour by position (a handful)
+        # rather than team (one legend entry per club)
+        with tracer.span('transform.top_players'):
+            top_players = filtered_df.nlargest(CHART_PLAYERS, ['Goal_Involvement', 'Minutes'])
         fig_scatter = px.scatter(
-            filtered_df, 
+            top_players, 
             x='Goals', 
             y='Assists', 
             hover_name='Player',
-            color='Team',
+            hover_data=['Team'],
+            color='Position',
             size='Matches',
-            title="Player Goals vs Assists"
+            title=f"Goals vs Assists (top {len(top_players)} by goal involvement)"
         )
         st.plotly_chart(fig_scatter, use_container_width=True)
     
     with col2:
         st.subheader("🏆 Top Scorers")
         fig_bar = px.bar(
-            filtered_df.sort_values('Goals', ascending=False),
+            filtered_df.nlargest(TOP_SCORERS, 'Goals'),
             x='Player',
             y='Goals',
-            color='Team',
-            title="Goals by Player"
+            hover_data=['Team'],
+            title=f"Top {min(TOP_SCORERS, len(filtered_df))} Scorers"
         )
         fig_bar.update_layout(xaxis_tickangle=45)
         st.plotly_chart(fig_bar, use_container_width=True)
@@ -76,51 +103,50 @@ def show():
     # Additional statistics
     st.subheader("📈 Detailed Statistics")
     
-    # Calculate additional metrics
-    filtered_df['Goals_per_Match'] = filtered_df['Goals'] / filtered_df['Matches']
-    filtered_df['Assists_per_Match'] = filtered_df['Assists'] / filtered_df['Matches']
-    filtered_df['Goal_Involvement'] = filtered_df['Goals'] + filtered_df['Assists']
+    # Derived metrics are precomputed by the player store
+    display_cols = ['Player', 'Team', 'Goals', 'Assists', 'Goal_Involvement', 'Goals_per_Match',
+                    'Assists_per_Match', 'Goals_per_90', 'Assists_per_90']
+    paginated_table(store.frame, key='player_rates', rows=filtered_df.index, search_column='Player',
+                    columns=display_cols, decimals=2)
+    
+    # Performance radar: percentile ranks within a peer group, precomputed per store
+    st.subheader("🎯 Player Performance Radar")
+    peer_scope = st.radio("Compare against", ["League peers", "All leagues"], horizontal=True)
+    peers = PEER_COLUMNS if peer_scope == "League peers" else ('Position', 'Season')
+    with tracer.span('transform.percentiles'):
+        percentiles = get_percentile_table(store, peers).lookup(filtered_df)
     
-    # Display enhanced table
-    display_cols = ['Player', 'Team', 'Goals', 'Assists', 'Goal_Involvement', 'Goals_per_Match', 'Assists_per_Match']
-    st.dataframe(
-        filtered_df[display_cols].round(2),
-        use_container_width=True
+    selected_players = st.multiselect(
+        "Select Players for Radar Chart",
+        filtered_df['Player'].unique().tolist(),
+        default=filtered_df['Player'].head(1).tolist(),
+        max_selections=4
     )
     
-    # Performance radar chart for selected player
-    st.subheader("🎯 Player Performance Radar")
-    selected_player = st.selectbox("Select Player for Radar Chart", filtered_df['Player'].tolist())
-    
-    if selected_player:
-        player_data = filtered_df[filtered_df['Player'] == selected_player].iloc[0]
-        
-        # Normalize data for radar chart (0-100 scale)
-        categories = ['Goals', 'Assists', 'Matches', 'Goals_per_Match', 'Assists_per_Match']
-        values = [
-            (player_data['Goals'] / filtered_df['Goals'].max()) * 100,
-            (player_data['Assists'] / filtered_df['Assists'].max()) * 100,
-            (player_data['Matches'] / filtered_df['Matches'].max()) * 100,
-            (player_data['Goals_per_Match'] / filtered_df['Goals_per_Match'].max()) * 100,
-            (player_data['Assists_per_Match'] / filtered_df['Assists_per_Match'].max()) * 100
-        ]
-        
-        fig_radar = go.Figure()
-        fig_radar.add_trace(go.Scatterpolar(
-            r=values,
-            theta=categories,
-            fill='toself',
-            name=selected_player
-        ))
-        
-        fig_radar.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 100]
-                )),
-            showlegend=True,
-            title=f"Performance Radar: {selected_player}"
+    if selected_players:
+        fig_radar = viz.create_player_comparison_radar(percentiles, selected_players)
+        st.plotly_chart(fig_radar, use_container_width=True)
+        st.caption(f"Percentile rank among players with the same {', '.join(p.lower() for p in peers)}")
+    
+    # Scouting: nearest neighbours over standardized player profiles, across all leagues
+    st.subheader("🔍 Similar Players")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        target = st.selectbox("Find players like", filtered_df['Player'].unique().tolist())
+    with col2:
+        same_position = st.checkbox("Same position only", value=True)
+    with col3:
+        max_age = st.slider("Maximum Age", 16, 45, 45)
+    
+    target_row = filtered_df.index[filtered_df['Player'] == target][0]
+    with tracer.span('transform.similarity'):
+        similar = get_similarity_index(store).search(
+            int(target_row),
+            k=10,
+            position=filtered_df.loc[target_row, 'Position'] if same_position else None,
+            max_age=max_age if max_age < 45 else None
         )
-        
-        st.plotly_chart(fig_radar, use_container_width=True)
\ No newline at end of file
+    if similar.empty:
+        st.info("No comparable players match these filters")
+    else:
+        st.dataframe(similar, use_container_width=True, hide_index=True)
@@ -0,0 +1,252 @@
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from cache import frame_fingerprint
+from standings_engine import StandingsEngine
+
+HISTORY_DIR = os.environ.get(
+    'SOCCER_HISTORY_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.snapshots', 'position_history')
+)
+
+
+def _int_dtype(limit: int) -> np.dtype:
+    """Narrowest signed integer dtype, int16 at least, that holds 0..limit"""
+    return np.promote_types(np.int16, np.min_scalar_type(-max(int(limit), 1)))
+
+
+class PositionHistory:
+    """
+    Team x matchweek x season positions and points for one league.
+
+    Positions and points live in two integer blocks shaped (seasons,
+    matchweeks, teams), so any team / week range / season slice is a view.
+    Each block's dtype is the narrowest (int16 or wider) that holds the
+    largest position or points total, and is widened as the league grows.
+    The week axis grows with the longest season ingested. A position of 0
+    means "no data" (not yet played, or not in the league that season).
+    Blocks are persisted as ``.npy`` files and reopened memory-mapped.
+    """
+
+    def __init__(self, league_id: str, teams: Sequence[str] = (), max_weeks: int = 38,
+                 directory: Optional[str] = None):
+        self.league_id = str(league_id)
+        self.teams: List[str] = list(teams)
+        self.seasons: List[str] = []
+        self.max_weeks = max_weeks
+        self.directory = directory
+        self.positions = np.zeros((0, max_weeks, len(self.teams)), dtype=_int_dtype(len(self.teams)))
+        self.points = np.zeros((0, max_weeks, len(self.teams)), dtype=_int_dtype(3 * max_weeks))
+        self.recorded_weeks: Dict[str, int] = {}
+        self._team_index = {team: i for i, team in enumerate(self.teams)}
+        # In-memory engines and fingerprints of the results they have seen
+        self._engines: Dict[str, StandingsEngine] = {}
+        self._applied: Dict[str, set] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    def _resize(self, seasons: int, teams: int, weeks: Optional[int] = None):
+        self.max_weeks = max(self.max_weeks, weeks or 0)
+
+        def grow(block, limit):
+            dtype = np.promote_types(block.dtype, _int_dtype(limit))
+            grown = np.zeros((seasons, self.max_weeks, teams), dtype=dtype)
+            grown[:block.shape[0], :block.shape[1], :block.shape[2]] = block
+            return grown
+        self.positions = grow(self.positions, teams)
+        self.points = grow(self.points, 3 * self.max_weeks)
+
+    def _ensure(self, season: str, teams: Sequence[str]):
+        new_teams = [team for team in teams if team not in self._team_index]
+        new_season = season not in self.seasons
+        if not new_teams and not new_season:
+            return
+        for team in new_teams:
+            self._team_index[team] = len(self.teams)
+            self.teams.append(team)
+        if new_season:
+            self.seasons.append(season)
+            self.recorded_weeks[season] = 0
+        self._resize(len(self.seasons), len(self.teams))
+        if self.directory:
+            self.save()
+
+    def record_matchweek(self, season: str, matchweek: int, teams: Sequence[str],
+                         positions: np.ndarray, points: np.ndarray):
+        """Store one matchweek's positions and points (teams in the given order)"""
+        if not 1 <= matchweek <= self.max_weeks:
+            raise ValueError(f"Matchweek {matchweek} is outside 1..{self.max_weeks}")
+        with self._lock:
+            self._ensure(season, teams)
+            s = self.seasons.index(season)
+            idx = [self._team_index[team] for team in teams]
+            self.positions[s, matchweek - 1, idx] = positions
+            self.points[s, matchweek - 1, idx] = points
+            self.recorded_weeks[season] = max(self.recorded_weeks[season], matchweek)
+
+    def ingest(self, season: str, results: pd.DataFrame, teams: Optional[Sequence[str]] = None):
+        """
+        Fold new results into the season and record every matchweek they touch.
+
+        Already-applied results are skipped, so repeated calls with a growing
+        results frame only process the new rows. A result whose score has
+        been corrected replaces the old one, and its matchweek onwards is
+        re-recorded. A season without results is registered empty.
+        """
+        season = str(season)
+        with self._lock:
+            fingerprint = frame_fingerprint(results)
+            if self._fingerprints.get(season) == fingerprint:
+                return
+            engine = self._engines.get(season)
+            replaying = engine is None
+            if replaying:
+                teams = list(teams) if teams is not None else sorted(
+                    set(results['Home_Team']) | set(results['Away_Team']))
+                engine = self._engines[season] = StandingsEngine(teams, self.league_id)
+                self._applied[season] = {}
+                self._ensure(season, engine.teams)
+            # (matchweek, home, away) -> score applied
+            applied = self._applied[season]
+
+            first_changed = None
+            for row in results[['Matchweek', 'Home_Team', 'Away_Team', 'Home_Goals', 'Away_Goals']].itertuples(index=False):
+                key = (int(row.Matchweek), row.Home_Team, row.Away_Team)
+                score = (int(row.Home_Goals), int(row.Away_Goals))
+                previous = applied.get(key)
+                if previous == score:
+                    continue
+                if previous is not None:
+                    engine.remove_result(row.Home_Team, row.Away_Team, *previous, key[0])
+                engine.apply_result(row.Home_Team, row.Away_Team, *score, key[0])
+                applied[key] = score
+                first_changed = key[0] if first_changed is None else min(first_changed, key[0])
+
+            if first_changed is not None:
+                if engine.matchweeks > self.max_weeks:
+                    self._resize(len(self.seasons), len(self.teams), engine.matchweeks)
+                    if self.directory:
+                        self.save()
+                start = first_changed
+                if replaying and self.recorded_weeks.get(season):
+                    # Weeks persisted before a restart only need their last
+                    # (possibly partial) matchweek re-recorded
+                    start = max(first_changed, self.recorded_weeks[season])
+                for week in range(max(start, 1), engine.matchweeks + 1):
+                    self.record_matchweek(season, week, engine.teams,
+                                          engine.positions_as_of(week), engine.points_as_of(week))
+                if self.directory:
+                    self.flush()
+            self._fingerprints[season] = fingerprint
+
+    def trend(self, teams: Sequence[str], season: str, first_week: int = 1,
+              last_week: Optional[int] = None) -> pd.DataFrame:
+        """Long-format positions/points for teams over a week range (empty for an unknown season)"""
+        with self._lock:
+            if str(season) not in self.seasons:
+                return pd.DataFrame({'Matchweek': pd.Series(dtype=np.int64), 'Team': pd.Series(dtype=object),
+                                     'Position': pd.Series(dtype=self.positions.dtype),
+                                     'Points': pd.Series(dtype=self.points.dtype)})
+            s = self.seasons.index(str(season))
+            last_week = last_week or self.recorded_weeks[str(season)]
+            idx = [self._team_index[team] for team in teams if team in self._team_index]
+            positions = self.positions[s, first_week - 1:last_week][:, idx]
+            points = self.points[s, first_week - 1:last_week][:, idx]
+            weeks = np.arange(first_week, first_week + positions.shape[0])
+            frame = pd.DataFrame({
+                'Matchweek': np.repeat(weeks, len(idx)),
+                'Team': np.tile([self.teams[i] for i in idx], len(weeks)),
+                'Position': positions.ravel(),
+                'Points': points.ravel()
+            })
+            return frame[frame['Position'] > 0].reset_index(drop=True)
+
+    def _paths(self) -> Dict[str, str]:
+        return {
+            'meta': os.path.join(self.directory, 'meta.json'),
+            'positions': os.path.join(self.directory, 'positions.npy'),
+            'points': os.path.join(self.directory, 'points.npy')
+        }
+
+    def save(self):
+        """Write both blocks to disk and reopen them memory-mapped"""
+        paths = self._paths()
+        os.makedirs(self.directory, exist_ok=True)
+        for name in ('positions', 'points'):
+            block = np.asarray(getattr(self, name))
+            tmp_path = paths[name] + '.tmp.npy'
+            np.save(tmp_path, block)
+            os.replace(tmp_path, paths[name])
+            setattr(self, name, np.load(paths[name], mmap_mode='r+'))
+        self._write_meta()
+
+    def flush(self):
+        """Push memory-mapped writes (or a full save, if not yet mapped) to disk"""
+        if isinstance(self.positions, np.memmap):
+            self.positions.flush()
+            self.points.flush()
+            self._write_meta()
+        else:
+            self.save()
+
+    def _write_meta(self):
+        path = self._paths()['meta']
+        with open(path + '.tmp', 'w') as f:
+            json.dump({
+                'league_id': self.league_id,
+                'teams': self.teams,
+                'seasons': self.seasons,
+                'max_weeks': self.max_weeks,
+                'recorded_weeks': self.recorded_weeks
+            }, f)
+        os.replace(path + '.tmp', path)
+
+    @classmethod
+    def load(cls, directory: str) -> Optional['PositionHistory']:
+        """Reopen a persisted history memory-mapped, or None if there isn't one"""
+        try:
+            with open(os.path.join(directory, 'meta.json')) as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return None
+        history = cls(meta['league_id'], meta['teams'], meta['max_weeks'], directory)
+        history.seasons = meta['seasons']
+        history.recorded_weeks = meta['recorded_weeks']
+        history.positions = np.load(os.path.join(directory, 'positions.npy'), mmap_mode='r+')
+        history.points = np.load(os.path.join(directory, 'points.npy'), mmap_mode='r+')
+        # Blocks written with a dtype too narrow for the league have wrapped,
+        # so they are rebuilt from the results instead
+        if (np.iinfo(history.positions.dtype).max < len(history.teams)
+                or np.iinfo(history.points.dtype).max < 3 * history.max_weeks):
+            return None
+        return history
+
+
+_histories: Dict[str, PositionHistory] = {}
+_histories_lock = threading.Lock()
+
+def get_position_history(league_id: str, season: str, results: pd.DataFrame,
+                         max_weeks: Optional[int] = None) -> PositionHistory:
+    """
+    Process-wide history for a league, brought up to date with results.
+
+    The week axis starts at max_weeks (by default the latest matchweek in
+    results) and grows with the engine's matchweeks as results come in.
+    """
+    league_id = str(league_id)
+    if max_weeks is None:
+        max_weeks = int(results['Matchweek'].max()) if len(results) else 38
+    with _histories_lock:
+        history = _histories.get(league_id)
+        if history is None:
+            directory = os.path.join(HISTORY_DIR, f'league={league_id}')
+            history = PositionHistory.load(directory) or PositionHistory(
+                league_id, max_weeks=max_weeks, directory=directory)
+            _histories[league_id] = history
+    history.ingest(season, results)
+    return history
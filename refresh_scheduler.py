@@ -0,0 +1,252 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from data_fetcher import SoccerDataFetcher, data_fetcher
+
+# Refresh cadence per endpoint in seconds: (normally, during a match window)
+REFRESH_POLICY = {
+    'fetch_results': (600, 20),
+    'fetch_league_standings': (600, 20),
+    'fetch_fixtures': (3600, 300)
+}
+
+# A match window opens shortly before kickoff and closes once the match,
+# half time and stoppage time included, must be over
+LIVE_BEFORE = pd.Timedelta(minutes=15)
+LIVE_AFTER = pd.Timedelta(minutes=135)
+
+# Leagues nobody has viewed for this long stop being refreshed
+WATCH_TTL = 1800
+
+MAX_BACKOFF = 1800
+
+
+def _utcnow() -> pd.Timestamp:
+    return pd.Timestamp.now(tz='UTC').tz_localize(None)
+
+
+class RefreshJob:
+    """Schedule state and timing metrics of one (league, endpoint) refresh"""
+
+    def __init__(self, league_id: str, endpoint: str, interval: float, live_interval: float):
+        self.league_id = league_id
+        self.endpoint = endpoint
+        self.interval = interval
+        self.live_interval = live_interval
+        self.live = False
+        self.next_run = 0.0
+        self.failures = 0
+        self.runs = 0
+        self.errors = 0
+        self.changes = 0
+        self.last_run: Optional[float] = None
+        self.last_duration: Optional[float] = None
+        self.max_duration = 0.0
+        self.total_duration = 0.0
+        self.last_error: Optional[str] = None
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.league_id, self.endpoint
+
+    def record(self, duration: float, changed: bool, error: Optional[BaseException]):
+        self.runs += 1
+        self.last_run = time.time()
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        self.total_duration += duration
+        if error is not None:
+            self.errors += 1
+            self.failures += 1
+            self.last_error = repr(error)
+        else:
+            self.failures = 0
+            self.changes += int(changed)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'league_id': self.league_id,
+            'endpoint': self.endpoint,
+            'live': self.live,
+            'runs': self.runs,
+            'changes': self.changes,
+            'errors': self.errors,
+            'failures': self.failures,
+            'last_run': self.last_run,
+            'last_duration': self.last_duration,
+            'mean_duration': self.total_duration / self.runs if self.runs else None,
+            'max_duration': self.max_duration,
+            'last_error': self.last_error
+        }
+
+
+class RefreshScheduler:
+    """
+    Background refresh of live league data.
+
+    Every watched league gets one job per endpoint in the policy. A daemon
+    thread sleeps until the earliest job is due and hands it to a small
+    worker pool. The job reloads its endpoint with
+    ``SoccerDataFetcher.refresh()``, which writes the shared cache. It is
+    then rescheduled at its live or normal cadence with random jitter, or
+    backed off exponentially after a failure. Whenever a refresh changes
+    the data, the version counter is bumped and listeners are called.
+    """
+
+    def __init__(self, fetcher: SoccerDataFetcher, policy: Optional[Dict[str, tuple]] = None,
+                 jitter: float = 0.1, workers: int = 2,
+                 timer: Callable[[], float] = time.monotonic,
+                 clock: Callable[[], pd.Timestamp] = _utcnow):
+        self.fetcher = fetcher
+        self.policy = dict(REFRESH_POLICY)
+        self.policy.update(policy or {})
+        self.jitter = jitter
+        self._timer = timer
+        self._clock = clock
+        self._rng = random.Random()
+        self._jobs: Dict[Tuple[str, str], RefreshJob] = {}
+        self._queue: List[tuple] = []  # (due, sequence, job)
+        self._sequence = itertools.count()
+        self._watched: Dict[str, float] = {}
+        self._kickoffs: Dict[str, pd.DatetimeIndex] = {}
+        self._listeners: List[Callable[[str, str], None]] = []
+        self._version = 0
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='refresh')
+
+    def _delay(self, job: RefreshJob) -> float:
+        delay = job.live_interval if job.live else job.interval
+        if job.failures:
+            delay = min(delay * 2 ** job.failures, MAX_BACKOFF)
+        return delay * self._rng.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _push(self, job: RefreshJob):
+        job.next_run = self._timer() + self._delay(job)
+        heapq.heappush(self._queue, (job.next_run, next(self._sequence), job))
+        self._cond.notify()
+
+    def watch(self, league_id: str):
+        """Keep a league's current-season data refreshed; call on every view"""
+        league_id = str(league_id)
+        with self._cond:
+            self._watched[league_id] = self._timer()
+            for endpoint, (interval, live_interval) in self.policy.items():
+                if (league_id, endpoint) not in self._jobs:
+                    job = RefreshJob(league_id, endpoint, interval, live_interval)
+                    job.live = self.is_live(league_id)
+                    self._jobs[job.key] = job
+                    self._push(job)
+        self.start()
+
+    def subscribe(self, callback: Callable[[str, str], None]):
+        """Call callback(league_id, endpoint) after every refresh that changed data"""
+        with self._cond:
+            self._listeners.append(callback)
+
+    def notify(self, league_id: str, endpoint: str):
+        """Record a data change made outside the scheduler and tell listeners"""
+        with self._cond:
+            self._version += 1
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback(league_id, endpoint)
+            except Exception:
+                pass
+
+    def version(self) -> int:
+        """Counter bumped whenever shared data changes"""
+        return self._version
+
+    def is_live(self, league_id: str) -> bool:
+        """Whether a known kickoff puts the league inside a match window"""
+        kickoffs = self._kickoffs.get(str(league_id))
+        if kickoffs is None or len(kickoffs) == 0:
+            return False
+        now = self._clock()
+        return bool(((kickoffs - LIVE_BEFORE <= now) & (now <= kickoffs + LIVE_AFTER)).any())
+
+    def _learn_kickoffs(self, league_id: str):
+        # Matches drop out of the fixtures once they start, so kickoffs are
+        # remembered until their match window has closed
+        fixtures = self.fetcher.fetch_fixtures(league_id)
+        known = self._kickoffs.get(league_id, pd.DatetimeIndex([]))
+        known = known[known + LIVE_AFTER >= self._clock()]
+        self._kickoffs[league_id] = known.union(pd.DatetimeIndex(fixtures['Date']))
+
+    def start(self):
+        """Start the scheduler thread if it isn't running"""
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped = False
+            self._thread = threading.Thread(target=self._loop, name='refresh-scheduler', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop scheduling; refreshes already running finish on their own"""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _retire(self):
+        cutoff = self._timer() - WATCH_TTL
+        for league_id in [league for league, seen in self._watched.items() if seen < cutoff]:
+            del self._watched[league_id]
+            for endpoint in self.policy:
+                self._jobs.pop((league_id, endpoint), None)
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    self._retire()
+                    if self._queue and self._queue[0][0] <= self._timer():
+                        break
+                    self._cond.wait(self._queue[0][0] - self._timer() if self._queue else None)
+                if self._stopped:
+                    return
+                _, _, job = heapq.heappop(self._queue)
+                if self._jobs.get(job.key) is not job:
+                    continue
+            self._executor.submit(self._run, job)
+
+    def _run(self, job: RefreshJob):
+        start = self._timer()
+        changed, error = False, None
+        try:
+            changed = self.fetcher.refresh(job.endpoint, job.league_id)
+        except Exception as exc:
+            error = exc
+        duration = self._timer() - start
+        try:
+            self._learn_kickoffs(job.league_id)
+        except Exception:
+            pass
+        with self._cond:
+            job.record(duration, changed, error)
+            job.live = self.is_live(job.league_id)
+            if self._jobs.get(job.key) is job:
+                self._push(job)
+        if changed:
+            self.notify(job.league_id, job.endpoint)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Timing metrics of every scheduled job"""
+        with self._cond:
+            return [job.stats() for job in self._jobs.values()]
+
+
+# Shared by every session; started by the first page that watches a league
+refresh_scheduler = RefreshScheduler(data_fetcher)
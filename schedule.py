@@ -0,0 +1,31 @@
+from typing import List, Sequence, Tuple
+
+
+def double_round_robin(teams: Sequence[str]) -> List[List[Tuple[str, str]]]:
+    """
+    Home-and-away league schedule via the circle method.
+
+    Returns one list of (home, away) pairs per matchweek; the second half of
+    the season mirrors the first with venues swapped.
+    """
+    teams = list(teams)
+    if len(teams) % 2:
+        teams.append(None)
+    n = len(teams)
+    rotation = teams[1:]
+    first_half = []
+    for week in range(n - 1):
+        lineup = [teams[0]] + rotation
+        pairs = []
+        for i in range(n // 2):
+            home, away = lineup[i], lineup[n - 1 - i]
+            # The fixed team alternates venues week to week; every other pair
+            # swaps, which keeps home streaks to at most two games
+            if (week if i == 0 else i) % 2:
+                home, away = away, home
+            if home is not None and away is not None:
+                pairs.append((home, away))
+        first_half.append(pairs)
+        rotation = rotation[-1:] + rotation[:-1]
+    second_half = [[(away, home) for home, away in week] for week in first_half]
+    return first_half + second_half
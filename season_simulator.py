@@ -0,0 +1,225 @@
+import contextlib
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from cache import TTLCache, frame_fingerprint
+from prediction_engine import PoissonMatchModel
+from singleflight import SingleFlight
+
+
+def _sample_goals(rng, cdf, n_sims):
+    # Inverse-CDF sampling against per-fixture cumulative goal probabilities;
+    # a few vectorized comparisons are much cheaper than rng.poisson
+    uniforms = rng.random((n_sims, cdf.shape[0]), dtype=np.float32)
+    goals = np.zeros((n_sims, cdf.shape[0]), dtype=np.int8)
+    for k in range(cdf.shape[1]):
+        goals += uniforms > cdf[:, k]
+    return goals
+
+
+# Working memory one chunk of simulated seasons may use; chunk sizes follow
+# from how many fixtures and teams each simulated season carries
+SIM_BUDGET_BYTES = 64 * 2**20
+
+# Approximate bytes per simulated season for each remaining fixture (goal
+# draws, points, bincount slots and weights) and for each team (totals,
+# sort key and positions)
+_BYTES_PER_FIXTURE = 56
+_BYTES_PER_TEAM = 64
+
+
+def chunk_size_for(n_fixtures: int, n_teams: int, budget_bytes: int = SIM_BUDGET_BYTES) -> int:
+    """Simulated seasons per chunk that keep a chunk's arrays within the budget"""
+    per_season = n_fixtures * _BYTES_PER_FIXTURE + n_teams * _BYTES_PER_TEAM
+    return max(1, budget_bytes // max(per_season, 1))
+
+
+def _per_team(home_slots, away_slots, home_values, away_values, n_sims, n_teams):
+    """(season, team) totals of per-fixture home and away values"""
+    size = n_sims * n_teams
+    totals = np.bincount(home_slots, weights=home_values.ravel(), minlength=size)
+    totals += np.bincount(away_slots, weights=away_values.ravel(), minlength=size)
+    return totals.reshape(n_sims, n_teams)
+
+
+def _simulate_chunk(base_points, base_gd, base_gf, home_idx, away_idx,
+                    home_cdf, away_cdf, n_sims, seed, max_points, relegation_spots):
+    """
+    Simulate n_sims seasons; returns per-team position sums, title, top-4
+    and relegation counts, the points histogram and the points sum
+    """
+    rng = np.random.default_rng(seed)
+    n_teams = len(base_points)
+
+    home_goals = _sample_goals(rng, home_cdf, n_sims)
+    away_goals = _sample_goals(rng, away_cdf, n_sims)
+    draws = (home_goals == away_goals).view(np.int8)
+    home_points = (home_goals > away_goals).view(np.int8) * np.int8(3) + draws
+    away_points = (away_goals > home_goals).view(np.int8) * np.int8(3) + draws
+
+    # Each fixture's home and away side as a flat (season, team) slot, so
+    # per-team totals are bincounts over the fixtures rather than products
+    # with a dense fixture x team matrix
+    offsets = np.arange(n_sims, dtype=np.int64)[:, None] * n_teams
+    home_slots = (offsets + home_idx).ravel()
+    away_slots = (offsets + away_idx).ravel()
+
+    points = base_points + _per_team(home_slots, away_slots, home_points, away_points, n_sims, n_teams)
+
+    # Rank on points, then goal difference, then goals scored, then a coin
+    # toss. The key is linear in each fixture's contribution, so it is
+    # totalled directly rather than from separate goal totals
+    margin = home_goals.astype(np.int16) - away_goals
+    home_key = margin * 1e3 + home_goals
+    away_key = margin * -1e3 + away_goals
+    sort_key = (points * 1e8 + (base_gd + 10000) * 1e3 + base_gf
+                + _per_team(home_slots, away_slots, home_key, away_key, n_sims, n_teams)
+                + rng.random((n_sims, n_teams)) * 0.5)
+    order = np.argsort(-sort_key, axis=1)
+    positions = np.empty_like(order)
+    positions[np.arange(n_sims)[:, None], order] = np.arange(n_teams)
+
+    zone_counts = np.stack([
+        (positions == 0).sum(axis=0),
+        (positions < 4).sum(axis=0),
+        (positions >= n_teams - relegation_spots).sum(axis=0)
+    ], axis=1)
+    team_ids = np.arange(n_teams)
+    points = points.astype(np.int64)
+    points_hist = np.bincount(
+        (team_ids * (max_points + 1) + points).ravel(), minlength=n_teams * (max_points + 1)
+    ).reshape(n_teams, max_points + 1)
+    return positions.sum(axis=0), zone_counts, points_hist, points.sum(axis=0)
+
+
+class SimulationResult:
+    """
+    Aggregated outcome of a Monte Carlo season simulation
+    """
+
+    def __init__(self, teams, current_points, position_sum, zone_counts, points_hist, points_sum,
+                 n_sims, elapsed):
+        self.teams = list(teams)
+        self.n_sims = n_sims
+        self.elapsed = elapsed
+        self.throughput = n_sims / elapsed if elapsed > 0 else float('inf')
+        self.points_probs = points_hist / n_sims
+        # Title, top-4 and relegation probabilities per team
+        self.zone_probs = zone_counts / n_sims
+
+        cdf = np.cumsum(self.points_probs, axis=1)
+        self.table = pd.DataFrame({
+            'Team': self.teams,
+            'Current_Points': current_points,
+            'Exp_Points': (points_sum / n_sims).round(1),
+            'Points_P10': (cdf < 0.1).sum(axis=1),
+            'Points_P50': (cdf < 0.5).sum(axis=1),
+            'Points_P90': (cdf < 0.9).sum(axis=1),
+            'Exp_Position': (position_sum / n_sims + 1).round(2),
+            'Title_%': (self.zone_probs[:, 0] * 100).round(1),
+            'Top4_%': (self.zone_probs[:, 1] * 100).round(1),
+            'Relegation_%': (self.zone_probs[:, 2] * 100).round(1)
+        }).sort_values(['Exp_Position', 'Team'], ignore_index=True)
+
+    def team(self, team: str) -> dict:
+        """Projection row for one team"""
+        return self.table[self.table['Team'] == team].iloc[0].to_dict()
+
+
+class SeasonSimulator:
+    """
+    Monte Carlo simulator that plays out the remaining fixtures of a season.
+
+    Goals for every remaining fixture are drawn from the Poisson model's
+    goal distributions for a whole chunk of simulated seasons at once; chunks can be spread across
+    a process pool. Chunks are sized from a memory budget, so a chunk's
+    working set stays flat however large the league. Chunk seeds are
+    spawned from one ``SeedSequence``, so results are reproducible for a
+    given seed and chunk size regardless of worker count.
+    """
+
+    def __init__(self, standings: pd.DataFrame, fixtures: pd.DataFrame,
+                 model: Optional[PoissonMatchModel] = None, relegation_spots: int = 3):
+        self.model = model or PoissonMatchModel().fit(standings)
+        self.teams = pd.Index(standings['Team'])
+        self.relegation_spots = relegation_spots
+        self.base_points = standings['Points'].to_numpy(dtype=float)
+        self.base_gd = (standings['Goals_For'] - standings['Goals_Against']).to_numpy(dtype=float)
+        self.base_gf = standings['Goals_For'].to_numpy(dtype=float)
+
+        # Fixtures involving teams outside the table can't move it
+        home_idx = self.teams.get_indexer(pd.Index(fixtures['Home_Team']))
+        away_idx = self.teams.get_indexer(pd.Index(fixtures['Away_Team']))
+        known = (home_idx >= 0) & (away_idx >= 0)
+        self.home_idx = home_idx[known]
+        self.away_idx = away_idx[known]
+        self.home_xg, self.away_xg = self.model.expected_goals(
+            self.teams[self.home_idx], self.teams[self.away_idx]
+        )
+        # Cumulative goal probabilities per fixture (the last bucket is implied)
+        self.home_cdf = np.cumsum(self.model.goal_probabilities(self.home_xg), axis=1)[:, :-1].astype(np.float32)
+        self.away_cdf = np.cumsum(self.model.goal_probabilities(self.away_xg), axis=1)[:, :-1].astype(np.float32)
+        games_left = np.bincount(np.concatenate([self.home_idx, self.away_idx]),
+                                 minlength=len(self.teams))
+        self.max_points = int((self.base_points + 3 * games_left).max())
+
+    def simulate(self, n_sims: int = 100_000, seed: Optional[int] = None,
+                 workers: int = 1, chunk_size: Optional[int] = None) -> SimulationResult:
+        """Run n_sims simulated seasons, optionally across a process pool"""
+        chunk_size = chunk_size or chunk_size_for(len(self.home_idx), len(self.teams))
+        chunks = [min(chunk_size, n_sims - start) for start in range(0, n_sims, chunk_size)]
+        seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+        args = [
+            (self.base_points, self.base_gd, self.base_gf, self.home_idx, self.away_idx,
+             self.home_cdf, self.away_cdf, size, child, self.max_points, self.relegation_spots)
+            for size, child in zip(chunks, seeds)
+        ]
+
+        start = time.perf_counter()
+        totals = None
+        with contextlib.ExitStack() as stack:
+            if workers > 1 and len(chunks) > 1:
+                pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+                parts = pool.map(_simulate_chunk, *zip(*args))
+            else:
+                parts = (_simulate_chunk(*chunk_args) for chunk_args in args)
+            # Fold chunks in as they finish rather than holding every histogram
+            for part in parts:
+                totals = list(part) if totals is None else [total + stat for total, stat in zip(totals, part)]
+        elapsed = time.perf_counter() - start
+
+        position_sum, zone_counts, points_hist, points_sum = totals
+        return SimulationResult(self.teams, self.base_points.astype(int), position_sum, zone_counts,
+                                points_hist, points_sum, n_sims, elapsed)
+
+
+# Simulations are keyed by the content of their inputs, so every session
+# looking at the same table shares one run
+_results = TTLCache(maxsize=16, ttl=600)
+_flight = SingleFlight()
+
+# Fixture draws (simulated seasons x remaining fixtures) a page's
+# simulation may make, and the fewest seasons it runs however large the
+# league: large leagues trade a little sampling precision for a render
+# that stays within a few seconds
+SIM_WORK_BUDGET = 20_000_000
+MIN_SIMS = 1_000
+
+def simulate_season(standings: pd.DataFrame, fixtures: pd.DataFrame, n_sims: int = 100_000,
+                    seed: Optional[int] = 42, workers: int = 1) -> SimulationResult:
+    """Cached season simulation for the dashboard pages, sized to the work budget"""
+    n_sims = max(min(n_sims, MIN_SIMS), min(n_sims, SIM_WORK_BUDGET // max(len(fixtures), 1)))
+    key = (frame_fingerprint(standings), frame_fingerprint(fixtures), n_sims, seed)
+    result = _results.get(key)
+    if result is None:
+        # Sessions opening the same table at once share one run
+        def run():
+            simulated = SeasonSimulator(standings, fixtures).simulate(n_sims, seed=seed, workers=workers)
+            _results.put(key, simulated)
+            return simulated
+        result = _flight.do(key, run)
+    return result
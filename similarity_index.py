@@ -0,0 +1,171 @@
+import threading
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from player_engine import FilterValue, PlayerStore
+
+# Features every player has; rate stats carry most of the style signal
+BASE_FEATURES = ['Goals_per_90', 'Assists_per_90', 'Goals_per_Match', 'Assists_per_Match',
+                 'Goals', 'Assists', 'Matches', 'Minutes']
+
+# Passing/defending columns used whenever the player data provides them
+OPTIONAL_FEATURES = ['Pass Accuracy %', 'Key_Passes_per_90', 'Tackles_per_90',
+                     'Interceptions_per_90', 'Shots_per_90', 'Dribbles_per_90']
+
+RESULT_COLUMNS = ['Player', 'Team', 'League', 'Position', 'Season', 'Age', 'Similarity']
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray, chunk: int = 16_384) -> np.ndarray:
+    """Nearest centroid per vector, in chunks to bound the score matrix"""
+    return np.concatenate([
+        (vectors[start:start + chunk] @ centroids.T).argmax(axis=1)
+        for start in range(0, len(vectors), chunk)
+    ])
+
+
+def _kmeans(vectors: np.ndarray, k: int, iterations: int, seed: int) -> np.ndarray:
+    """Spherical k-means centroids (unit length) for unit-length vectors"""
+    rng = np.random.default_rng(seed)
+    # A sample of ~64 players per partition is plenty to place the centroids
+    if len(vectors) > 64 * k:
+        vectors = vectors[rng.choice(len(vectors), size=64 * k, replace=False)]
+    centroids = vectors[rng.choice(len(vectors), size=k, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = _assign(vectors, centroids)
+        sums = np.stack([np.bincount(assignment, weights=vectors[:, j], minlength=k)
+                         for j in range(vectors.shape[1])], axis=1)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        empty = norms[:, 0] == 0
+        # Re-seed empty lists from random players rather than dropping them
+        sums[empty] = vectors[rng.choice(len(vectors), size=int(empty.sum()), replace=False)]
+        norms[empty] = 1
+        centroids = (sums / norms).astype(np.float32)
+    return centroids
+
+
+class SimilarityIndex:
+    """
+    Nearest-neighbour search over standardized player feature vectors.
+
+    Features are z-scored and scaled to unit length, so similarity is the
+    cosine between two players' standardized profiles. The ``exact`` backend
+    scores every eligible player with one matrix-vector product; the ``ivf``
+    backend clusters players into ``n_lists`` partitions with spherical
+    k-means and only scores players in the ``n_probe`` partitions nearest the
+    query, trading a little recall for much less work on large datasets.
+    """
+
+    def __init__(self, store: PlayerStore, features: Optional[Sequence[str]] = None,
+                 backend: str = 'exact', n_lists: Optional[int] = None, n_probe: int = 8,
+                 oversample: int = 10, seed: int = 0):
+        if backend not in ('exact', 'ivf'):
+            raise ValueError(f"Unknown similarity backend: {backend}")
+        frame = store.frame
+        self.store = store
+        self.backend = backend
+        self.features = list(features) if features is not None else (
+            BASE_FEATURES + [column for column in OPTIONAL_FEATURES if column in frame])
+
+        raw = frame[self.features].to_numpy(dtype=np.float32)
+        std = raw.std(axis=0)
+        standardized = (raw - raw.mean(axis=0)) / np.where(std > 0, std, 1)
+        norms = np.linalg.norm(standardized, axis=1, keepdims=True)
+        self.vectors = (standardized / np.where(norms > 0, norms, 1)).astype(np.float32)
+        self.ages = frame['Age'].to_numpy(dtype=np.float32) if 'Age' in frame else None
+        self._results = frame[[column for column in RESULT_COLUMNS if column in frame]]
+
+        self.n_probe = n_probe
+        self.oversample = oversample
+        if backend == 'ivf':
+            self.n_lists = n_lists or max(1, int(np.sqrt(len(frame))))
+            self.centroids = _kmeans(self.vectors, min(self.n_lists, len(frame)), iterations=10, seed=seed)
+            assignment = _assign(self.vectors, self.centroids)
+            order = np.argsort(assignment, kind='stable')
+            bounds = np.searchsorted(assignment[order], np.arange(len(self.centroids) + 1))
+            self._lists = [order[bounds[i]:bounds[i + 1]] for i in range(len(self.centroids))]
+
+    def _eligible(self, league: FilterValue, position: FilterValue, season: FilterValue,
+                  min_age: Optional[float], max_age: Optional[float]) -> Optional[np.ndarray]:
+        """Boolean mask of players passing the filters, or None if unfiltered"""
+        mask = None
+        if any(value is not None for value in (league, position, season)):
+            mask = np.zeros(len(self.vectors), dtype=bool)
+            mask[self.store.select(league=league, position=position, season=season)] = True
+        if self.ages is not None and (min_age is not None or max_age is not None):
+            if mask is None:
+                mask = np.ones(len(self.vectors), dtype=bool)
+            if min_age is not None:
+                mask &= self.ages >= min_age
+            if max_age is not None:
+                mask &= self.ages <= max_age
+        return mask
+
+    def _candidates(self, query: np.ndarray, mask: Optional[np.ndarray],
+                    wanted: int) -> Optional[np.ndarray]:
+        """Row positions worth scoring; None means every player"""
+        if self.backend == 'exact':
+            return None if mask is None else np.flatnonzero(mask)
+        # Probe the nearest partitions first; with a selective filter keep
+        # probing until enough eligible players have been seen
+        nearest = np.argsort(-(self.centroids @ query))
+        parts, found = [], 0
+        for probed, i in enumerate(nearest):
+            if probed >= self.n_probe and found >= wanted:
+                break
+            rows = self._lists[i] if mask is None else self._lists[i][mask[self._lists[i]]]
+            parts.append(rows)
+            found += len(rows)
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.intp)
+
+    def search(self, row: int, k: int = 10, league: FilterValue = None,
+               position: FilterValue = None, season: FilterValue = None,
+               min_age: Optional[float] = None, max_age: Optional[float] = None,
+               exclude_self: bool = True) -> pd.DataFrame:
+        """Top-k most similar players to the player at store row ``row``"""
+        query = self.vectors[row]
+        mask = self._eligible(league, position, season, min_age, max_age)
+        # Over-collect for the IVF backend so the final top-k is rarely short
+        candidates = self._candidates(query, mask, wanted=self.oversample * (k + 1))
+        if candidates is None:
+            scores = self.vectors @ query
+            candidates = np.arange(len(scores))
+        else:
+            scores = self.vectors[candidates] @ query
+        if exclude_self:
+            scores[candidates == row] = -np.inf
+        k = min(k, int(np.isfinite(scores).sum()))
+        if k == 0:
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        result = self._results.iloc[candidates[top]].copy()
+        result['Similarity'] = (scores[top].astype(float) * 100).round(1)
+        return result.reset_index(drop=True)
+
+    def most_similar(self, player: str, k: int = 10, **filters) -> pd.DataFrame:
+        """search() by player name (their first row in the store)"""
+        matches = np.flatnonzero(self.store.frame['Player'].to_numpy() == player)
+        if len(matches) == 0:
+            raise KeyError(f"{player} is not in the player data")
+        return self.search(int(matches[0]), k, **filters)
+
+
+# Indexes are rebuilt only when their player store is reloaded; datasets
+# larger than this go through the partitioned backend
+IVF_THRESHOLD = 100_000
+
+_indexes: Dict[str, tuple] = {}
+_indexes_lock = threading.Lock()
+
+def get_similarity_index(store: PlayerStore, backend: Optional[str] = None) -> SimilarityIndex:
+    """Process-wide similarity index for a player store"""
+    backend = backend or ('ivf' if len(store) > IVF_THRESHOLD else 'exact')
+    with _indexes_lock:
+        index, source = _indexes.get(backend, (None, None))
+        if source is not store:
+            index = SimilarityIndex(store, backend=backend)
+            _indexes[backend] = (index, store)
+        return index
@@ -0,0 +1,78 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into a single execution.
+
+    Every in-flight call is tracked as a ``concurrent.futures.Future``, so
+    threaded callers block on ``result()`` while asyncio callers await it via
+    ``asyncio.wrap_future``. The leader's result or exception is shared with
+    every caller that arrived while it was running.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._executions = 0
+        self._deduplicated = 0
+
+    def claim(self, key: Hashable) -> Tuple[Future, bool]:
+        """Return the in-flight future for key and whether the caller must run it"""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self._deduplicated += 1
+                return future, False
+            future = self._calls[key] = Future()
+            self._executions += 1
+            return future, True
+
+    def resolve(self, key: Hashable, future: Future, result: Any = None,
+                error: BaseException = None):
+        """Publish the leader's outcome to every waiter and release the key"""
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn once per key across all concurrent threaded callers"""
+        future, leader = self.claim(key)
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as exc:
+            self.resolve(key, future, error=exc)
+            raise
+        self.resolve(key, future, result)
+        return result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await fn() once per key across concurrent asyncio (and threaded) callers"""
+        future, leader = self.claim(key)
+        if not leader:
+            return await asyncio.wrap_future(future)
+        try:
+            result = await fn()
+        except BaseException as exc:
+            self.resolve(key, future, error=exc)
+            raise
+        self.resolve(key, future, result)
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """Executions vs deduplicated calls"""
+        with self._lock:
+            return {
+                'executions': self._executions,
+                'deduplicated': self._deduplicated,
+                'in_flight': len(self._calls)
+            }
@@ -0,0 +1,155 @@
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+
+from singleflight import SingleFlight
+
+_METADATA_KEY = b'soccer_dashboard'
+
+
+def _slug(value: Any) -> str:
+    return re.sub(r'[^A-Za-z0-9_.-]+', '-', str(value)).strip('-') or '_'
+
+
+class SnapshotStore:
+    """
+    On-disk Arrow IPC snapshots of fetched data.
+
+    Files live under ``<root>/<kind>/league=<id>/season=<season>[/name=<name>]/``
+    and are named by fetch timestamp (epoch milliseconds), so the newest
+    snapshot is simply the largest file name. Reads memory-map the file, so a
+    warm restart serves the dashboard straight from disk.
+    """
+
+    def __init__(self, root: str, keep: int = 3, refresh_workers: int = 2):
+        self.root = root
+        self.keep = keep
+        self._flight = SingleFlight()
+        self._executor = ThreadPoolExecutor(max_workers=refresh_workers,
+                                            thread_name_prefix='snapshot-refresh')
+        self._lock = threading.Lock()
+        self._refreshes = 0
+        self._refresh_errors = 0
+
+    def _directory(self, kind: str, league: str, season: str, name: Optional[str]) -> str:
+        parts = [self.root, _slug(kind), f'league={_slug(league)}', f'season={_slug(season)}']
+        if name is not None:
+            parts.append(f'name={_slug(name)}')
+        return os.path.join(*parts)
+
+    def _snapshots(self, directory: str) -> List[Tuple[int, str]]:
+        try:
+            names = os.listdir(directory)
+        except FileNotFoundError:
+            return []
+        return sorted(
+            (int(entry[:-len('.arrow')]), os.path.join(directory, entry))
+            for entry in names if entry.endswith('.arrow') and entry[:-len('.arrow')].isdigit()
+        )
+
+    def write(self, kind: str, df: pd.DataFrame, league: str, season: str,
+              name: Optional[str] = None, metadata: Optional[Dict] = None,
+              fetched_at: Optional[float] = None) -> str:
+        """Persist a frame as a new snapshot and prune old ones"""
+        directory = self._directory(kind, league, season, name)
+        os.makedirs(directory, exist_ok=True)
+        fetched_ms = int((fetched_at if fetched_at is not None else time.time()) * 1000)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            _METADATA_KEY: json.dumps(metadata or {}).encode()
+        })
+        path = os.path.join(directory, f'{fetched_ms}.arrow')
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+        for _, old_path in self._snapshots(directory)[:-self.keep]:
+            try:
+                os.remove(old_path)
+            except FileNotFoundError:
+                pass
+        return path
+
+    def latest(self, kind: str, league: str, season: str,
+               name: Optional[str] = None) -> Optional[Tuple[pd.DataFrame, Dict, float]]:
+        """Return (frame, metadata, fetched_at) for the newest snapshot, or None"""
+        snapshots = self._snapshots(self._directory(kind, league, season, name))
+        if not snapshots:
+            return None
+        fetched_ms, path = snapshots[-1]
+        try:
+            with pa.memory_map(path, 'r') as source:
+                table = pa.ipc.open_file(source).read_all()
+        except FileNotFoundError:
+            # Pruned by a concurrent writer; a newer snapshot exists now
+            return self.latest(kind, league, season, name)
+        metadata = json.loads((table.schema.metadata or {}).get(_METADATA_KEY, b'{}'))
+        return table.to_pandas(split_blocks=True), metadata, fetched_ms / 1000
+
+    def _refresh(self, key: tuple, future, loader: Callable[[], Tuple[pd.DataFrame, Dict]]):
+        kind, league, season, name = key
+        try:
+            df, metadata = loader()
+            self.write(kind, df, league, season, name=name, metadata=metadata)
+        except BaseException as exc:
+            with self._lock:
+                self._refresh_errors += 1
+            self._flight.resolve(key, future, error=exc)
+            return
+        with self._lock:
+            self._refreshes += 1
+        self._flight.resolve(key, future, (df, metadata))
+
+    def get(self, kind: str, league: str, season: str,
+            loader: Callable[[], Tuple[pd.DataFrame, Dict]],
+            max_age: float, max_stale: float = 7 * 86400,
+            name: Optional[str] = None) -> Tuple[pd.DataFrame, Dict]:
+        """
+        Stale-while-revalidate read.
+
+        Fresh snapshots are returned as-is. Snapshots older than ``max_age``
+        but within ``max_stale`` are returned immediately while a background
+        refresh writes a new one. Missing or expired snapshots are loaded
+        synchronously; if that load fails, any older snapshot is served.
+        """
+        key = (kind, str(league), str(season), name)
+        snapshot = self.latest(*key)
+        if snapshot is not None:
+            df, metadata, fetched_at = snapshot
+            age = time.time() - fetched_at
+            if age <= max_age:
+                return df, metadata
+            if age <= max_stale:
+                future, leader = self._flight.claim(key)
+                if leader:
+                    self._executor.submit(self._refresh, key, future, loader)
+                return df, metadata
+
+        future, leader = self._flight.claim(key)
+        if leader:
+            self._refresh(key, future, loader)
+        try:
+            return future.result()
+        except Exception:
+            if snapshot is None:
+                raise
+            return snapshot[0], snapshot[1]
+
+    def stats(self) -> Dict[str, int]:
+        """Background refresh counters"""
+        with self._lock:
+            return {
+                'refreshes': self._refreshes,
+                'refresh_errors': self._refresh_errors,
+                **self._flight.stats()
+            }
+
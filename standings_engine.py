@@ -0,0 +1,250 @@
+import threading
+from bisect import bisect_left, insort
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Tie-breakers applied after points, in order, per league
+TIEBREAKERS = {
+    '39': ('goal_difference', 'goals_for', 'head_to_head'),   # Premier League
+    '140': ('head_to_head', 'goal_difference', 'goals_for'),  # La Liga
+    '135': ('head_to_head', 'goal_difference', 'goals_for'),  # Serie A
+    '78': ('goal_difference', 'goals_for', 'head_to_head'),   # Bundesliga
+    '61': ('goal_difference', 'goals_for', 'head_to_head'),   # Ligue 1
+    '2': ('head_to_head', 'goal_difference', 'goals_for')     # Champions League groups
+}
+
+# Column layout of the per-team stats arrays
+PLAYED, WON, DRAWN, LOST, GOALS_FOR, GOALS_AGAINST = range(6)
+
+TABLE_COLUMNS = ['Position', 'Team', 'Played', 'Won', 'Drawn', 'Lost', 'Goals_For',
+                 'Goals_Against', 'Goal_Difference', 'Points', 'Win_Rate', 'Points_Per_Game']
+
+
+def _result_delta(home_goals: int, away_goals: int) -> Tuple[np.ndarray, np.ndarray]:
+    home = np.zeros(6, dtype=np.int32)
+    away = np.zeros(6, dtype=np.int32)
+    home[PLAYED] = away[PLAYED] = 1
+    home[GOALS_FOR] = away[GOALS_AGAINST] = home_goals
+    home[GOALS_AGAINST] = away[GOALS_FOR] = away_goals
+    if home_goals > away_goals:
+        home[WON] = away[LOST] = 1
+    elif home_goals < away_goals:
+        home[LOST] = away[WON] = 1
+    else:
+        home[DRAWN] = away[DRAWN] = 1
+    return home, away
+
+
+class StandingsEngine:
+    """
+    League table maintained incrementally from a stream of match results.
+
+    Each result updates the two teams' rows and repositions them in a sorted
+    key list with ``bisect`` (O(log n) search; the list shift is a memmove
+    over at most a couple of dozen entries), so the table is never rebuilt
+    and re-sorted. Head-to-head tie-breakers are resolved lazily, only for
+    groups of teams level on points. Per-matchweek deltas back a cheap
+    "table as of matchweek k" query.
+    """
+
+    def __init__(self, teams: Sequence[str], league_id: str = '39'):
+        self.teams = list(teams)
+        self.league_id = str(league_id)
+        self.tiebreakers = TIEBREAKERS.get(self.league_id, ('goal_difference', 'goals_for'))
+        self._index = {team: i for i, team in enumerate(self.teams)}
+        self._stats = np.zeros((len(self.teams), 6), dtype=np.int32)
+        self._keys = [self._sort_key(i) for i in range(len(self.teams))]
+        self._keys.sort()
+        # Results kept for head-to-head resolution and as_of replays
+        self._results: List[Tuple[int, int, int, int, int]] = []
+        self._week_deltas = np.zeros((1, len(self.teams), 6), dtype=np.int32)
+        self._prefix: Optional[np.ndarray] = None
+        self._weeks_played = 0
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_results(cls, results: pd.DataFrame, league_id: str = '39',
+                     teams: Optional[Sequence[str]] = None) -> 'StandingsEngine':
+        """Build an engine from a results frame (Home_Team, Away_Team, Home_Goals, Away_Goals[, Matchweek])"""
+        if teams is None:
+            teams = sorted(set(results['Home_Team']) | set(results['Away_Team']))
+        engine = cls(teams, league_id)
+        engine.apply_results(results)
+        return engine
+
+    def _sort_key(self, i: int) -> tuple:
+        played, won, drawn, lost, goals_for, goals_against = self._stats[i]
+        points = 3 * won + drawn
+        return (-points, -(goals_for - goals_against), -goals_for, self.teams[i], i)
+
+    def _reposition(self, i: int, old_key: tuple):
+        del self._keys[bisect_left(self._keys, old_key)]
+        insort(self._keys, self._sort_key(i))
+
+    def _week_slot(self, matchweek: int):
+        if matchweek >= len(self._week_deltas):
+            grown = np.zeros((max(matchweek + 1, 2 * len(self._week_deltas)),) + self._week_deltas.shape[1:],
+                             dtype=np.int32)
+            grown[:len(self._week_deltas)] = self._week_deltas
+            self._week_deltas = grown
+        self._weeks_played = max(self._weeks_played, matchweek)
+
+    def _apply(self, home: str, away: str, home_goals: int, away_goals: int,
+               matchweek: int, sign: int):
+        for team in (home, away):
+            if team not in self._index:
+                raise KeyError(f"{team} is not in this league")
+        h, a = self._index[home], self._index[away]
+        record = (matchweek, h, a, int(home_goals), int(away_goals))
+        # Check before touching the table, so a bad removal leaves it intact
+        if sign < 0 and record not in self._results:
+            raise ValueError(f"{home} {home_goals}-{away_goals} {away} (matchweek {matchweek}) was never applied")
+        home_delta, away_delta = _result_delta(int(home_goals), int(away_goals))
+        old_home, old_away = self._sort_key(h), self._sort_key(a)
+        self._stats[h] += sign * home_delta
+        self._stats[a] += sign * away_delta
+        self._reposition(h, old_home)
+        self._reposition(a, old_away)
+
+        self._week_slot(matchweek)
+        self._week_deltas[matchweek, h] += sign * home_delta
+        self._week_deltas[matchweek, a] += sign * away_delta
+        self._prefix = None
+
+        if sign > 0:
+            self._results.append(record)
+        else:
+            self._results.remove(record)
+
+    def apply_result(self, home: str, away: str, home_goals: int, away_goals: int,
+                     matchweek: Optional[int] = None):
+        """Fold one final result into the table"""
+        with self._lock:
+            if matchweek is None:
+                matchweek = max(self._weeks_played, 1)
+            self._apply(home, away, home_goals, away_goals, int(matchweek), 1)
+
+    def remove_result(self, home: str, away: str, home_goals: int, away_goals: int,
+                      matchweek: int):
+        """Undo a previously applied result (e.g. a corrected or provisional score)"""
+        with self._lock:
+            self._apply(home, away, home_goals, away_goals, int(matchweek), -1)
+
+    def apply_results(self, results: pd.DataFrame):
+        """Fold a batch of results in order"""
+        weeks = results['Matchweek'] if 'Matchweek' in results else [None] * len(results)
+        for home, away, home_goals, away_goals, week in zip(
+                results['Home_Team'], results['Away_Team'],
+                results['Home_Goals'], results['Away_Goals'], weeks):
+            self.apply_result(home, away, home_goals, away_goals, week)
+
+    @property
+    def matchweeks(self) -> int:
+        """Highest matchweek with a result"""
+        return self._weeks_played
+
+    def _head_to_head_order(self, group: List[int], max_week: Optional[int]) -> List[int]:
+        members = set(group)
+        mini = {i: [0, 0, 0] for i in group}  # points, goal difference, goals for
+        for week, h, a, home_goals, away_goals in self._results:
+            if h in members and a in members and (max_week is None or week <= max_week):
+                home_delta, away_delta = _result_delta(home_goals, away_goals)
+                for team, delta in ((h, home_delta), (a, away_delta)):
+                    mini[team][0] += 3 * delta[WON] + delta[DRAWN]
+                    mini[team][1] += delta[GOALS_FOR] - delta[GOALS_AGAINST]
+                    mini[team][2] += delta[GOALS_FOR]
+        return sorted(group, key=lambda i: (-mini[i][0], -mini[i][1], -mini[i][2]))
+
+    def _order(self, stats: np.ndarray, max_week: Optional[int] = None) -> List[int]:
+        points = 3 * stats[:, WON] + stats[:, DRAWN]
+        goal_diff = stats[:, GOALS_FOR] - stats[:, GOALS_AGAINST]
+        goals_for = stats[:, GOALS_FOR]
+        if max_week is None:
+            order = [key[-1] for key in self._keys]
+        else:
+            order = sorted(range(len(self.teams)),
+                           key=lambda i: (-points[i], -goal_diff[i], -goals_for[i], self.teams[i]))
+        if 'head_to_head' not in self.tiebreakers:
+            return order
+
+        # Re-rank groups level on points using the league's tie-breaker sequence
+        ranked = []
+        start = 0
+        while start < len(order):
+            end = start + 1
+            while end < len(order) and points[order[end]] == points[order[start]]:
+                end += 1
+            group = order[start:end]
+            if len(group) > 1:
+                h2h = self._head_to_head_order(group, max_week)
+                h2h_rank = {team: rank for rank, team in enumerate(h2h)}
+                criteria = {
+                    'head_to_head': lambda i: h2h_rank[i],
+                    'goal_difference': lambda i: -goal_diff[i],
+                    'goals_for': lambda i: -goals_for[i]
+                }
+                group = sorted(group, key=lambda i: tuple(criteria[c](i) for c in self.tiebreakers)
+                               + (self.teams[i],))
+            ranked.extend(group)
+            start = end
+        return ranked
+
+    def _frame(self, stats: np.ndarray, order: List[int]) -> pd.DataFrame:
+        stats = stats[order]
+        played = stats[:, PLAYED]
+        points = 3 * stats[:, WON] + stats[:, DRAWN]
+        safe_played = np.maximum(played, 1)
+        return pd.DataFrame({
+            'Position': np.arange(1, len(order) + 1),
+            'Team': [self.teams[i] for i in order],
+            'Played': played,
+            'Won': stats[:, WON],
+            'Drawn': stats[:, DRAWN],
+            'Lost': stats[:, LOST],
+            'Goals_For': stats[:, GOALS_FOR],
+            'Goals_Against': stats[:, GOALS_AGAINST],
+            'Goal_Difference': stats[:, GOALS_FOR] - stats[:, GOALS_AGAINST],
+            'Points': points,
+            'Win_Rate': np.where(played > 0, stats[:, WON] / safe_played * 100, 0.0).round(1),
+            'Points_Per_Game': np.where(played > 0, points / safe_played, 0.0).round(2)
+        }, columns=TABLE_COLUMNS)
+
+    def table(self) -> pd.DataFrame:
+        """Current league table"""
+        with self._lock:
+            return self._frame(self._stats, self._order(self._stats))
+
+    def positions(self) -> np.ndarray:
+        """Current 1-based position of every team, in ``self.teams`` order"""
+        with self._lock:
+            positions = np.empty(len(self.teams), dtype=np.int16)
+            positions[self._order(self._stats)] = np.arange(1, len(self.teams) + 1)
+            return positions
+
+    def _stats_as_of(self, matchweek: int) -> np.ndarray:
+        if self._prefix is None:
+            self._prefix = np.cumsum(self._week_deltas, axis=0, dtype=np.int32)
+        matchweek = min(max(matchweek, 0), len(self._prefix) - 1)
+        return self._prefix[matchweek]
+
+    def as_of(self, matchweek: int) -> pd.DataFrame:
+        """League table after all results up to and including matchweek"""
+        with self._lock:
+            stats = self._stats_as_of(matchweek)
+            return self._frame(stats, self._order(stats, max_week=matchweek))
+
+    def points_as_of(self, matchweek: int) -> np.ndarray:
+        """Points of every team after matchweek, in ``self.teams`` order"""
+        with self._lock:
+            stats = self._stats_as_of(matchweek)
+            return 3 * stats[:, WON] + stats[:, DRAWN]
+
+    def positions_as_of(self, matchweek: int) -> np.ndarray:
+        """1-based positions after matchweek, in ``self.teams`` order"""
+        with self._lock:
+            stats = self._stats_as_of(matchweek)
+            positions = np.empty(len(self.teams), dtype=np.int16)
+            positions[self._order(stats, max_week=matchweek)] = np.arange(1, len(self.teams) + 1)
+            return positions
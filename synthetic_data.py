@@ -0,0 +1,368 @@
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from data_fetcher import FOOTBALL_DATA_CODES, SUPPORTED_LEAGUES, SampleDataSource, current_season
+from prediction_engine import PoissonMatchModel
+from standings_engine import StandingsEngine
+
+POSITIONS = np.array(['Goalkeeper', 'Defender', 'Midfielder', 'Forward'])
+
+# Share of a squad in each position, and how goals and assists are spread
+# across positions
+SQUAD_SHAPE = np.array([0.12, 0.32, 0.32, 0.24])
+GOAL_WEIGHTS = np.array([0.002, 0.12, 0.35, 1.0])
+ASSIST_WEIGHTS = np.array([0.01, 0.35, 1.0, 0.7])
+ASSIST_RATE = 0.7
+
+# Rows per generated chunk
+CHUNK_SIZE = 100_000
+
+# Columns of the per-team season totals
+TOTAL_COLUMNS = ['Played', 'Won', 'Drawn', 'Lost', 'Goals_For', 'Goals_Against', 'Clean_Sheets']
+
+# Match columns and dtypes, for empty results and fixtures
+MATCH_DTYPES = {'Date': 'datetime64[ns]', 'Home_Team': object, 'Away_Team': object,
+                'Matchweek': np.int64, 'Home_Goals': np.int64, 'Away_Goals': np.int64}
+
+# Random stream tags, the first element of every seed key, so draws made
+# for different purposes never share a seed
+STRENGTHS, DRIFT, GOALS, SQUADS, PLAYERS, TEAM_STATS = range(6)
+
+
+def circle_round(n: int, week: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Home and away team indices of one matchweek of an n-team double
+    round-robin, the same pairing as ``schedule.double_round_robin``
+    computed for a single week. Odd leagues get a bye (dropped pairs).
+    """
+    slots = n + n % 2
+    half_weeks = slots - 1
+    rotation = np.roll(np.arange(1, slots), week % half_weeks)
+    lineup = np.concatenate([[0], rotation])
+    i = np.arange(slots // 2)
+    home, away = lineup[i], lineup[slots - 1 - i]
+    swap = np.where(i == 0, week % half_weeks, i) % 2 == 1
+    home, away = np.where(swap, away, home), np.where(swap, home, away)
+    if week >= half_weeks:
+        home, away = away, home
+    keep = (home < n) & (away < n)
+    return home[keep], away[keep]
+
+
+class SyntheticLeagueGenerator:
+    """
+    Deterministic synthetic leagues at any scale.
+
+    Every league has ``teams`` clubs whose attack and defence are spread
+    from the top of the table down, with seeded noise, and drift from
+    season to season. Matches follow a double round-robin, capped at
+    ``matchweeks`` if given. Scores are Poisson draws from the same model
+    the predictions use. Squads keep their players across seasons, and a
+    team's goals and assists are split among its players, so player totals
+    add up to the results. Each matchweek and each team-season draws from
+    its own seed, so output doesn't depend on the chunk size and any slice
+    can be regenerated alone. Everything is yielded in chunks, so memory
+    stays flat however large the league is.
+    """
+
+    def __init__(self, seed: int = 0, teams: int = 20, squad: int = 25, seasons: int = 5,
+                 leagues: Optional[Dict[str, str]] = None, matchweeks: Optional[int] = None,
+                 weeks_played: Optional[int] = None, season: Optional[int] = None,
+                 anchor: Optional[pd.Timestamp] = None):
+        self.seed = seed
+        self.n_teams = teams
+        self.squad = squad
+        self.n_seasons = seasons
+        self.leagues = dict(leagues or SUPPORTED_LEAGUES)
+        self.matchweeks = min(matchweeks or 2 * (teams + teams % 2 - 1), 2 * (teams + teams % 2 - 1))
+        # The current season is three quarters played unless told otherwise
+        self.weeks_played = weeks_played if weeks_played is not None else self.matchweeks * 3 // 4
+        self.season = season or current_season()
+        # The first unplayed matchweek of the current season falls the day after the anchor
+        self.anchor = pd.Timestamp(anchor if anchor is not None else pd.Timestamp.now()).normalize()
+        self._names: Dict[str, np.ndarray] = {}
+        self._model_cache: Dict[Tuple[str, int], PoissonMatchModel] = {}
+
+    def _rng(self, stream: int, *key: int) -> np.random.Generator:
+        """Generator for one stream (a tag above) and key within it"""
+        return np.random.default_rng([self.seed, stream, *key])
+
+    def seasons(self) -> List[int]:
+        """Generated seasons, newest first"""
+        return list(range(self.season, self.season - self.n_seasons, -1))
+
+    def teams(self, league_id: str) -> np.ndarray:
+        """Club names of a league, strongest first in the current season"""
+        if league_id not in self._names:
+            prefix = FOOTBALL_DATA_CODES.get(league_id, league_id)
+            width = len(str(self.n_teams))
+            self._names[league_id] = np.array([f'{prefix} Club {i + 1:0{width}d}' for i in range(self.n_teams)],
+                                              dtype=object)
+        return self._names[league_id]
+
+    def league_of(self, team: str) -> Optional[str]:
+        """League id of a generated club"""
+        prefix = team.split(' Club ')[0]
+        for league_id in self.leagues:
+            if FOOTBALL_DATA_CODES.get(league_id, league_id) == prefix:
+                return league_id
+        return None
+
+    def weeks_played_in(self, season: int) -> int:
+        return self.weeks_played if season == self.season else self.matchweeks
+
+    def strengths(self, league_id: str, season: int) -> pd.DataFrame:
+        """Per-match scoring and conceding rates, as a standings-shaped frame for the match model"""
+        rank = np.linspace(0, 1, self.n_teams)
+        noise = self._rng(STRENGTHS, int(league_id)).lognormal(0, 0.08, size=(self.n_teams, 2))
+        scoring = (2.3 - 1.3 * rank) * noise[:, 0]
+        conceding = (0.8 + 1.0 * rank) * noise[:, 1]
+        if season != self.season:
+            drift = self._rng(DRIFT, int(league_id), season).lognormal(0, 0.15, size=(self.n_teams, 2))
+            scoring, conceding = scoring * drift[:, 0], conceding * drift[:, 1]
+        return pd.DataFrame({'Team': self.teams(league_id), 'Played': 1,
+                             'Goals_For': scoring, 'Goals_Against': conceding})
+
+    def _model(self, league_id: str, season: int) -> PoissonMatchModel:
+        key = (league_id, season)
+        if key not in self._model_cache:
+            self._model_cache[key] = PoissonMatchModel().fit(self.strengths(league_id, season))
+        return self._model_cache[key]
+
+    def _week(self, league_id: str, season: int, week: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Home/away team indices and goals of one matchweek (1-based)"""
+        home, away = circle_round(self.n_teams, week - 1)
+        model = self._model(league_id, season)
+        home_xg = model.attack[home] * model.defence[away] * model.avg_home_goals
+        away_xg = model.attack[away] * model.defence[home] * model.avg_away_goals
+        rng = self._rng(GOALS, int(league_id), season, week)
+        return home, away, rng.poisson(home_xg), rng.poisson(away_xg)
+
+    def _week_chunks(self, first: int, last: int, chunk_size: int) -> Iterator[range]:
+        per_chunk = max(1, chunk_size // max(1, self.n_teams // 2))
+        for start in range(first, last + 1, per_chunk):
+            yield range(start, min(start + per_chunk, last + 1))
+
+    def _dates(self, season: int, weeks: np.ndarray) -> pd.DatetimeIndex:
+        first_open = self.anchor + pd.Timedelta(days=1) - pd.Timedelta(weeks=52 * (self.season - season))
+        return first_open + pd.to_timedelta((weeks - self.weeks_played - 1) * 7, unit='D')
+
+    def iter_matches(self, league_id: str, season: int, first_week: int = 1,
+                     last_week: Optional[int] = None, chunk_size: int = CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """Matches of whole matchweeks, scores included, about chunk_size rows at a time"""
+        last_week = self.matchweeks if last_week is None else min(last_week, self.matchweeks)
+        if last_week < first_week:
+            return
+        names = self.teams(league_id)
+        for weeks in self._week_chunks(first_week, last_week, chunk_size):
+            parts = [self._week(league_id, season, week) for week in weeks]
+            week_numbers = np.repeat(np.array(weeks), [len(part[0]) for part in parts])
+            home, away, home_goals, away_goals = (np.concatenate(column) for column in zip(*parts))
+            yield pd.DataFrame({
+                'Date': self._dates(season, week_numbers),
+                'Home_Team': names[home],
+                'Away_Team': names[away],
+                'Matchweek': week_numbers,
+                'Home_Goals': home_goals,
+                'Away_Goals': away_goals
+            })
+
+    def iter_results(self, league_id: str, season: int, chunk_size: int = CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """Played matches of a season"""
+        yield from self.iter_matches(league_id, season, 1, self.weeks_played_in(season), chunk_size)
+
+    def iter_fixtures(self, league_id: str, season: int, chunk_size: int = CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """Unplayed matches of a season (only the current one has any)"""
+        first = self.weeks_played_in(season) + 1
+        if first > self.matchweeks:
+            return
+        for chunk in self.iter_matches(league_id, season, first, chunk_size=chunk_size):
+            yield chunk[['Date', 'Home_Team', 'Away_Team', 'Matchweek']]
+
+    def totals(self, league_id: str, season: int) -> pd.DataFrame:
+        """Played/W/D/L/goals/clean sheets per team, accumulated over the results stream"""
+        totals = np.zeros((self.n_teams, len(TOTAL_COLUMNS)), dtype=np.int64)
+        for week in range(1, self.weeks_played_in(season) + 1):
+            home, away, home_goals, away_goals = self._week(league_id, season, week)
+            for team, scored, conceded in ((home, home_goals, away_goals), (away, away_goals, home_goals)):
+                totals[team] += np.column_stack([
+                    np.ones_like(scored), scored > conceded, scored == conceded, scored < conceded,
+                    scored, conceded, conceded == 0
+                ])
+        frame = pd.DataFrame(totals, columns=TOTAL_COLUMNS)
+        frame.insert(0, 'Team', self.teams(league_id))
+        return frame
+
+    def _squad(self, league_id: str, team: int) -> Dict[str, np.ndarray]:
+        """Season-independent identity of a club's players"""
+        rng = self._rng(SQUADS, int(league_id), team)
+        slots = (np.arange(self.squad) + 0.5) / self.squad
+        return {
+            'position': np.searchsorted(np.cumsum(SQUAD_SHAPE), slots),
+            'age': rng.integers(17, 36, self.squad),  # in the current season
+            'quality': rng.gamma(2.0, 0.5, self.squad),
+            'availability': rng.beta(5, 2, self.squad)
+        }
+
+    def _players(self, league_id: str, season: int, team: int, totals: np.ndarray) -> Dict[str, Any]:
+        played, goals_for = int(totals[0]), int(totals[4])
+        squad = self._squad(league_id, team)
+        rng = self._rng(PLAYERS, int(league_id), season, team)
+        matches = rng.binomial(played, squad['availability'])
+        minutes = np.round(matches * rng.uniform(55, 90, self.squad)).astype(np.int64)
+
+        def share(total, weights):
+            weights = weights[squad['position']] * squad['quality'] * matches
+            if total == 0 or weights.sum() == 0:
+                return np.zeros(self.squad, dtype=np.int64)
+            return rng.multinomial(total, weights / weights.sum())
+
+        names = self.teams(league_id)
+        return {
+            'Player': [f'{names[team]} Player {k + 1:02d}' for k in range(self.squad)],
+            'Team': np.full(self.squad, names[team], dtype=object),
+            'Position': POSITIONS[squad['position']],
+            'Age': squad['age'] - (self.season - season),
+            'Matches': matches,
+            'Minutes': minutes,
+            'Goals': share(goals_for, GOAL_WEIGHTS),
+            'Assists': share(rng.binomial(goals_for, ASSIST_RATE), ASSIST_WEIGHTS)
+        }
+
+    def iter_players(self, league_id: str, season: int, chunk_size: int = CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """Player season stats of whole squads; team goals equal their players' goals"""
+        totals = self.totals(league_id, season)[TOTAL_COLUMNS].to_numpy()
+        teams_per_chunk = max(1, chunk_size // self.squad)
+        label = f'{season}/{(season + 1) % 100:02d}'
+        for start in range(0, self.n_teams, teams_per_chunk):
+            parts = [self._players(league_id, season, team, totals[team])
+                     for team in range(start, min(start + teams_per_chunk, self.n_teams))]
+            chunk = pd.DataFrame({column: np.concatenate([part[column] for part in parts]) for column in parts[0]})
+            chunk.insert(2, 'League', self.leagues[league_id])
+            chunk.insert(4, 'Season', label)
+            yield chunk
+
+    def iter_all(self, kind: str, chunk_size: int = CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """Chunks of one kind (matches, results, fixtures, players) for every league and season"""
+        generate = getattr(self, f'iter_{kind}')
+        for league_id in self.leagues:
+            for season in self.seasons():
+                for chunk in generate(league_id, season, chunk_size=chunk_size):
+                    chunk.insert(0, 'League_Id', league_id)
+                    chunk.insert(1, 'Season_Year', season)
+                    yield chunk
+
+    def write(self, directory: str, kinds: Tuple[str, ...] = ('matches', 'players'),
+              chunk_size: int = CHUNK_SIZE) -> Dict[str, int]:
+        """Stream every league and season to ``<directory>/<kind>.arrow``; returns rows written per kind"""
+        os.makedirs(directory, exist_ok=True)
+        rows = {}
+        for kind in kinds:
+            rows[kind] = 0
+            writer = None
+            path = os.path.join(directory, f'{kind}.arrow')
+            with pa.OSFile(path + '.tmp', 'wb') as sink:
+                for chunk in self.iter_all(kind, chunk_size):
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if writer is None:
+                        writer = pa.ipc.new_file(sink, table.schema)
+                    writer.write_table(table)
+                    rows[kind] += len(chunk)
+                if writer is not None:
+                    writer.close()
+            os.replace(path + '.tmp', path)
+        return rows
+
+
+def _empty_matches(columns: List[str]) -> pd.DataFrame:
+    return pd.DataFrame({column: pd.Series(dtype=MATCH_DTYPES[column]) for column in columns})
+
+
+class SyntheticDataSource(SampleDataSource):
+    """SoccerDataFetcher source serving a SyntheticLeagueGenerator's data"""
+
+    def __init__(self, generator: Optional[SyntheticLeagueGenerator] = None, **options):
+        self.generator = generator or SyntheticLeagueGenerator(**options)
+        super().__init__(self.generator.season)
+
+    def available_seasons(self, league_id: str) -> List[int]:
+        return self.generator.seasons()
+
+    def _league(self, league_id: str) -> str:
+        if league_id not in self.generator.leagues:
+            raise KeyError(f"No synthetic data for league {league_id}")
+        return league_id
+
+    def load_results(self, league_id: str, season: Optional[Any] = None) -> pd.DataFrame:
+        chunks = list(self.generator.iter_results(self._league(league_id), self._season_year(season)))
+        if not chunks:
+            return _empty_matches(list(MATCH_DTYPES))
+        return pd.concat(chunks, ignore_index=True)
+
+    def load_league_standings(self, league_id: str, season: Optional[Any] = None) -> pd.DataFrame:
+        engine = StandingsEngine(self.generator.teams(self._league(league_id)), league_id)
+        engine.apply_results(self.load_results(league_id, season))
+        return engine.table()
+
+    def load_fixtures(self, league_id: str, season: Optional[Any] = None) -> pd.DataFrame:
+        chunks = list(self.generator.iter_fixtures(self._league(league_id), self._season_year(season)))
+        if not chunks:
+            return _empty_matches(['Date', 'Home_Team', 'Away_Team', 'Matchweek'])
+        return pd.concat(chunks, ignore_index=True)
+
+    def load_team_stats(self, team_name: Optional[str]) -> pd.DataFrame:
+        # Team pages cover the first league's current season
+        league_id = next(iter(self.generator.leagues))
+        standings = self.load_league_standings(league_id)
+        totals = self.generator.totals(league_id, self.season).set_index('Team').loc[standings['Team']]
+        played = totals['Played'].clip(lower=1).to_numpy()
+        # Possession, passing and shots follow goal difference per game, with seeded noise
+        edge = ((totals['Goals_For'] - totals['Goals_Against']) / played).to_numpy()
+        rng = self.generator._rng(TEAM_STATS, int(league_id), self.season)
+        noise = rng.normal(0, 1, size=(len(standings), 4))
+        df = pd.DataFrame({
+            'Team': standings['Team'],
+            'League Position': standings['Position'],
+            'Points': standings['Points'],
+            'Goals Scored': standings['Goals_For'],
+            'Goals Conceded': standings['Goals_Against'],
+            'Clean Sheets': totals['Clean_Sheets'].to_numpy(),
+            'Possession %': np.clip(50 + 8 * edge + 2 * noise[:, 0], 30, 75).round(1),
+            'Pass Accuracy %': np.clip(83 + 4 * edge + 1.5 * noise[:, 1], 65, 93).round(1),
+            'Shots per Game': np.clip(12.5 + 3 * edge + noise[:, 2], 5, 22).round(1),
+            'Tackles per Game': np.clip(16 - 1.5 * edge + noise[:, 3], 9, 24).round(1)
+        })
+        if team_name:
+            df = df[df['Team'].str.contains(team_name, case=False, na=False)]
+        return df
+
+    def load_players(self) -> pd.DataFrame:
+        return pd.concat(list(self.generator.iter_all('players')), ignore_index=True).drop(
+            columns=['League_Id', 'Season_Year'])
+
+    def load_historical_data(self, team: str, seasons: int) -> Dict:
+        league_id = self.generator.league_of(team)
+        if league_id is None:
+            raise KeyError(f"{team} is not a synthetic club")
+        seasons_data = []
+        for season in self.generator.seasons()[:seasons]:
+            standings = self.load_league_standings(league_id, season).set_index('Team')
+            row = standings.loc[team]
+            seasons_data.append({
+                'Season': f'{season}/{(season + 1) % 100:02d}',
+                'Position': int(row['Position']),
+                'Points': int(row['Points']),
+                'Goals': int(row['Goals_For']),
+                'Wins': int(row['Won']),
+                'Draws': int(row['Drawn']),
+                'Losses': int(row['Lost'])
+            })
+        return {
+            'team': team,
+            'seasons': seasons_data,
+            'trend': 'improving' if seasons_data[0]['Points'] > seasons_data[-1]['Points'] else 'declining'
+        }
@@ -3,42 +3,13 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from data_fetcher import data_fetcher
-import numpy as np
-
-# Simple analytics functions
-def calculate_form_points(recent_form):
-    """Calculate points from recent form"""
-    return sum([3 if x == 'W' else 1 if x == 'D' else 0 for x in recent_form])
-
-def calculate_team_momentum(recent_form):
-    """Calculate team momentum"""
-    points = [3 if x == 'W' else 1 if x == 'D' else 0 for x in recent_form]
-    trend = np.polyfit(range(len(points)), points, 1)[0]
-    return ("Positive" if trend > 0 else "Negative", abs(trend))
-
-def generate_season_projection(current_points, games_left):
-    """Generate season projection"""
-    ppg = current_points / (38 - games_left) if games_left < 38 else 2.0
-    projected_points = int(current_points + (ppg * games_left))
-    return {
-        'projected_points': projected_points,
-        'confidence': f"{min(95, max(60, int(ppg * 30)))}%",
-        'current_ppg': f"{ppg:.2f}"
-    }
-
-def create_form_guide(recent_form):
-    """Create form guide chart"""
-    form_data = {'Match': range(1, len(recent_form) + 1), 'Result': recent_form}
-    colors = ['green' if x == 'W' else 'yellow' if x == 'D' else 'red' for x in recent_form]
-    fig = px.bar(x=form_data['Match'], y=[1]*len(recent_form), color=colors, title="Recent Form")
-    return fig
-
-def create_team_performance_timeline(historical_data):
-    """Create performance timeline"""
-    seasons = [s['Season'] for s in historical_data['seasons']]
-    points = [s['Points'] for s in historical_data['seasons']]
-    fig = px.line(x=seasons, y=points, title="Historical Performance", markers=True)
-    return fig
+from form_store import get_form_store
+from instrumentation import tracer
+from paginated_table import paginated_table
+from league_aggregates import get_league_aggregates
+from refresh_scheduler import refresh_scheduler
+from season_simulator import simulate_season
+from visualizations import viz
 
 def show():
     """Display the Team Analysis page"""
@@ -46,7 +17,8 @@ def show():
     st.header("🏆 Team Analysis")
     st.markdown("In-depth team performance metrics and comparative analysis")
     
-    # Fetch team data
+    # Fetch team data; the scheduler keeps the league fresh while it's viewed
+    refresh_scheduler.watch('39')
     with st.spinner("Loading team data..."):
         team_df = data_fetcher.fetch_team_stats()
         league_df = data_fetcher.fetch_league_standings()
@@ -55,6 +27,10 @@ def show():
         st.error("No team data available")
         return
     
+    # League means, spreads, z-scores and ratings, computed once per data refresh
+    with tracer.span('transform.aggregates'):
+        aggregates = get_league_aggregates(team_df, '39', data_fetcher.season)
+    
     # Team selection for detailed analysis
     st.sidebar.subheader("Team Selection")
     available_teams = team_df['Team'].tolist()
@@ -117,14 +93,9 @@ def show():
             st.plotly_chart(fig_goals, use_container_width=True)
         
         with col_chart2:
-            # Performance metrics radar
+            # Performance metrics radar (league percentiles, precomputed)
             metrics = ['Possession %', 'Pass Accuracy %', 'Shots per Game', 'Tackles per Game']
-            values = [
-                team_data['Possession %'],
-                team_data['Pass Accuracy %'],
-                (team_data['Shots per Game'] / 20) * 100,  # Normalize to 0-100
-                (team_data['Tackles per Game'] / 25) * 100  # Normalize to 0-100
-            ]
+            values = list(aggregates.percentile(selected_team, metrics).values())
             
             fig_radar = go.Figure()
             fig_radar.add_trace(go.Scatterpolar(
@@ -136,36 +107,37 @@ def show():
             ))
             fig_radar.update_layout(
                 polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
-                title=f'{selected_team} - Performance Metrics',
+                title=f'{selected_team} - League Percentiles',
                 height=400
             )
             st.plotly_chart(fig_radar, use_container_width=True)
         
-        # Recent form simulation
+        # Recent form from the rolling per-team results store
         st.markdown("---")
         st.subheader("📊 Recent Form")
         
-        # Simulate recent form (in real app, this would come from API)
-        import random
-        random.seed(hash(selected_team) % 1000)  # Consistent results for each team
-        recent_form = random.choices(['W', 'D', 'L'], weights=[0.4, 0.3, 0.3], k=5)
+        form = get_form_store('39', data_fetcher.fetch_results(), season=data_fetcher.season)
+        recent_form = form.recent(selected_team)
         
-        form_points = calculate_form_points(recent_form)
-        momentum_dir, momentum_strength = calculate_team_momentum(recent_form * 2)  # Extend for momentum calc
-        
-        form_col1, form_col2, form_col3 = st.columns(3)
-        with form_col1:
-            st.metric("Form Points", f"{form_points}/15")
-        with form_col2:
-            st.metric("Momentum", f"{momentum_dir}")
-        with form_col3:
-            st.metric("Strength", momentum_strength)
-        
-        # Form visualization
-        st.plotly_chart(
-            create_form_guide(recent_form),
-            use_container_width=True
-        )
+        if recent_form:
+            # Form and momentum are computed for every team in one pass
+            form_row = form.team(selected_team)
+            
+            form_col1, form_col2, form_col3 = st.columns(3)
+            with form_col1:
+                st.metric("Form Points", f"{form_row['Form_Points']}/{3 * len(recent_form)}")
+            with form_col2:
+                st.metric("Momentum", form_row['Momentum'])
+            with form_col3:
+                st.metric("Strength", f"{form_row['Momentum_Strength']:.2f}")
+            
+            # Form visualization
+            st.plotly_chart(
+                viz.create_form_guide(recent_form),
+                use_container_width=True
+            )
+        else:
+            st.info(f"No recent results for {selected_team}")
     
     with tab2:
         st.subheader("Team Comparison")
@@ -183,24 +155,24 @@ def show():
             
             # Comparison metrics
             st.markdown("#### Key Metrics Comparison")
-            comparison_metrics = ['Points', 'Goals Scored', 'Goals Conceded', 'Clean Sheets']
+            numeric_metrics = [column for column in team_df.columns
+                               if column != 'Team' and pd.api.types.is_numeric_dtype(team_df[column])]
+            comparison_metrics = st.multiselect(
+                "Metrics",
+                numeric_metrics,
+                default=['Points', 'Goals Scored', 'Goals Conceded', 'Clean Sheets']
+            )
             
-            for metric in comparison_metrics:
-                fig = px.bar(
-                    comparison_df,
-                    x='Team',
-                    y=metric,
-                    title=f'{metric} Comparison',
-                    color='Team',
-                    color_discrete_sequence=px.colors.qualitative.Set3
+            # One faceted figure (one payload) instead of a chart per metric
+            if comparison_metrics:
+                st.plotly_chart(
+                    viz.create_team_comparison(team_df, comparison_teams, comparison_metrics),
+                    use_container_width=True
                 )
-                fig.update_layout(height=400, showlegend=False)
-                st.plotly_chart(fig, use_container_width=True)
             
             # Detailed comparison table
             st.markdown("#### Detailed Statistics")
-            display_comparison = comparison_df.set_index('Team')
-            st.dataframe(display_comparison, use_container_width=True)
+            paginated_table(comparison_df, key='team_comparison')
             
             # Head-to-head insights
             st.markdown("#### 🧠 Comparison Insights")
@@ -226,7 +198,7 @@ def show():
         if historical_data:
             # Historical performance chart
             st.plotly_chart(
-                create_team_performance_timeline(historical_data),
+                viz.create_team_performance_timeline(historical_data),
                 use_container_width=True
             )
             
@@ -234,21 +206,40 @@ def show():
             st.markdown("---")
             st.subheader("📊 Season Projection")
             
-            current_points = team_data['Points']
-            # Estimate games played (in real app, this would be actual data)
-            estimated_games = min(38, max(10, current_points // 2))  # Rough estimate
+            # Monte Carlo over the remaining fixtures
+            fixtures = data_fetcher.fetch_fixtures()
+            with tracer.span('transform.simulation'):
+                simulation = simulate_season(league_df, fixtures)
             
-            projection = generate_season_projection(current_points, estimated_games)
+            if selected_team in simulation.teams:
+                projection = simulation.team(selected_team)
+                
+                proj_col1, proj_col2, proj_col3, proj_col4 = st.columns(4)
+                with proj_col1:
+                    st.metric("Current Points", projection['Current_Points'])
+                with proj_col2:
+                    st.metric("Projected Final", f"{projection['Exp_Points']:.1f}")
+                with proj_col3:
+                    st.metric("80% Range", f"{projection['Points_P10']}-{projection['Points_P90']}")
+                with proj_col4:
+                    st.metric("Expected Position", f"{projection['Exp_Position']:.1f}")
+                
+                odds_col1, odds_col2, odds_col3 = st.columns(3)
+                with odds_col1:
+                    st.metric("Title Odds", f"{projection['Title_%']:.1f}%")
+                with odds_col2:
+                    st.metric("Top 4 Odds", f"{projection['Top4_%']:.1f}%")
+                with odds_col3:
+                    st.metric("Relegation Odds", f"{projection['Relegation_%']:.1f}%")
+            else:
+                st.info(f"{selected_team} is not in the current league table")
             
-            proj_col1, proj_col2, proj_col3, proj_col4 = st.columns(4)
-            with proj_col1:
-                st.metric("Current Points", current_points)
-            with proj_col2:
-                st.metric("Projected Final", f"{projection['projected_points']}")
-            with proj_col3:
-                st.metric("Confidence", projection['confidence'])
-            with proj_col4:
-                st.metric("Points per Game", f"{projection['current_ppg']}")
+            with st.expander("League outlook"):
+                paginated_table(simulation.table, key='season_projection', search_column='Team')
+                st.caption(
+                    f"{simulation.n_sims:,} simulated seasons "
+                    f"({simulation.throughput:,.0f} seasons/sec)"
+                )
         else:
             st.info("Historical data not available for this team")
     
@@ -275,14 +266,11 @@ def show():
         st.markdown("---")
         st.markdown("#### 📈 Performance Categories")
         
+        # Ratings are the team's standing vs the league (50 = league average)
+        ratings = aggregates.rating(selected_team)
         performance_data = {
-            'Category': ['Attack', 'Defense', 'Midfield', 'Overall'],
-            'Rating': [
-                min(100, (team_data['Goals Scored'] / 100) * 100),  # Attack rating
-                min(100, max(0, 100 - (team_data['Goals Conceded'] / 80) * 100)),  # Defense rating  
-                team_data['Pass Accuracy %'],  # Midfield rating
-                (team_data['Points'] / 114) * 100  # Overall rating (assuming max 114 points)
-            ]
+            'Category': list(ratings.keys()),
+            'Rating': list(ratings.values())
         }
         
         performance_df = pd.DataFrame(performance_data)
@@ -304,28 +292,9 @@ def show():
         st.markdown("---")
         st.markdown("#### 💪 Strengths & Weaknesses")
         
-        # Calculate relative performance vs league average
-        league_avg_goals = team_df['Goals Scored'].mean()
-        league_avg_conceded = team_df['Goals Conceded'].mean()
-        league_avg_possession = team_df['Possession %'].mean()
-        
-        strengths = []
-        weaknesses = []
-        
-        if team_data['Goals Scored'] > league_avg_goals * 1.1:
-            strengths.append("Strong attacking play")
-        elif team_data['Goals Scored'] < league_avg_goals * 0.9:
-            weaknesses.append("Lacks attacking threat")
-        
-        if team_data['Goals Conceded'] < league_avg_conceded * 0.9:
-            strengths.append("Solid defensive structure")
-        elif team_data['Goals Conceded'] > league_avg_conceded * 1.1:
-            weaknesses.append("Defensive vulnerabilities")
-        
-        if team_data['Possession %'] > league_avg_possession * 1.05:
-            strengths.append("Excellent ball control")
-        elif team_data['Possession %'] < league_avg_possession * 0.95:
-            weaknesses.append("Struggles to keep possession")
+        # Precomputed: metrics well above or below the league average
+        strengths = aggregates.strengths(selected_team)
+        weaknesses = aggregates.weaknesses(selected_team)
         
         strength_col, weakness_col = st.columns(2)
         
@@ -0,0 +1,54 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cache import frame_fingerprint
+from data_fetcher import SampleDataSource, SoccerDataFetcher
+
+
+def test_invalidate_matches_endpoint_keys():
+    fetcher = SoccerDataFetcher(SampleDataSource())
+    fetcher.fetch_league_standings('39')
+    fetcher.fetch_team_stats('Arsenal')
+
+    fetcher.invalidate(team_name='Arsenal')
+    assert fetcher.cache_stats()['fetch_team_stats']['size'] == 0
+    assert fetcher.cache_stats()['fetch_league_standings']['size'] == 1
+
+    fetcher.invalidate('fetch_league_standings', league_id='39')
+    assert fetcher.cache_stats()['fetch_league_standings']['size'] == 0
+
+
+class _PartialSource(SampleDataSource):
+    """Drops one league from batch standings loads"""
+
+    def load_many_league_standings(self, league_ids, season=None):
+        loaded = super().load_many_league_standings(league_ids, season)
+        loaded.pop('140', None)
+        return loaded
+
+
+def test_failed_league_doesnt_drop_the_others():
+    fetcher = SoccerDataFetcher(_PartialSource())
+    errors = {}
+    standings = fetcher.fetch_all_league_standings(['39', '140', '135'], errors=errors)
+
+    assert sorted(standings) == ['135', '39']
+    assert len(standings['39']) == 20
+    assert isinstance(errors['140'], KeyError)
+    assert fetcher.coalescing_stats()['in_flight'] == 0
+    assert len(fetcher.fetch_league_standings('39')) == 20
+
+
+def test_fetched_frames_are_views_with_their_fingerprint():
+    fetcher = SoccerDataFetcher(SampleDataSource())
+    results = fetcher.fetch_results('39')
+    assert frame_fingerprint(results) == frame_fingerprint(results.copy())
+
+    results.loc[0, 'Home_Goals'] = 99
+    results['Extra'] = 1
+    fresh = fetcher.fetch_results('39')
+    assert fresh.loc[0, 'Home_Goals'] != 99
+    assert 'Extra' not in fresh
+    assert frame_fingerprint(results) == frame_fingerprint(results.copy())
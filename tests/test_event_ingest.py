@@ -0,0 +1,136 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from data_fetcher import SampleDataSource, SoccerDataFetcher
+from event_ingest import EventIngest, LiveLeague, MatchEvent, replay
+
+
+class _ReportingSource(SampleDataSource):
+    """Sample data plus results the test reports, as an upstream catching up would"""
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__()
+        self.reported = []
+        self.delay = delay
+
+    def load_results(self, league_id, season=None):
+        time.sleep(self.delay)
+        results = super().load_results(league_id, season)
+        if self.reported and str(league_id) == '39':
+            results = pd.concat([results, pd.DataFrame(self.reported)], ignore_index=True)
+        return results
+
+
+def _points(fetcher, team):
+    table = fetcher.fetch_league_standings('39')
+    return int(table.loc[table['Team'] == team, 'Points'].iloc[0])
+
+
+def _first_fixture(league):
+    fixture = league.fixtures.iloc[0]
+    return fixture['Home_Team'], fixture['Away_Team'], int(fixture['Matchweek'])
+
+
+def test_refresh_keeps_live_score():
+    fetcher = SoccerDataFetcher(SampleDataSource())
+    league = LiveLeague(fetcher, '39')
+    home, away, _ = _first_fixture(league)
+    before = _points(fetcher, home)
+
+    league.publish(league.apply(MatchEvent('goal', '39', home, away, team=home, minute=10)))
+    assert _points(fetcher, home) == before + 3
+
+    assert not fetcher.refresh('fetch_league_standings', '39')
+    assert _points(fetcher, home) == before + 3
+
+
+def test_published_data_outlives_its_ttl():
+    fetcher = SoccerDataFetcher(SampleDataSource(), cache_policy={'fetch_league_standings': (32, 0.2)})
+    league = LiveLeague(fetcher, '39')
+    home, away, _ = _first_fixture(league)
+    before = _points(fetcher, home)
+
+    league.publish(league.apply(MatchEvent('goal', '39', home, away, team=home, minute=10)))
+    time.sleep(0.3)
+    assert _points(fetcher, home) == before + 3
+
+
+def test_finished_result_is_held_until_the_source_reports_it():
+    source = _ReportingSource()
+    fetcher = SoccerDataFetcher(source)
+    league = LiveLeague(fetcher, '39')
+    home, away, week = _first_fixture(league)
+    before = _points(fetcher, home)
+
+    league.publish(league.apply(MatchEvent('kickoff', '39', home, away)))
+    league.publish(league.apply(MatchEvent('full_time', '39', home, away, home_goals=2, away_goals=0)))
+    assert not fetcher.refresh('fetch_results', '39')
+    assert _points(fetcher, home) == before + 3
+
+    source.reported.append({'Date': pd.Timestamp.now().normalize(), 'Matchweek': week, 'Home_Team': home,
+                            'Away_Team': away, 'Home_Goals': 2, 'Away_Goals': 0})
+    fetcher.refresh('fetch_results', '39')
+    assert not fetcher.is_held('39')
+    fetcher.refresh('fetch_league_standings', '39')
+    assert _points(fetcher, home) == before + 3
+
+
+def test_next_kickoff_starts_from_refreshed_data():
+    source = _ReportingSource()
+    fetcher = SoccerDataFetcher(source)
+    league = LiveLeague(fetcher, '39')
+    home, away, week = _first_fixture(league)
+    other_home, other_away = league.fixtures.iloc[1][['Home_Team', 'Away_Team']]
+    before = _points(fetcher, home)
+
+    # The source reports a match the feed never saw
+    source.reported.append({'Date': pd.Timestamp.now().normalize(), 'Matchweek': week, 'Home_Team': home,
+                            'Away_Team': away, 'Home_Goals': 1, 'Away_Goals': 0})
+    fetcher.refresh('fetch_results', '39')
+    fetcher.refresh('fetch_league_standings', '39')
+
+    league.publish(league.apply(MatchEvent('kickoff', '39', other_home, other_away)))
+    assert _points(fetcher, home) == before + 3
+
+
+def test_skipped_refresh_never_leaks_into_fetches():
+    source = _ReportingSource(delay=0.3)
+    fetcher = SoccerDataFetcher(source)
+    refreshed = []
+    thread = threading.Thread(target=lambda: refreshed.append(fetcher.refresh('fetch_results', '39')))
+    thread.start()
+    time.sleep(0.05)
+    fetcher.hold('39')
+    results = fetcher.fetch_results('39')
+    thread.join()
+
+    assert isinstance(results, pd.DataFrame)
+    assert refreshed == [False]
+
+
+def test_ingest_survives_a_failing_publish():
+    fetcher = SoccerDataFetcher(SampleDataSource())
+    league = LiveLeague(fetcher, '39')
+    home, away, _ = _first_fixture(league)
+    calls = []
+
+    def on_update(league_id, endpoint):
+        calls.append(endpoint)
+        if len(calls) == 1:
+            raise RuntimeError("listener failed")
+
+    ingest = EventIngest(fetcher, on_update=on_update, max_batch=1)
+    events = [MatchEvent('kickoff', '39', home, away), MatchEvent('goal', '39', home, away, team=home)]
+    asyncio.run(ingest.run(replay(events)))
+
+    stats = ingest.stats()
+    assert stats['received'] == 2
+    assert stats['failed'] == 1
+    assert len(calls) == 2
@@ -0,0 +1,45 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from fixture_index import FixtureIndex, fixture_ids
+
+
+def _fixtures():
+    return pd.DataFrame({
+        'Date': pd.to_datetime(['2026-10-24 15:00', '2026-10-24 17:30', '2026-10-31 15:00', '2027-03-06 15:00']),
+        'Home_Team': ['Arsenal', 'Chelsea', 'Liverpool', 'Arsenal'],
+        'Away_Team': ['Chelsea', 'Liverpool', 'Arsenal', 'Chelsea'],
+        'Matchweek': [9, 9, 10, 28]
+    })
+
+
+def test_ids_survive_played_matches_dropping_out():
+    # Arsenal host Chelsea twice; the later meeting keeps its id once the first is played
+    for fixtures in (_fixtures(), _fixtures().drop(columns='Matchweek')):
+        before = fixture_ids(fixtures)
+        after = fixture_ids(fixtures.iloc[1:])
+        assert (before[1:] == after).all()
+        assert len(set(before)) == len(before)
+
+
+def test_ids_survive_a_reschedule():
+    fixtures = _fixtures()
+    moved = fixtures.copy()
+    moved.loc[1, 'Date'] = pd.Timestamp('2026-12-02 19:45')
+    assert (fixture_ids(moved) == fixture_ids(fixtures)).all()
+
+
+def test_index_queries_by_date_and_team():
+    index = FixtureIndex(_fixtures())
+    october = index.rows(index.query(pd.Timestamp('2026-10-01'), pd.Timestamp('2026-10-31')))
+    assert len(october) == 3
+    arsenal = index.rows(index.query(teams=['Arsenal']))
+    assert arsenal['Date'].is_monotonic_increasing
+    assert len(arsenal) == 3
+    fixture_id = int(october.index[0])
+    assert fixture_id in index
+    assert index.label(fixture_id) == 'Arsenal vs Chelsea'
@@ -0,0 +1,55 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from form_store import FormStore, get_form_store
+
+
+def _results(scores):
+    return pd.DataFrame({
+        'Matchweek': range(1, len(scores) + 1),
+        'Home_Team': 'Arsenal',
+        'Away_Team': [f'Opponent {i}' for i in range(len(scores))],
+        'Home_Goals': [home for home, _ in scores],
+        'Away_Goals': [away for _, away in scores]
+    })
+
+
+def test_ring_buffer_keeps_the_latest_window():
+    store = FormStore(window=3)
+    store.record_results(_results([(1, 0), (0, 0), (0, 2), (3, 1), (2, 2)]))
+    assert store.recent('Arsenal', 5) == ['L', 'W', 'D']
+    assert store.recent('Opponent 4', 5) == ['D']
+    assert store.recent('Unknown', 5) == []
+
+
+def test_short_histories_are_padded_with_nan():
+    store = FormStore(['Arsenal', 'Chelsea'], window=4)
+    store.record('Arsenal', 'Fulham', 2, 1)
+    points = store.points_matrix()
+    assert np.isnan(points[0, :3]).all() and points[0, 3] == 3
+    assert np.isnan(points[1]).all()
+    assert store.teams == ['Arsenal', 'Chelsea', 'Fulham']
+
+
+def test_table_summarises_form():
+    store = FormStore(window=5)
+    store.record_results(_results([(0, 1), (1, 1), (2, 0), (3, 0)]))
+    arsenal = store.team('Arsenal')
+    assert arsenal['Form'] == 'LDWW'
+    assert arsenal['Form_Points'] == 7
+    assert arsenal['Momentum'] == 'Positive'
+
+
+def test_shared_store_appends_new_results_and_rebuilds_on_corrections():
+    scores = [(1, 0), (0, 0), (0, 2)]
+    store = get_form_store('test-league', _results(scores), season='2026')
+    assert get_form_store('test-league', _results(scores + [(4, 0)]), season='2026') is store
+    assert store.recent('Arsenal') == ['W', 'D', 'L', 'W']
+
+    corrected = get_form_store('test-league', _results([(0, 1)] + scores[1:] + [(4, 0)]), season='2026')
+    assert corrected.recent('Arsenal') == ['L', 'D', 'L', 'W']
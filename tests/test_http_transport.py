@@ -0,0 +1,127 @@
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from data_fetcher import UpstreamDataSource
+from http_transport import AsyncTransport, ProviderConfig, TransportError
+
+
+class _Stub(BaseHTTPRequestHandler):
+    """Local upstream: /slow sleeps, /flaky fails its first attempts, /matches serves fixtures"""
+
+    def do_GET(self):
+        server = self.server
+        path = urlparse(self.path).path
+        with server.lock:
+            server.hits[path] = server.hits.get(path, 0) + 1
+            hits = server.hits[path]
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+        try:
+            if path == '/slow':
+                time.sleep(0.2)
+                self._send(200, {'ok': True})
+            elif path == '/flaky':
+                if hits <= 2:
+                    self._send(503 if hits == 1 else 429, {}, {'Retry-After': '0'})
+                else:
+                    self._send(200, {'attempts': hits})
+            elif path == '/competitions/PL/matches':
+                self._send(200, {'matches': [{
+                    'utcDate': '2026-10-24T14:00:00Z', 'matchday': 9,
+                    'homeTeam': {'name': 'Arsenal'}, 'awayTeam': {'name': 'Chelsea'}
+                }]})
+            else:
+                self._send(404, {})
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def _send(self, status, body, headers=None):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Stub)
+    server.lock = threading.Lock()
+    server.hits, server.active, server.peak = {}, 0, 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _transport(server, name='stub', **config):
+    config = {'rate_per_sec': 1000, 'burst': 100, 'pool_size': 8, **config}
+    url = f'http://127.0.0.1:{server.server_address[1]}'
+    return AsyncTransport({name: ProviderConfig(url, **config)}, max_concurrency=4, backoff=0.01)
+
+
+def test_calls_run_concurrently_up_to_the_limit(stub):
+    transport = _transport(stub)
+    start = time.perf_counter()
+    results = transport.get_many([('stub', 'slow', None)] * 8)
+    elapsed = time.perf_counter() - start
+    transport.close()
+
+    assert results == [{'ok': True}] * 8
+    assert stub.peak == 4
+    assert elapsed < 0.2 * 8 / 2
+
+
+def test_token_bucket_paces_requests(stub):
+    transport = _transport(stub, rate_per_sec=20, burst=2)
+    start = time.perf_counter()
+    transport.get_many([('stub', 'missing', {'i': i}) for i in range(6)])
+    elapsed = time.perf_counter() - start
+    transport.close()
+
+    # Two from the burst, then four at 20 per second
+    assert elapsed >= 4 / 20 * 0.9
+
+
+def test_transient_failures_are_retried(stub):
+    transport = _transport(stub)
+    flaky, missing = transport.get_many([('stub', 'flaky', None), ('stub', 'missing', None)])
+    transport.close()
+
+    assert flaky == {'attempts': 3}
+    assert isinstance(missing, TransportError) and missing.status == 404
+    assert stub.hits['/missing'] == 1
+
+
+def test_retries_give_up_with_the_last_status(stub):
+    transport = _transport(stub, retries=1)
+    result = transport.get_many([('stub', 'flaky', None)])[0]
+    transport.close()
+
+    assert isinstance(result, TransportError) and result.status == 429
+
+
+def test_upstream_fixtures_carry_matchweeks(stub):
+    source = UpstreamDataSource(_transport(stub, name='football-data'), season=2026)
+    fixtures = source.load_fixtures('39')
+    source.transport.close()
+
+    assert list(fixtures.columns) == ['Date', 'Home_Team', 'Away_Team', 'Matchweek']
+    assert fixtures['Matchweek'].tolist() == [9]
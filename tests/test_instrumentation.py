@@ -0,0 +1,56 @@
+import json
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from instrumentation import Tracer, instrument_streamlit, uninstrument_streamlit
+
+
+def test_concurrent_flushes_write_whole_files(tmp_path):
+    tracer = Tracer(metrics_dir=str(tmp_path), flush_interval=0)
+    tracer.record('page', 'render', 0.01)
+    errors = []
+
+    def flush():
+        try:
+            for _ in range(20):
+                tracer.flush()
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=flush) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert sorted(os.listdir(tmp_path)) == ['spans.json', 'spans.prom']
+    assert json.loads((tmp_path / 'spans.json').read_text())['spans'][0]['Page'] == 'page'
+
+
+def test_failed_export_never_breaks_the_page(tmp_path):
+    blocker = tmp_path / 'not-a-dir'
+    blocker.write_text('')
+    tracer = Tracer(metrics_dir=str(blocker), flush_interval=0)
+
+    with tracer.page('home'):
+        pass
+
+    assert len(tracer) == 1
+
+
+def test_streamlit_instrumentation_is_reversible():
+    import streamlit as st
+    from streamlit.delta_generator import DeltaGenerator
+    original = DeltaGenerator.dataframe, st.dataframe
+
+    instrument_streamlit()
+    patched = DeltaGenerator.dataframe
+    instrument_streamlit()
+    assert DeltaGenerator.dataframe is patched is not original[0]
+
+    uninstrument_streamlit()
+    assert (DeltaGenerator.dataframe, st.dataframe) == original
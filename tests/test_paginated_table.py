@@ -0,0 +1,47 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from paginated_table import TableView, get_table_view, zone_styles
+
+
+def _frame():
+    return pd.DataFrame({
+        'Player': ['Saka', 'Salah', 'Haaland', 'Palmer', 'Isak'],
+        'Team': pd.Categorical(['Arsenal', 'Liverpool', 'Man City', 'Chelsea', 'Newcastle']),
+        'Goals': [12, 18, 22, 15, np.nan]
+    })
+
+
+def test_view_is_reused_for_the_same_content():
+    first = get_table_view('test_players', _frame())
+    assert get_table_view('test_players', _frame()) is first
+
+    changed = _frame()
+    changed.loc[0, 'Goals'] = 13
+    assert get_table_view('test_players', changed) is not first
+
+
+def test_query_searches_then_sorts_the_selected_rows():
+    view = TableView(_frame())
+    positions = view.query(rows=[0, 1, 2, 4], sort_by='Goals', ascending=False)
+    # Missing values sort last in either direction
+    assert positions.tolist() == [2, 1, 0, 4]
+    assert view.query(search='sa', search_column='Player').tolist() == [0, 1, 4]
+    assert view.query(search='man', search_column='Team').tolist() == [2]
+
+
+def test_page_ships_only_its_rows_and_categories():
+    view = TableView(_frame())
+    page = view.page(view.query(sort_by='Player'), page=2, page_size=2, columns=['Player', 'Team'])
+    assert page['Player'].tolist() == ['Palmer', 'Saka']
+    assert list(page['Team'].cat.categories) == ['Arsenal', 'Chelsea']
+
+
+def test_zone_styles_count_negative_positions_from_the_bottom():
+    styles = zone_styles([1, 2, 10, 18, 20], [(1, 1, 'gold'), (-3, -1, 'red')], table_size=20)
+    assert styles.tolist() == ['gold', '', '', 'red', 'red']
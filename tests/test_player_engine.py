@@ -0,0 +1,71 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from player_engine import PercentileTable, PlayerStore
+
+
+def _players():
+    return pd.DataFrame({
+        'Player': ['A', 'B', 'C', 'D', 'E', 'F'],
+        'Team': ['Arsenal', 'Arsenal', 'Chelsea', 'Chelsea', 'Fulham', 'Fulham'],
+        'League': ['Premier League'] * 4 + ['Championship'] * 2,
+        'Position': ['Forward', 'Forward', 'Forward', 'Midfielder', 'Forward', 'Forward'],
+        'Season': '2026/27',
+        'Matches': [10, 10, 10, 10, 10, 10],
+        'Minutes': [900, 450, 900, 900, 900, 900],
+        'Goals': [9, 3, 6, 2, 1, 4],
+        'Assists': [1, 2, 3, 6, 0, 2]
+    })
+
+
+def test_store_filters_through_its_indexes():
+    store = PlayerStore(_players())
+    assert store.filter(league='Premier League', position='Forward')['Player'].tolist() == ['A', 'B', 'C']
+    assert store.filter(min_minutes=600, team=['Arsenal', 'Fulham'])['Player'].tolist() == ['A', 'E', 'F']
+    assert store.options('Team', league='Championship') == ['Fulham']
+    assert store.frame.loc[1, 'Goals_per_90'] == pytest.approx(0.6)
+
+
+def test_players_are_ranked_within_their_peer_group():
+    store = PlayerStore(_players())
+    ranks = PercentileTable().refresh(store.frame).lookup(store.frame).set_index('Player')
+    # Premier League forwards A, B, C; Championship forwards E, F; D alone
+    assert ranks.loc[['A', 'C', 'B'], 'Goals'].tolist() == pytest.approx([100.0, 66.7, 33.3])
+    assert ranks.loc[['F', 'E'], 'Goals'].tolist() == [100.0, 50.0]
+    assert ranks.loc['D', 'Goals'] == 100.0
+
+
+def test_refresh_reranks_only_changed_groups():
+    players = _players()
+    table = PercentileTable().refresh(PlayerStore(players).frame)
+    assert table.last_refresh == {'groups': 3, 'recomputed': 3}
+
+    players.loc[players['Player'] == 'E', 'Goals'] = 8
+    table.refresh(PlayerStore(players).frame)
+    assert table.last_refresh == {'groups': 3, 'recomputed': 1}
+    ranks = table.lookup(PlayerStore(players).frame).set_index('Player')
+    assert ranks.loc['E', 'Goals'] == 100.0
+    assert ranks.loc['A', 'Goals'] == 100.0
+
+    full = PercentileTable().refresh(PlayerStore(players).frame)
+    np.testing.assert_array_equal(table.ranks.to_numpy(), full.ranks.to_numpy())
+
+
+def test_players_missing_a_peer_key_are_ranked_together():
+    players = _players()
+    players.loc[players['Player'].isin(['B', 'D']), 'Position'] = None
+    table = PercentileTable().refresh(PlayerStore(players).frame)
+    ranks = table.lookup(PlayerStore(players).frame).set_index('Player')
+    assert not ranks.isna().any().any()
+    # B and D share the Premier League's missing-position group
+    assert ranks.loc[['A', 'C'], 'Goals'].tolist() == [100.0, 50.0]
+    assert ranks.loc[['B', 'D'], 'Goals'].tolist() == [100.0, 50.0]
+
+    table.refresh(PlayerStore(players).frame)
+    assert table.last_refresh == {'groups': 3, 'recomputed': 0}
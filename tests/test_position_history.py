@@ -0,0 +1,54 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import pytest
+
+from position_history import PositionHistory
+from synthetic_data import SyntheticDataSource
+
+
+def test_large_league_positions_dont_wrap():
+    source = SyntheticDataSource(teams=200, seasons=1, leagues={'39': 'Premier League'}, matchweeks=40)
+    results = source.load_results('39', str(source.season))
+    # The week axis grows to the season's length instead of cutting it short
+    history = PositionHistory('39', max_weeks=10)
+    history.ingest(str(source.season), results)
+
+    assert history.positions.shape == (1, results['Matchweek'].max(), 200)
+    assert history.positions.min() >= 0
+    assert history.positions.max() == 200
+
+
+def test_record_matchweek_out_of_range_raises():
+    history = PositionHistory('39', max_weeks=38)
+    with pytest.raises(ValueError):
+        history.record_matchweek('2025', 39, ['A'], [1], [3])
+
+
+def test_season_without_results_has_an_empty_trend():
+    source = SyntheticDataSource(teams=20, seasons=1, weeks_played=0, leagues={'39': 'Premier League'})
+    season = str(source.season)
+    history = PositionHistory('39')
+    history.ingest(season, source.load_results('39'))
+
+    assert season in history.seasons
+    assert history.trend(['PL Club 01'], season).empty
+    assert history.trend(['PL Club 01'], '1999').empty
+
+
+def test_corrected_score_rewrites_the_table():
+    results = pd.DataFrame({'Matchweek': [1, 1], 'Home_Team': ['A', 'C'], 'Away_Team': ['B', 'D'],
+                            'Home_Goals': [1, 0], 'Away_Goals': [0, 0]})
+    history = PositionHistory('39', max_weeks=2)
+    history.ingest('2025', results)
+    assert history.trend(['A'], '2025')['Points'].tolist() == [3]
+
+    corrected = results.assign(Home_Goals=[0, 0], Away_Goals=[2, 0])
+    history.ingest('2025', corrected)
+    trend = history.trend(['A', 'B'], '2025').set_index('Team')
+    assert trend.loc['A', 'Points'] == 0
+    assert trend.loc['B', 'Points'] == 3
+    assert trend.loc['B', 'Position'] == 1
@@ -0,0 +1,68 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+from scipy.stats import poisson
+
+from prediction_engine import PoissonMatchModel
+
+
+def _standings():
+    return pd.DataFrame({
+        'Team': ['Strong', 'Average', 'Weak'],
+        'Played': [10, 10, 10],
+        'Goals_For': [25, 12, 5],
+        'Goals_Against': [5, 12, 25]
+    })
+
+
+def test_without_correction_scores_are_independent_poisson():
+    model = PoissonMatchModel(max_goals=15, rho=0.0)
+    matrix = model.score_matrices(np.array([1.6]), np.array([1.1]))[0]
+    expected = np.outer(poisson.pmf(np.arange(16), 1.6), poisson.pmf(np.arange(16), 1.1))
+    np.testing.assert_allclose(matrix, expected / expected.sum(), rtol=1e-9)
+
+
+def test_dixon_coles_moves_probability_to_low_scoring_draws():
+    home_xg, away_xg = np.array([1.4, 0.9]), np.array([1.1, 0.7])
+    plain = PoissonMatchModel(rho=0.0).score_matrices(home_xg, away_xg)
+    adjusted = PoissonMatchModel(rho=-0.1).score_matrices(home_xg, away_xg)
+
+    np.testing.assert_allclose(adjusted.sum(axis=(1, 2)), 1.0)
+    assert (adjusted[:, 0, 0] > plain[:, 0, 0]).all()
+    assert (adjusted[:, 1, 1] > plain[:, 1, 1]).all()
+    assert (adjusted[:, 1, 0] < plain[:, 1, 0]).all()
+
+
+def test_batch_predictions_match_single_fixtures():
+    model = PoissonMatchModel().fit(_standings())
+    fixtures = pd.DataFrame({'Home_Team': ['Strong', 'Weak', 'Promoted'],
+                             'Away_Team': ['Weak', 'Strong', 'Average']})
+    batch = model.predict(fixtures)
+
+    for i, fixture in fixtures.iterrows():
+        single = model.predict_match(fixture['Home_Team'], fixture['Away_Team'])
+        assert single == batch.loc[i].to_dict()
+    np.testing.assert_allclose(batch[['Home_Win_Prob', 'Draw_Prob', 'Away_Win_Prob']].sum(axis=1), 100, atol=0.2)
+
+
+def test_strengths_favour_the_better_side():
+    model = PoissonMatchModel().fit(_standings())
+    strong_home = model.predict_match('Strong', 'Weak')
+    weak_home = model.predict_match('Weak', 'Strong')
+    assert strong_home['Home_Win_Prob'] > 80
+    assert weak_home['Away_Win_Prob'] > weak_home['Home_Win_Prob']
+    # Home advantage: the same pairing is better for whoever hosts it
+    assert strong_home['Home_Win_Prob'] > weak_home['Away_Win_Prob']
+
+
+def test_unknown_teams_get_league_average_strength():
+    model = PoissonMatchModel().fit(_standings())
+    home_xg, away_xg = model.expected_goals(['Promoted', 'Relegated'], ['Newcomer', 'Weak'])
+    assert home_xg[0] == model.avg_home_goals
+    assert away_xg[0] == model.avg_away_goals
+    weak = model.teams.get_loc('Weak')
+    assert home_xg[1] == model.defence[weak] * model.avg_home_goals
@@ -0,0 +1,57 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from season_simulator import SIM_WORK_BUDGET, SeasonSimulator, chunk_size_for, simulate_season
+
+
+def _league(leader_points=30):
+    teams = ['A', 'B', 'C', 'D', 'E', 'F']
+    standings = pd.DataFrame({
+        'Team': teams,
+        'Played': 5,
+        'Points': [leader_points, 9, 8, 7, 5, 3],
+        'Goals_For': [15, 9, 8, 7, 6, 4],
+        'Goals_Against': [2, 6, 7, 8, 9, 12]
+    })
+    home, away = np.triu_indices(len(teams), k=1)
+    fixtures = pd.DataFrame({'Home_Team': np.array(teams)[away], 'Away_Team': np.array(teams)[home]})
+    return standings, fixtures
+
+
+def test_probabilities_are_consistent():
+    standings, fixtures = _league()
+    result = SeasonSimulator(standings, fixtures, relegation_spots=2).simulate(5_000, seed=1)
+    table = result.table.set_index('Team')
+
+    assert np.isclose(table['Title_%'].sum(), 100, atol=0.5)
+    assert np.isclose(table['Top4_%'].sum(), 400, atol=0.5)
+    assert np.isclose(table['Relegation_%'].sum(), 200, atol=0.5)
+    assert np.isclose(table['Exp_Position'].sum(), 21, atol=0.05)
+    # Five games can't close a 21-point gap
+    assert table.loc['A', 'Title_%'] == 100
+    assert (table['Exp_Points'] >= table['Current_Points']).all()
+
+
+def test_chunking_and_workers_dont_change_results():
+    standings, fixtures = _league(leader_points=10)
+    simulator = SeasonSimulator(standings, fixtures)
+    serial = simulator.simulate(4_000, seed=7, chunk_size=1_000)
+    pooled = simulator.simulate(4_000, seed=7, chunk_size=1_000, workers=2)
+    pd.testing.assert_frame_equal(serial.table, pooled.table)
+
+
+def test_chunk_sizes_follow_the_memory_budget():
+    assert chunk_size_for(190, 20) > chunk_size_for(25_000, 5_000)
+    assert chunk_size_for(25_000, 5_000, budget_bytes=1) == 1
+
+
+def test_page_simulation_is_sized_to_the_work_budget():
+    standings, fixtures = _league()
+    assert simulate_season(standings, fixtures, n_sims=2_000).n_sims == 2_000
+    many = pd.concat([fixtures] * (SIM_WORK_BUDGET // len(fixtures) // 500), ignore_index=True)
+    assert simulate_season(standings, many, n_sims=100_000).n_sims < 100_000
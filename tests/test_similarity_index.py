@@ -0,0 +1,73 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from player_engine import PlayerStore
+from similarity_index import SimilarityIndex
+
+POSITIONS = ['Goalkeeper', 'Defender', 'Midfielder', 'Forward']
+
+
+@pytest.fixture(scope='module')
+def store():
+    rng = np.random.default_rng(7)
+    n = 4_000
+    position = rng.integers(0, 4, n)
+    attack = np.array([0.05, 0.6, 1.5, 3.0])[position] * rng.lognormal(0, 0.5, n)
+    matches = rng.integers(5, 39, n)
+    players = pd.DataFrame({
+        'Player': [f'Player {i}' for i in range(n)],
+        'League': [f'League {i}' for i in rng.integers(0, 6, n)],
+        'Team': [f'Team {i}' for i in rng.integers(0, 120, n)],
+        'Position': np.array(POSITIONS)[position],
+        'Season': '2026/27',
+        'Age': rng.integers(17, 38, n),
+        'Matches': matches,
+        'Minutes': matches * rng.integers(45, 91, n),
+        'Goals': rng.poisson(attack * matches / 10),
+        'Assists': rng.poisson(attack * matches / 15),
+        'Tackles_per_90': np.clip(rng.normal(np.array([0.1, 2.2, 2.0, 0.7])[position], 0.5), 0, None)
+    })
+    # Player 0's twin under another name
+    twin = players.iloc[[0]].assign(Player='Twin', Team='Elsewhere')
+    return PlayerStore(pd.concat([players, twin], ignore_index=True))
+
+
+def test_identical_profile_is_the_nearest_neighbour(store):
+    similar = SimilarityIndex(store).most_similar('Player 0', k=5)
+    assert similar.loc[0, 'Player'] == 'Twin'
+    assert similar.loc[0, 'Similarity'] == 100.0
+    assert 'Player 0' not in similar['Player'].tolist()
+    assert similar['Similarity'].is_monotonic_decreasing
+
+
+def test_filters_are_applied_before_ranking(store):
+    similar = SimilarityIndex(store).search(0, k=10, position='Defender', max_age=25)
+    assert len(similar) == 10
+    assert (similar['Position'] == 'Defender').all()
+    assert (similar['Age'] <= 25).all()
+    with pytest.raises(KeyError):
+        SimilarityIndex(store).most_similar('Nobody')
+
+
+def test_ivf_recall_against_exact_search(store):
+    exact = SimilarityIndex(store)
+    ivf = SimilarityIndex(store, backend='ivf', n_lists=32, n_probe=4)
+    rows = np.random.default_rng(1).choice(len(store), size=40, replace=False)
+    recall = np.mean([
+        len(set(exact.search(int(row))['Player']) & set(ivf.search(int(row))['Player'])) / 10
+        for row in rows
+    ])
+    assert recall >= 0.9
+
+
+def test_ivf_keeps_probing_under_selective_filters(store):
+    ivf = SimilarityIndex(store, backend='ivf', n_lists=64, n_probe=1)
+    similar = ivf.search(0, k=10, league='League 3', position='Goalkeeper')
+    assert len(similar) == 10
+    assert (similar['League'] == 'League 3').all()
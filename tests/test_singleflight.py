@@ -0,0 +1,99 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_fetcher import SampleDataSource, SoccerDataFetcher
+from singleflight import SingleFlight
+
+
+def _concurrently(n, fn):
+    results, threads = [None] * n, []
+    barrier = threading.Barrier(n)
+
+    def run(i):
+        barrier.wait()
+        try:
+            results[i] = fn()
+        except Exception as exc:
+            results[i] = exc
+
+    for i in range(n):
+        threads.append(threading.Thread(target=run, args=(i,)))
+        threads[-1].start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.1)
+        return 'value'
+
+    assert _concurrently(8, lambda: flight.do('key', load)) == ['value'] * 8
+    assert len(calls) == 1
+    assert flight.stats() == {'executions': 1, 'deduplicated': 7, 'in_flight': 0}
+
+
+def test_errors_reach_every_waiter_and_release_the_key():
+    flight = SingleFlight()
+
+    def fail():
+        time.sleep(0.1)
+        raise RuntimeError('upstream down')
+
+    results = _concurrently(4, lambda: flight.do('key', fail))
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flight.do('key', lambda: 'recovered') == 'recovered'
+
+
+def test_async_and_threaded_callers_coalesce():
+    flight = SingleFlight()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return 42
+
+    async def main():
+        return await asyncio.gather(*(flight.do_async('key', load) for _ in range(5)))
+
+    assert asyncio.run(main()) == [42] * 5
+    assert len(calls) == 1
+
+
+class _SlowSource(SampleDataSource):
+    def __init__(self):
+        super().__init__()
+        self.loads = 0
+
+    def load_league_standings(self, league_id, season=None):
+        self.loads += 1
+        time.sleep(0.1)
+        return super().load_league_standings(league_id, season)
+
+
+def test_fetcher_misses_coalesce_into_one_load():
+    source = _SlowSource()
+    fetcher = SoccerDataFetcher(source)
+    tables = _concurrently(6, lambda: fetcher.fetch_league_standings('39'))
+    assert source.loads == 1
+    assert all(len(table) == 20 for table in tables)
+
+
+def test_batch_fetches_load_each_league_once():
+    source = _SlowSource()
+    fetcher = SoccerDataFetcher(source)
+    batches = _concurrently(6, lambda: fetcher.fetch_all_league_standings(['39', '140']))
+    assert source.loads == 2
+    assert all(sorted(batch) == ['140', '39'] for batch in batches)
+    assert fetcher.coalescing_stats()['in_flight'] == 0
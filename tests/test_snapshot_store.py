@@ -0,0 +1,77 @@
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import pytest
+
+from snapshot_store import SnapshotStore
+
+
+def _table(points=3):
+    return pd.DataFrame({'Team': ['Arsenal', 'Chelsea'], 'Points': [points, 1]})
+
+
+def test_round_trip_keeps_frame_and_metadata(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    store.write('standings', _table(), '39', '2026', metadata={'source': 'test'}, fetched_at=1000.0)
+
+    df, metadata, fetched_at = store.latest('standings', '39', '2026')
+    pd.testing.assert_frame_equal(df, _table())
+    assert metadata == {'source': 'test'}
+    assert fetched_at == 1000.0
+    assert store.latest('standings', '140', '2026') is None
+
+
+def test_old_snapshots_are_pruned(tmp_path):
+    store = SnapshotStore(str(tmp_path), keep=2)
+    for i in range(4):
+        path = store.write('standings', _table(i), '39', '2026', fetched_at=1000.0 + i)
+    assert sorted(os.listdir(os.path.dirname(path))) == ['1002000.arrow', '1003000.arrow']
+    assert store.latest('standings', '39', '2026')[0]['Points'][0] == 3
+
+
+def test_fresh_snapshots_skip_the_loader(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    store.write('standings', _table(), '39', '2026')
+
+    def loader():
+        raise AssertionError("a fresh snapshot shouldn't be reloaded")
+
+    df, _ = store.get('standings', '39', '2026', loader, max_age=60)
+    assert df['Points'][0] == 3
+
+
+def test_stale_snapshot_is_served_while_refreshing(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    store.write('standings', _table(3), '39', '2026', fetched_at=time.time() - 120)
+    refreshed = threading.Event()
+
+    def loader():
+        refreshed.set()
+        return _table(6), {}
+
+    df, _ = store.get('standings', '39', '2026', loader, max_age=60)
+    assert df['Points'][0] == 3
+    assert refreshed.wait(5)
+    deadline = time.time() + 5
+    while store.latest('standings', '39', '2026')[0]['Points'][0] != 6:
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+def test_failed_load_falls_back_to_an_expired_snapshot(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    store.write('standings', _table(), '39', '2026', fetched_at=time.time() - 30 * 86400)
+
+    def loader():
+        raise ConnectionError("upstream down")
+
+    df, _ = store.get('standings', '39', '2026', loader, max_age=60)
+    assert df['Points'][0] == 3
+    with pytest.raises(ConnectionError):
+        store.get('standings', '140', '2026', loader, max_age=60)
+    assert store.stats()['refresh_errors'] == 2
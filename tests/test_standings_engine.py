@@ -0,0 +1,73 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import pytest
+
+from standings_engine import StandingsEngine
+
+
+def test_removing_unapplied_result_leaves_table_intact():
+    engine = StandingsEngine(['Arsenal', 'Chelsea', 'Fulham'])
+    engine.apply_result('Arsenal', 'Chelsea', 2, 0, 1)
+    before = engine.table()
+
+    with pytest.raises(ValueError):
+        engine.remove_result('Arsenal', 'Fulham', 1, 0, 1)
+    with pytest.raises(ValueError):
+        engine.remove_result('Arsenal', 'Chelsea', 2, 0, 5)
+    assert engine.table().equals(before)
+    assert engine.matchweeks == 1
+
+
+def _results():
+    # Arsenal, Brentford and Everton finish level on four points
+    return pd.DataFrame({
+        'Matchweek': [1, 2, 2, 3, 3],
+        'Home_Team': ['Brentford', 'Arsenal', 'Brentford', 'Arsenal', 'Everton'],
+        'Away_Team': ['Arsenal', 'Chelsea', 'Chelsea', 'Everton', 'Brentford'],
+        'Home_Goals': [1, 4, 0, 1, 1],
+        'Away_Goals': [0, 0, 0, 1, 0]
+    })
+
+
+def test_goal_difference_leagues_rank_ties_by_goal_difference():
+    table = StandingsEngine.from_results(_results(), league_id='39').table()
+    assert table['Team'].tolist() == ['Arsenal', 'Everton', 'Brentford', 'Chelsea']
+    assert table['Points'].tolist() == [4, 4, 4, 1]
+
+
+def test_head_to_head_leagues_rank_ties_by_their_mini_league():
+    # Among the three: Everton 4 points, Brentford 3, Arsenal 1
+    table = StandingsEngine.from_results(_results(), league_id='140').table()
+    assert table['Team'].tolist() == ['Everton', 'Brentford', 'Arsenal', 'Chelsea']
+
+
+def test_positions_follow_the_table():
+    engine = StandingsEngine.from_results(_results(), league_id='140')
+    table = engine.table()
+    positions = dict(zip(engine.teams, engine.positions()))
+    assert all(positions[team] == position for team, position in zip(table['Team'], table['Position']))
+
+
+def test_as_of_matches_a_table_built_from_earlier_weeks():
+    results = _results()
+    engine = StandingsEngine.from_results(results, league_id='140')
+    for week in (1, 2):
+        earlier = StandingsEngine.from_results(results[results['Matchweek'] <= week], league_id='140',
+                                               teams=engine.teams)
+        pd.testing.assert_frame_equal(engine.as_of(week), earlier.table())
+        assert (engine.points_as_of(week) == earlier.points_as_of(week)).all()
+
+
+def test_applying_and_removing_a_result_round_trips():
+    engine = StandingsEngine.from_results(_results())
+    before = engine.table()
+    engine.apply_result('Chelsea', 'Everton', 3, 0, 4)
+    assert engine.table().loc[lambda t: t['Team'] == 'Chelsea', 'Points'].item() == 4
+    engine.remove_result('Chelsea', 'Everton', 3, 0, 4)
+    pd.testing.assert_frame_equal(engine.table(), before)
+    with pytest.raises(KeyError):
+        engine.apply_result('Arsenal', 'Real Madrid', 1, 0, 4)
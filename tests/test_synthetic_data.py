@@ -0,0 +1,19 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic_data import SyntheticDataSource, SyntheticLeagueGenerator
+
+
+def test_unplayed_season_has_no_results():
+    generator = SyntheticLeagueGenerator(teams=20, weeks_played=0, leagues={'39': 'Premier League'})
+    season = generator.season
+    assert list(generator.iter_results('39', season)) == []
+    assert sum(len(chunk) for chunk in generator.iter_fixtures('39', season)) == 380
+    assert list(generator.iter_matches('39', season, 5, 4)) == []
+
+    source = SyntheticDataSource(generator)
+    assert source.load_results('39').empty
+    assert (source.load_league_standings('39')['Played'] == 0).all()
+
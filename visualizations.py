@@ -1,3 +1,8 @@
+import functools
+import hashlib
+import inspect
+import json
+
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -5,12 +10,54 @@ import pandas as pd
 import numpy as np
 import streamlit as st
 
+from cache import TTLCache, frame_fingerprint
+from instrumentation import tracer
+
+
+def _fingerprint(value) -> str:
+    """Cheap content hash of a figure-builder argument"""
+    if isinstance(value, pd.DataFrame):
+        return frame_fingerprint(value)
+    if isinstance(value, pd.Series):
+        return frame_fingerprint(value.to_frame())
+    encoded = json.dumps(value, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def memoized_figure(method):
+    """
+    Cache a figure builder's output by the content of its arguments.
+
+    Figures are stored as serialized JSON and rebuilt without re-validation
+    on a hit, so every caller gets its own mutable figure.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    @tracer.traced(f'figure.{method.__name__}')
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__,) + tuple(
+            (name, _fingerprint(value)) for name, value in bound.arguments.items() if name != 'self'
+        )
+        spec = self._figures.get(key)
+        if spec is None:
+            spec = method(self, *args, **kwargs).to_json()
+            self._figures.put(key, spec)
+        # The spec came from a validated figure, so skipping validation is safe
+        # and an order of magnitude cheaper than building the figure again
+        return go.Figure(json.loads(spec), _validate=False)
+
+    return wrapper
+
+
 class SoccerVisualizations:
     """
     Custom visualization functions for soccer statistics
     """
     
-    def __init__(self):
+    def __init__(self, cache_size: int = 256):
         self.color_palette = [
             '#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', 
             '#FFEAA7', '#DDA0DD', '#98D8C8', '#F7DC6F'
@@ -25,7 +72,19 @@ class SoccerVisualizations:
             'Newcastle': '#241F20',
             'Brighton': '#0057B8'
         }
+        # Serialized figures keyed by builder and input content; the module
+        # instance is shared by every session, so is this cache
+        self._figures = TTLCache(maxsize=cache_size, ttl=None)
     
+    def figure_cache_stats(self) -> dict:
+        """Hit/miss counters of the figure cache"""
+        return self._figures.stats()
+    
+    def clear_figure_cache(self):
+        """Drop every cached figure"""
+        self._figures.clear()
+    
+    @memoized_figure
     def create_league_table_chart(self, df: pd.DataFrame) -> go.Figure:
         """
         Create an interactive league standings visualization
@@ -56,6 +115,7 @@ class SoccerVisualizations:
         
         return fig
     
+    @memoized_figure
     def create_goals_comparison(self, df: pd.DataFrame) -> go.Figure:
         """
         Create goals for vs goals against comparison
@@ -90,38 +150,29 @@ class SoccerVisualizations:
         
         return fig
     
-    def create_player_comparison_radar(self, df: pd.DataFrame, players: list) -> go.Figure:
+    @memoized_figure
+    def create_player_comparison_radar(self, percentiles: pd.DataFrame, players: list) -> go.Figure:
         """
-        Create radar chart comparing players
+        Create radar chart comparing players on peer-group percentile ranks
         """
         if len(players) == 0:
             return go.Figure()
         
-        # Select metrics for radar chart
-        metrics = ['Goals', 'Assists', 'Goals per 90', 'Shots per Game', 'Pass Accuracy %']
+        # Percentiles are precomputed (0-100), so each trace is a row lookup
+        metrics = [column for column in percentiles.columns if column != 'Player']
+        labels = [metric.replace('_', ' ') for metric in metrics]
+        rows = percentiles.drop_duplicates('Player').set_index('Player')
         
         fig = go.Figure()
         
         for i, player in enumerate(players):
-            player_data = df[df['Player'] == player].iloc[0]
-            
-            # Normalize values for radar chart (0-100 scale)
-            values = []
-            for metric in metrics:
-                if metric == 'Pass Accuracy %':
-                    values.append(player_data[metric])
-                elif metric == 'Goals per 90':
-                    values.append(min(player_data[metric] * 50, 100))  # Scale to 0-100
-                else:
-                    max_val = df[metric].max()
-                    values.append((player_data[metric] / max_val) * 100)
-            
             fig.add_trace(go.Scatterpolar(
-                r=values,
-                theta=metrics,
+                r=rows.loc[player, metrics].tolist(),
+                theta=labels,
                 fill='toself',
                 name=player,
-                line_color=self.color_palette[i % len(self.color_palette)]
+                line_color=self.color_palette[i % len(self.color_palette)],
+                hovertemplate='%{theta}: %{r:.0f}th percentile<extra>%{fullData.name}</extra>'
             ))
         
         fig.update_layout(
@@ -131,12 +182,69 @@ class SoccerVisualizations:
                     range=[0, 100]
                 )),
             showlegend=True,
-            title='Player Comparison - Key Metrics',
+            title='Player Comparison - Peer Percentiles',
             height=600
         )
         
         return fig
     
+    @memoized_figure
+    def create_team_comparison(self, team_df: pd.DataFrame, teams: list, metrics: list) -> go.Figure:
+        """
+        Create one faceted figure comparing teams on several metrics,
+        with the league average of each metric for context
+        """
+        compared = team_df.set_index('Team').loc[teams, metrics]
+        league_avg = team_df[metrics].mean()
+        colors = [self.team_colors.get(team, self.color_palette[i % len(self.color_palette)])
+                  for i, team in enumerate(teams)]
+        
+        n_cols = 2 if len(metrics) > 1 else 1
+        n_rows = -(-len(metrics) // n_cols)
+        fig = make_subplots(rows=n_rows, cols=n_cols, subplot_titles=metrics,
+                            vertical_spacing=0.25 / n_rows, horizontal_spacing=0.08)
+        shapes, annotations = [], []
+        
+        for i, metric in enumerate(metrics):
+            row, col = i // n_cols + 1, i % n_cols + 1
+            average = league_avg[metric]
+            vs_average = (compared[metric] / average - 1) * 100 if average else compared[metric] * 0
+            fig.add_trace(go.Bar(
+                x=teams,
+                y=compared[metric],
+                marker_color=colors,
+                text=compared[metric].round(1),
+                textposition='outside',
+                customdata=vs_average.round(0),
+                hovertemplate=f'<b>%{{x}}</b><br>{metric}: %{{y}}<br>vs league avg: %{{customdata:+.0f}}%<extra></extra>',
+                showlegend=False
+            ), row=row, col=col)
+            # League average as a dashed line across the subplot (batched
+            # into one layout update; add_hline per subplot is slow)
+            axis = '' if i == 0 else str(i + 1)
+            shapes.append(dict(
+                type='line', xref=f'x{axis} domain', yref=f'y{axis}', x0=0, x1=1,
+                y0=average, y1=average, line=dict(color='#7F8C8D', dash='dash')
+            ))
+            annotations.append(dict(
+                xref=f'x{axis} domain', yref=f'y{axis}', x=0, y=average, xanchor='left',
+                yanchor='bottom', text=f'League avg {average:.1f}', showarrow=False,
+                font=dict(size=10, color='#7F8C8D')
+            ))
+        
+        fig.update_yaxes(rangemode='tozero')
+        fig.update_layout(
+            shapes=shapes,
+            annotations=list(fig.layout.annotations) + annotations,
+            title='Key Metrics Comparison',
+            height=320 * n_rows + 80,
+            template='plotly_white',
+            bargap=0.35
+        )
+        
+        return fig
+    
+    @memoized_figure
     def create_team_performance_timeline(self, team_data: dict) -> go.Figure:
         """
         Create timeline showing team performance over seasons
@@ -203,6 +311,7 @@ class SoccerVisualizations:
         
         return fig
     
+    @memoized_figure
     def create_prediction_probability_chart(self, predictions: dict) -> go.Figure:
         """
         Create match prediction probability visualization
@@ -234,6 +343,7 @@ class SoccerVisualizations:
         
         return fig
     
+    @memoized_figure
     def create_top_scorers_chart(self, df: pd.DataFrame, top_n: int = 10) -> go.Figure:
         """
         Create top scorers visualization
@@ -263,6 +373,7 @@ class SoccerVisualizations:
         
         return fig
     
+    @memoized_figure
     def create_form_guide(self, team_results: list) -> go.Figure:
         """
         Create team form guide visualization
@@ -281,7 +392,7 @@ class SoccerVisualizations:
             y=results,
             marker_color=result_colors,
             text=team_results,
-            textposition='middle',
+            textposition='inside',
             hovertemplate='Match %{x}<br>Result: %{text}<extra></extra>'
         ))
         